@@ -0,0 +1,97 @@
+import random
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Optional
+
+from src.domain.entities.game import Game
+from src.domain.value_objects.position import Position
+
+_CELLS = [Position.at(x, y) for y in range(1, 4) for x in range(1, 4)]  # Row-major, like Board.grid
+_LINES = [(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)]
+
+
+def _cells(game: Game) -> tuple[Optional[str], ...]:
+    return tuple(cell.value if cell else None for row in game.board.grid for cell in row)
+
+
+def _winning_cell(cells: tuple, player: str) -> Optional[int]:
+    """A cell completing a line for `player`, if any."""
+    for line in _LINES:
+        values = [cells[i] for i in line]
+        if values.count(player) == 2 and values.count(None) == 1:
+            return line[values.index(None)]
+    return None
+
+
+class Bot(ABC):
+    """A tournament player strategy. Bots are stateless: all randomness comes from `rng`."""
+    name: str
+
+    @abstractmethod
+    def choose_move(self, game: Game, rng: random.Random) -> Position:
+        """Pick an empty cell for `game.next_player`."""
+        pass
+
+
+class RandomBot(Bot):
+    name = "random"
+
+    def choose_move(self, game: Game, rng: random.Random) -> Position:
+        cells = _cells(game)
+        return _CELLS[rng.choice([i for i, cell in enumerate(cells) if cell is None])]
+
+
+class GreedyBot(Bot):
+    """Completes a line when it can, blocks the opponent's otherwise, else prefers the center."""
+    name = "greedy"
+
+    def choose_move(self, game: Game, rng: random.Random) -> Position:
+        cells = _cells(game)
+        me = game.next_player.value
+        for player in (me, game.next_player.opponent().value):
+            cell = _winning_cell(cells, player)
+            if cell is not None:
+                return _CELLS[cell]
+        if cells[4] is None:
+            return _CELLS[4]
+        return _CELLS[rng.choice([i for i, cell in enumerate(cells) if cell is None])]
+
+
+def _move_score(cells: tuple, i: int, player: str) -> int:
+    """Score of `player` marking cell `i` under perfect play afterwards: 1 win, 0 draw, -1 loss."""
+    after = cells[:i] + (player,) + cells[i + 1:]
+    if any(all(after[j] == player for j in line) for line in _LINES):
+        return 1
+    if None not in after:
+        return 0
+    return -_best_score(after, "O" if player == "X" else "X")
+
+
+@lru_cache(maxsize=None)
+def _best_score(cells: tuple, player: str) -> int:
+    """Score of the position for `player` to move under perfect play."""
+    if _winning_cell(cells, player) is not None:
+        return 1
+    return max(_move_score(cells, i, player) for i, cell in enumerate(cells) if cell is None)
+
+
+class MinimaxBot(Bot):
+    """Perfect player, picking randomly among equally good moves."""
+    name = "minimax"
+
+    def choose_move(self, game: Game, rng: random.Random) -> Position:
+        cells = _cells(game)
+        me = game.next_player.value
+        scores = {i: _move_score(cells, i, me) for i, cell in enumerate(cells) if cell is None}
+        best = max(scores.values())
+        return _CELLS[rng.choice([i for i, score in scores.items() if score == best])]
+
+
+BOTS: dict[str, type[Bot]] = {bot.name: bot for bot in (RandomBot, GreedyBot, MinimaxBot)}
+
+
+def get_bot(name: str) -> Bot:
+    try:
+        return BOTS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown bot '{name}', available: {', '.join(BOTS)}") from None
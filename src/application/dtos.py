@@ -6,6 +6,12 @@ class MoveResult:
     success: bool
     message: Optional[str] = None
     error: Optional[str] = None
+    version: Optional[int] = None  # Game version after an accepted move
+    replayed: bool = False  # Result of an earlier request with the same idempotency key
+    # Game state after an accepted move
+    next_player: Optional[str] = None
+    winner: Optional[str] = None
+    is_finished: bool = False
 
 @dataclass
 class GameStatus:
@@ -14,3 +20,26 @@ class GameStatus:
     next_player: Optional[str]
     winner: Optional[str]
     is_finished: bool
+    version: int = 0
+
+@dataclass
+class OpeningStatsResult:
+    square: str
+    finished_games: int
+    x_wins: int
+    o_wins: int
+    draws: int
+    x_win_rate: float
+    o_win_rate: float
+    draw_rate: float
+
+@dataclass
+class GameStatsResult:
+    total_games: int
+    active_games: int
+    finished_games: int
+    x_wins: int
+    o_wins: int
+    draws: int
+    abandoned_games: int
+    first_move_win_rates: List[OpeningStatsResult]
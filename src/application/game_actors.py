@@ -0,0 +1,327 @@
+import asyncio
+import contextvars
+import copy
+import uuid
+from contextlib import AbstractContextManager
+from typing import Callable, Optional, TypeVar
+
+from src.domain.entities.game import Game
+from src.domain.entities.game_stats import GameStats
+from src.domain.entities.idempotent_move import IdempotentMove
+from src.domain.repositories.game_repository import GameRepository
+from src.domain.repositories.game_stats_repository import GameStatsRepository
+from src.domain.repositories.idempotency_repository import IdempotencyRepository
+from src.application.dtos import MoveResult
+from src.application.game_service import GameService
+from src.application.idempotency_cache import IdempotencyCache
+from src.application.status_cache import StatusPayloadCache
+from src.infrastructure.logging.logger import logger
+
+T = TypeVar("T")
+
+# Opens a GameService on fresh (short-lived) sessions, closing them on exit
+ServiceFactory = Callable[[], AbstractContextManager[GameService]]
+
+# Stats updates recorded by an actor, replayed on the stats repository when its game is persisted
+CREATED, FINISHED = "created", "finished"
+
+
+class GameBusy(Exception):
+    pass
+
+
+class GameActor:
+    """
+    Owner of one active game: holds the `Game` in memory and handles the requests
+    sent to its mailbox one at a time, in order, on the event loop. No lock and
+    no database read are needed once the game (with its idempotency keys) is loaded.
+
+    Requests run through a GameService wired to in-memory repositories, so the
+    game rules and results are exactly those of the regular endpoints. Accepted
+    moves are written behind: the latest state, its stats updates and its
+    idempotency keys are persisted together in the background, coalescing the
+    moves made while the previous write was in flight.
+    """
+
+    def __init__(self, system: "GameActorSystem", game_id: str, game: Optional[Game] = None):
+        self.system = system
+        self.game_id = game_id
+        self.game = game
+        self.loaded = game is not None
+        self.mailbox: asyncio.Queue = asyncio.Queue(system.mailbox_size)
+        self.service = GameService(
+            _ActorGameRepository(self), _ActorStatsRepository(self), system.status_cache,
+            _ActorIdempotencyRepository(self), system.idempotency_cache,
+        )
+        self.dirty = False
+        self.pending_stats: list[tuple[str, Game]] = []
+        self.pending_keys: list[IdempotentMove] = []
+        self.keys: dict[str, IdempotentMove] = {}
+        self._flushing: Optional[asyncio.Task] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def tell(self, handler: Callable[[GameService], T]) -> asyncio.Future:
+        """
+        Queue `handler` to run on the actor's GameService, in the caller's context
+        (request ID, current span). Raises GameBusy when the mailbox is full.
+        """
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.mailbox.put_nowait((handler, contextvars.copy_context(), future))
+        except asyncio.QueueFull:
+            raise GameBusy(f"Too many requests waiting for game {self.game_id}") from None
+        return future
+
+    async def run(self) -> None:
+        try:
+            while True:
+                try:
+                    handler, context, future = await asyncio.wait_for(self.mailbox.get(), self.system.idle_seconds)
+                except asyncio.TimeoutError:
+                    await self.flush()
+                    if self.mailbox.empty():  # Nothing arrived while flushing: evict
+                        return
+                    continue
+                if not self.loaded:
+                    try:
+                        self.game, keys = await asyncio.to_thread(self.system.load, self.game_id)
+                        for move in keys:
+                            self.keys.setdefault(move.key, move)
+                        self.loaded = True
+                    except Exception as e:
+                        logger.error(f"Failed to load game {self.game_id} into its actor: {e}", exc_info=True)
+                        if not future.cancelled():
+                            future.set_exception(e)
+                        continue
+                if not future.cancelled():
+                    try:
+                        future.set_result(context.run(handler, self.service))
+                    except Exception as e:
+                        future.set_exception(e)
+                self.schedule_flush()
+                if self.game is None and self.mailbox.empty():
+                    return  # Unknown game: do not keep an actor for it
+        finally:
+            self.system.remove(self)
+
+    async def flush(self) -> None:
+        """Wait until every accepted move is persisted."""
+        self.schedule_flush()
+        if self._flushing is not None:
+            await self._flushing
+
+    def schedule_flush(self) -> None:
+        if self.dirty and (self._flushing is None or self._flushing.done()):
+            self._flushing = asyncio.create_task(self._write_behind())
+
+    async def _write_behind(self) -> None:
+        failures = 0
+        while self.dirty:
+            self.dirty = False
+            game = copy.deepcopy(self.game)
+            stats, self.pending_stats = self.pending_stats, []
+            keys, self.pending_keys = self.pending_keys, []
+            try:
+                await asyncio.to_thread(self.system.persist, game, stats, keys)
+                failures = 0
+            except Exception as e:
+                failures += 1
+                self.pending_stats = stats + self.pending_stats
+                self.pending_keys = keys + self.pending_keys
+                self.dirty = True
+                if failures > self.system.write_retries:
+                    self._drop_unpersisted(e)
+                    return
+                logger.error(f"Failed to persist game {self.game_id}, retrying: {e}", exc_info=True)
+                await asyncio.sleep(self.system.retry_seconds)
+
+    def _drop_unpersisted(self, error: Exception) -> None:
+        """
+        Give up on the writes that kept failing: the moves accepted since the last
+        persisted state are lost, and the game is reloaded from the database on its
+        next request so the actor does not build on them.
+        """
+        logger.error(
+            f"Dropping the unpersisted state of game {self.game_id} after {self.system.write_retries + 1} "
+            f"failed writes ({len(self.pending_stats)} stats updates, {len(self.pending_keys)} idempotency keys): "
+            f"{error}",
+            exc_info=error,
+        )
+        self.system.dropped_writes += 1
+        self.dirty = False
+        self.pending_stats, self.pending_keys = [], []
+        self.keys.clear()
+        self.game, self.loaded = None, False
+
+
+class GameActorSystem:
+    """
+    Registry of the game actors of this process. Actors are spawned on the first
+    request for their game, load it from the repository, and are evicted after
+    `idle_seconds` without requests (once their writes are persisted).
+
+    Every game must be served by a single process (one worker, or requests routed
+    by game ID), since an actor does not see moves made through another process.
+
+    A failed write is retried `write_retries` times, `retry_seconds` apart; after
+    that the actor drops its unpersisted state (counted in `dropped_writes`) and
+    reloads the game from the database.
+    """
+
+    def __init__(self, service_factory: ServiceFactory, status_cache: Optional[StatusPayloadCache] = None,
+                 idempotency_cache: Optional[IdempotencyCache] = None, idle_seconds: float = 60,
+                 mailbox_size: int = 1000, max_actors: int = 100_000, retry_seconds: float = 1,
+                 write_retries: int = 5, stop_timeout: float = 10):
+        self.service_factory = service_factory
+        self.status_cache = status_cache
+        self.idempotency_cache = idempotency_cache
+        self.idle_seconds = idle_seconds
+        self.mailbox_size = mailbox_size
+        self.max_actors = max_actors
+        self.retry_seconds = retry_seconds
+        self.write_retries = write_retries
+        self.stop_timeout = stop_timeout
+        self.dropped_writes = 0
+        self._actors: dict[str, GameActor] = {}
+
+    def __len__(self) -> int:
+        return len(self._actors)
+
+    async def create_game(self) -> str:
+        """
+        Create a game owned by a new actor. It is persisted before it is returned: its
+        moves are then only ever updates, which never bring back a purged game.
+        """
+        game = Game(str(uuid.uuid4()))
+        await asyncio.to_thread(self.persist, game, [(CREATED, game)], [])
+        self._spawn(game.game_id, game)
+        logger.info(f"Game created by its actor: {game.game_id}")
+        return game.game_id
+
+    async def ask(self, game_id: str, handler: Callable[[GameService], T]) -> T:
+        """Run `handler` on the GameService of the game's actor, after the requests queued before it."""
+        actor = self._actors.get(game_id) or self._spawn(game_id)
+        return await actor.tell(handler)
+
+    async def play_move(self, game_id: str, player_id: str, x: int, y: int,
+                        idempotency_key: Optional[str] = None) -> MoveResult:
+        return await self.ask(
+            game_id, lambda service: service.play_move(game_id, player_id, x, y, idempotency_key)
+        )
+
+    async def stop(self) -> None:
+        """Persist the pending writes of every actor (for up to `stop_timeout` seconds) and stop them."""
+        actors = list(self._actors.values())
+        flushes = [asyncio.ensure_future(actor.flush()) for actor in actors]
+        if flushes:
+            _, unfinished = await asyncio.wait(flushes, timeout=self.stop_timeout)
+            for flush in unfinished:
+                flush.cancel()
+            if unfinished:
+                logger.error(f"Stopping {len(unfinished)} game actors with writes still not persisted "
+                             f"after {self.stop_timeout}s")
+        for actor in actors:
+            actor.task.cancel()
+        logger.info(f"Stopped {len(actors)} game actors.")
+
+    def remove(self, actor: GameActor) -> None:
+        if self._actors.get(actor.game_id) is actor:
+            del self._actors[actor.game_id]
+
+    def load(self, game_id: str) -> tuple[Optional[Game], list[IdempotentMove]]:
+        """Read a game and the moves stored under its idempotency keys, in one session."""
+        with self.service_factory() as service:
+            game = service.repo.get(game_id)
+            if game is None or service.idempotency_repo is None:
+                return game, []
+            return game, service.idempotency_repo.list_for_game(game_id)
+
+    def persist(self, game: Game, stats: list[tuple[str, Game]], keys: list[IdempotentMove]) -> None:
+        """Write a game with its stats updates and idempotency keys in one transaction."""
+        with self.service_factory() as service:
+            if service.stats_repo is not None:
+                for event, snapshot in stats:
+                    if event == CREATED:
+                        service.stats_repo.record_game_created(snapshot)
+                    else:
+                        service.stats_repo.record_game_finished(snapshot)
+            if service.idempotency_repo is not None:
+                for move in keys:
+                    service.idempotency_repo.add(move)
+            service.repo.add(game)
+
+    def _spawn(self, game_id: str, game: Optional[Game] = None) -> GameActor:
+        if len(self._actors) >= self.max_actors:
+            raise GameBusy("Too many active games in this process")
+        actor = self._actors[game_id] = GameActor(self, game_id, game)
+        actor.task = asyncio.get_running_loop().create_task(actor.run(), name=f"game-actor-{game_id}")
+        return actor
+
+
+class _ActorGameRepository(GameRepository):
+    """
+    The actor's game, held in memory. Writes mark it for write-behind.
+    Listing is not about the actor's game: it goes to the durable game repository.
+    """
+
+    def __init__(self, actor: GameActor):
+        self.actor = actor
+
+    def add(self, game: Game):
+        self.actor.game = game
+        self.actor.dirty = True
+
+    def get(self, game_id: str) -> Optional[Game]:
+        return self.actor.game
+
+    def list_game_ids(self, limit: int, after: Optional[str] = None) -> list[str]:
+        with self.actor.system.service_factory() as service:
+            return service.repo.list_game_ids(limit, after)
+
+
+class _ActorStatsRepository(GameStatsRepository):
+    """
+    Records the stats updates of the actor's game, replayed when it is persisted.
+    Other operations are not about the actor's game: they go to the durable stats repository.
+    """
+
+    def __init__(self, actor: GameActor):
+        self.actor = actor
+
+    def record_game_created(self, game: Game) -> None:
+        self.actor.pending_stats.append((CREATED, game))
+
+    def record_game_finished(self, game: Game) -> None:
+        self.actor.pending_stats.append((FINISHED, copy.deepcopy(game)))
+
+    def record_games_abandoned(self, count: int) -> None:
+        with self.actor.system.service_factory() as service:
+            service.stats_repo.record_games_abandoned(count)
+
+    def get(self) -> GameStats:
+        with self.actor.system.service_factory() as service:
+            return service.stats_repo.get()
+
+    def rebuild(self) -> GameStats:
+        with self.actor.system.service_factory() as service:
+            return service.stats_repo.rebuild()
+
+
+class _ActorIdempotencyRepository(IdempotencyRepository):
+    """
+    Idempotency keys used on the actor's game, persisted with the game. Keys stored
+    before the actor was loaded are read along with the game, so an unknown key is a new one.
+    """
+
+    def __init__(self, actor: GameActor):
+        self.actor = actor
+
+    def get(self, game_id: str, key: str) -> Optional[IdempotentMove]:
+        return self.actor.keys.get(key)
+
+    def list_for_game(self, game_id: str) -> list[IdempotentMove]:
+        return list(self.actor.keys.values())
+
+    def add(self, move: IdempotentMove) -> None:
+        self.actor.keys[move.key] = move
+        self.actor.pending_keys.append(move)
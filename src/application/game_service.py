@@ -1,88 +1,249 @@
 import uuid
-from typing import Optional
+from typing import Callable, List, Optional
 
 from src.domain.entities.game import Game
 from src.domain.repositories.game_repository import GameRepository
+from src.domain.repositories.game_stats_repository import GameStatsRepository
+from src.domain.repositories.idempotency_repository import IdempotencyRepository
+from src.domain.entities.idempotent_move import IdempotentMove
+from src.domain.exceptions import WriteConflict
 from src.domain.value_objects.player import Player
 from src.domain.value_objects.position import Position
-from src.domain.exceptions import InvalidMove, GameFinished, InvalidPlayer
-from src.application.dtos import MoveResult, GameStatus
+from src.domain.value_objects.move_outcome import MoveOutcome
+from src.application.dtos import MoveResult, GameStatus, GameStatsResult, OpeningStatsResult
+from src.application.status_cache import StatusPayloadCache
+from src.application.idempotency_cache import IdempotencyCache
 from src.infrastructure.logging.logger import logger
+from src.infrastructure.tracing.spans import span, traced
 
 
 class GameService:
-    def __init__(self, repo: GameRepository):
-        """Initialize GameService with a repository and DB session."""
+    def __init__(self, repo: GameRepository, stats_repo: Optional[GameStatsRepository] = None,
+                 status_cache: Optional[StatusPayloadCache] = None,
+                 idempotency_repo: Optional[IdempotencyRepository] = None,
+                 idempotency_cache: Optional[IdempotencyCache] = None):
+        """Initialize GameService with a repository and its optional stats repository, status payload cache,
+        and idempotency key repository and cache (moves sent with a key need the repository).
+        """
         self.repo = repo
+        self.stats_repo = stats_repo
+        self.status_cache = status_cache
+        self.idempotency_repo = idempotency_repo
+        self.idempotency_cache = idempotency_cache
 
+    @traced("service.create_game")
     def create_game(self) -> str:
         """Create a new game, persist it, and return its unique ID."""
         game_id = str(uuid.uuid4()) # UUID to ensure unique game IDs
         game = Game(game_id)
+        if self.stats_repo:
+            self.stats_repo.record_game_created(game)  # Committed together with the game
         self.repo.add(game)
         logger.info(f"Game created successfully: {game_id}")
         return game_id
 
-    def play_move(self, game_id: str, player_id: str, x: int, y: int) -> MoveResult:
+    @traced("service.play_move")
+    def play_move(self, game_id: str, player_id: str, x: int, y: int,
+                  idempotency_key: Optional[str] = None) -> MoveResult:
         """Attempt a move for a given player at position (x, y) in the specified game.
         Returns a MoveResult indicating success, error, or game state message.
+        With an `idempotency_key`, a retry of an accepted move returns the original
+        result (flagged as `replayed`) without reading the game again.
         """
         logger.debug(f"Attempting move: game_id={game_id}, player_id={player_id}, x={x}, y={y}")
+        if idempotency_key is not None and self.idempotency_repo is not None:
+            with span("service.idempotency_lookup"):
+                previous = self._find_idempotent_move(game_id, idempotency_key)
+            if previous is not None:
+                return self._replay(previous, player_id, x, y)
+
         game = self.repo.get(game_id)
         if not game:
             logger.warning(f"Game not found: {game_id}")
             return MoveResult(success=False, error="Game not found")
 
-        # Validate player
-        try:
-            player = Player.from_str(player_id)
-        except InvalidPlayer as e:
+        # Validate player (routine rejections return result codes rather than raising)
+        player = Player.parse(player_id)
+        if player is None:
             logger.warning(f"Invalid player attempted to move: {player_id} in game {game_id}")
-            return MoveResult(success=False, error=str(e))
+            return MoveResult(success=False, error=MoveOutcome.INVALID_PLAYER.message(player=player_id))
 
         # Validate correct turn
         if game.next_player is None or game.next_player != player:
             logger.warning(f"Player {player_id} tried to move out of turn in game {game_id}")
-            return MoveResult(success=False, error="It's not your turn")
-        
-        try:
-            position = Position(x, y) 
-            game.play_move(position)
-
-        except (InvalidMove, GameFinished) as e:
-            logger.error(f"Error during move in game {game_id}: {str(e)}")
-            return MoveResult(success=False, error=str(e))
-        
-        # Persist the updated game state
-        self.repo.add(game)
+            return MoveResult(success=False, error=MoveOutcome.NOT_YOUR_TURN.message())
+
+        with span("domain.play_move"):
+            position = Position.at(x, y)
+            outcome = game.try_play_move(position) if position else MoveOutcome.OUT_OF_RANGE
+
+        if outcome is not MoveOutcome.OK:
+            error = outcome.message(x=x, y=y)
+            logger.error(f"Error during move in game {game_id}: {error}")
+            return MoveResult(success=False, error=error)
+
+        if game.is_finished and self.stats_repo:
+            self.stats_repo.record_game_finished(game)
 
         # Determine message based on game state or next player
+        if game.is_finished:
+            message = f"Player {game.winner.value} has won!" if game.winner else "The game is a draw"
+        else:
+            message = f"Move registered, next player is {game.next_player.value}"
+
+        record = None
+        if idempotency_key is not None and self.idempotency_repo is not None:
+            record = IdempotentMove(game_id, idempotency_key, player_id, x, y, message, game.version,
+                                    game.winner.value if game.winner else None, game.is_finished)
+            self.idempotency_repo.add(record)  # Committed together with the game
+
+        # Persist the updated game state (and any pending stats update or idempotency key)
+        try:
+            self.repo.add(game)
+        except WriteConflict:
+            previous = self.idempotency_repo.get(game_id, idempotency_key) if record is not None else None
+            if previous is not None:
+                logger.info(f"Concurrent retry with the same idempotency key committed first in game {game_id}")
+                return self._replay(previous, player_id, x, y)
+            if self.repo.get(game_id) is None:
+                logger.warning(f"Game {game_id} was purged while the move was played")
+                return MoveResult(success=False, error="Game not found")
+            raise
+        if self.status_cache is not None:
+            self.status_cache.invalidate(game_id)
+        if record is not None and self.idempotency_cache is not None:
+            self.idempotency_cache.put(record)
+
         if game.is_finished:
             if game.winner:
                 logger.info(f"Game finished: {game_id}, winner={game.winner.value}")
-                return MoveResult(success=True, message=f"Player {game.winner.value} has won!")
             else:
                 logger.info(f"Game finished as a draw: {game_id}")
-                return MoveResult(success=True, message="The game is a draw")
+        else:
+            logger.info(f"Move registered: game_id={game_id}, next_player={game.next_player.value}")
+        return MoveResult(
+            success=True,
+            message=message,
+            version=game.version,
+            next_player=game.next_player.value if not game.is_finished else None,
+            winner=game.winner.value if game.winner else None,
+            is_finished=game.is_finished,
+        )
+
+    @traced("service.get_status")
+    def get_status(self, game_id: str, min_version: Optional[int] = None) -> Optional[GameStatus]:
+        """Fetch the current status of the game, including board, next player, and winner.
+        The status may come from a read replica, but is never older than `min_version` if given.
+        """
+        logger.debug(f"Fetching status for game_id={game_id}, min_version={min_version}")
+        game = self.repo.get_for_read(game_id, min_version)
+        if not game:
+            logger.warning(f"Game not found when fetching status: {game_id}")
+            return None
 
-        logger.info(f"Move registered: game_id={game_id}, next_player={game.next_player.value}")
-        return MoveResult(success=True, message=f"Move registered, next player is {game.next_player.value}")
+        status = self._to_status(game)
+        logger.debug(f"Status fetched for game_id={game_id}: {status}")
+        return status
 
-    def get_status(self, game_id: str) -> Optional[GameStatus]:
-        """Fetch the current status of the game, including board, next player, and winner."""
-        logger.debug(f"Fetching status for game_id={game_id}")
-        game = self.repo.get(game_id)
+    @traced("service.get_status_payload")
+    def get_status_payload(self, game_id: str, render: Callable[[GameStatus], bytes],
+                           min_version: Optional[int] = None) -> Optional[bytes]:
+        """Like `get_status`, but return the status rendered by `render`, reusing the
+        payload cached for the game's current version and this `render` when there is one.
+        """
+        game = self.repo.get_for_read(game_id, min_version)
         if not game:
             logger.warning(f"Game not found when fetching status: {game_id}")
             return None
+        if self.status_cache is None:
+            return render(self._to_status(game))
+
+        payload = self.status_cache.get(game_id, game.version, render)
+        if payload is None:
+            payload = render(self._to_status(game))
+            self.status_cache.put(game_id, game.version, payload, render)
+        return payload
+
+    def get_statuses(self, game_ids: List[str]) -> List[GameStatus]:
+        """Fetch the status of several games at once, in the requested order. Unknown games are skipped."""
+        logger.debug(f"Fetching status for {len(game_ids)} games")
+        games = self.repo.get_many(game_ids)
+        return [self._to_status(games[game_id]) for game_id in game_ids if game_id in games]
 
-        # Map game state to DTO
-        status = GameStatus(
+    def list_games(self, limit: int = 50, after: Optional[str] = None) -> List[str]:
+        """List game IDs in ascending order, `limit` at a time, starting after the `after` ID."""
+        return self.repo.list_game_ids(limit, after)
+
+    @staticmethod
+    def _replay(previous: IdempotentMove, player_id: str, x: int, y: int) -> MoveResult:
+        """Result of a retried move: the stored one, unless the key was used for another move."""
+        if not previous.matches(player_id, x, y):
+            logger.warning(f"Idempotency key reused for a different move in game {previous.game_id}")
+            return MoveResult(success=False, error="Idempotency-Key was already used for a different move")
+        logger.info(f"Replaying move for idempotency key in game {previous.game_id}")
+        return MoveResult(
+            success=True,
+            message=previous.message,
+            version=previous.version,
+            replayed=True,
+            next_player=None if previous.is_finished else Player.from_str(previous.player).opponent().value,
+            winner=previous.winner,
+            is_finished=previous.is_finished,
+        )
+
+    def _find_idempotent_move(self, game_id: str, key: str) -> Optional[IdempotentMove]:
+        """Look the key up in the cache, then in the repository (caching what it finds)."""
+        if self.idempotency_cache is not None:
+            move = self.idempotency_cache.get(game_id, key)
+            if move is not None:
+                return move
+        move = self.idempotency_repo.get(game_id, key)
+        if move is not None and self.idempotency_cache is not None:
+            self.idempotency_cache.put(move)
+        return move
+
+    @staticmethod
+    def _to_status(game: Game) -> GameStatus:
+        """Map game state to DTO."""
+        return GameStatus(
             game_id=game.game_id,
             board=[[cell.value if cell else None for cell in row] for row in game.board.grid],
             next_player=game.next_player.value if not game.is_finished else None,
             winner=game.winner.value if game.winner else None,
-            is_finished=game.is_finished
+            is_finished=game.is_finished,
+            version=game.version
         )
-        logger.debug(f"Status fetched for game_id={game_id}: {status}")
-        return status
+
+    def get_stats(self) -> Optional[GameStatsResult]:
+        """Return the aggregate game counters and the win rates per opening square."""
+        if not self.stats_repo:
+            logger.warning("Game stats requested but no stats repository is configured")
+            return None
+
+        stats = self.stats_repo.get()
+        return GameStatsResult(
+            total_games=stats.total_games,
+            active_games=stats.active_games,
+            finished_games=stats.finished_games,
+            x_wins=stats.x_wins,
+            o_wins=stats.o_wins,
+            draws=stats.draws,
+            abandoned_games=stats.abandoned_games,
+            first_move_win_rates=[
+                OpeningStatsResult(
+                    square=opening.square,
+                    finished_games=opening.finished_games,
+                    x_wins=opening.x_wins,
+                    o_wins=opening.o_wins,
+                    draws=opening.draws,
+                    x_win_rate=self._rate(opening.x_wins, opening.finished_games),
+                    o_win_rate=self._rate(opening.o_wins, opening.finished_games),
+                    draw_rate=self._rate(opening.draws, opening.finished_games),
+                )
+                for opening in stats.openings
+            ]
+        )
+
+    @staticmethod
+    def _rate(count: int, total: int) -> float:
+        return round(count / total, 4) if total else 0.0
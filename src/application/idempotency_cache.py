@@ -0,0 +1,45 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+from src.domain.entities.idempotent_move import IdempotentMove
+
+
+class IdempotencyCache:
+    """
+    Results of recent moves sent with an idempotency key, keyed by game and key,
+    so a retry is answered without a database round trip.
+
+    Entries expire `ttl_seconds` after they were stored and at most `max_keys`
+    are held, evicting the least recently used. The durable copy lives in the
+    idempotency repository; this cache only saves the lookup.
+    """
+
+    def __init__(self, max_keys: int = 100_000, ttl_seconds: float = 86_400,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[float, IdempotentMove]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, game_id: str, key: str) -> Optional[IdempotentMove]:
+        with self._lock:
+            entry = self._entries.get((game_id, key))
+            if entry is None:
+                return None
+            if entry[0] <= self.clock():
+                del self._entries[(game_id, key)]
+                return None
+            self._entries.move_to_end((game_id, key))
+            return entry[1]
+
+    def put(self, move: IdempotentMove) -> None:
+        with self._lock:
+            self._entries[(move.game_id, move.key)] = (self.clock() + self.ttl_seconds, move)
+            self._entries.move_to_end((move.game_id, move.key))
+            if len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
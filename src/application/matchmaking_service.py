@@ -0,0 +1,124 @@
+import asyncio
+import itertools
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from src.domain.value_objects.player import Player
+from src.infrastructure.logging.logger import logger
+
+
+class MatchmakingQueueFull(Exception):
+    pass
+
+
+@dataclass
+class MatchAssignment:
+    game_id: str
+    player: str  # Side assigned to the player: "X" (moves first) or "O"
+
+
+class MatchmakingService:
+    """
+    In-process matchmaking queue pairing waiting players into new games.
+
+    Players wait in FIFO order inside a rating bucket (a single bucket when no
+    rating is given). Every operation is O(1) and runs on the event loop, so no
+    locking is needed; only game creation is pushed to a worker thread.
+    The first player in the queue plays X.
+    """
+
+    def __init__(self, create_game: Callable[[], str], max_waiting: int = 100_000, bucket_width: int = 100,
+                 start_timeout: float = 10.0):
+        """
+        `create_game` is a blocking callable creating and persisting a game, returning its ID.
+        A player paired just as it timed out waits up to `start_timeout` more seconds for its game.
+        """
+        self._create_game = create_game
+        self.max_waiting = max_waiting
+        self.bucket_width = bucket_width
+        self.start_timeout = start_timeout
+        self._buckets: dict[Optional[int], OrderedDict[int, asyncio.Future]] = {}
+        self._tickets = itertools.count()
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of players currently waiting for an opponent."""
+        return self._waiting
+
+    async def join(self, rating: Optional[int] = None, timeout: float = 30.0) -> Optional[MatchAssignment]:
+        """
+        Wait for an opponent and return the game and side assigned to this player.
+        Returns None if nobody showed up within `timeout` seconds.
+        Raises MatchmakingQueueFull when too many players are already waiting.
+        """
+        bucket = rating // self.bucket_width if rating is not None else None
+        opponent = self._pop_opponent(bucket)
+        if opponent is not None:
+            return await self._start_game(opponent)
+
+        if self._waiting >= self.max_waiting:
+            logger.warning(f"Matchmaking queue full ({self._waiting} players waiting)")
+            raise MatchmakingQueueFull("Too many players waiting, try again later")
+
+        ticket = next(self._tickets)
+        waiter = asyncio.get_running_loop().create_future()
+        self._buckets.setdefault(bucket, OrderedDict())[ticket] = waiter
+        self._waiting += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except asyncio.TimeoutError:
+            if self._leave(bucket, ticket):
+                logger.info("Matchmaking timed out without an opponent")
+                return None
+            # Already paired while the game is being created: wait for it, for a while
+            try:
+                return await asyncio.wait_for(waiter, self.start_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Matchmaking gave up waiting for the game of a pairing")
+                return None
+        except asyncio.CancelledError:
+            # The request was cancelled (e.g. its client went away): never pair it
+            self._leave(bucket, ticket)
+            waiter.cancel()
+            raise
+
+    async def _start_game(self, opponent: asyncio.Future) -> MatchAssignment:
+        """Create the game for a popped waiter and this player, notifying the waiter."""
+        assignment = None
+        try:
+            game_id = await asyncio.to_thread(self._create_game)
+            assignment = MatchAssignment(game_id, Player.X.value)
+        except Exception as e:
+            logger.error(f"Failed to create matchmaking game: {e}", exc_info=True)
+            if not opponent.done():
+                opponent.set_exception(e)
+            raise
+        finally:
+            # Also when this request is cancelled: the waiter then gets no game rather than hanging
+            if not opponent.done():
+                opponent.set_result(assignment)
+        logger.info(f"Players matched into game {game_id}")
+        return MatchAssignment(game_id, Player.O.value)
+
+    def _pop_opponent(self, bucket: Optional[int]) -> Optional[asyncio.Future]:
+        """Take the first player waiting in a bucket, if any."""
+        queue = self._buckets.get(bucket)
+        if not queue:
+            return None
+        _, opponent = queue.popitem(last=False)
+        self._waiting -= 1
+        if not queue:
+            del self._buckets[bucket]
+        return opponent
+
+    def _leave(self, bucket: Optional[int], ticket: int) -> bool:
+        """Remove a waiting ticket. Return False if it had already been paired."""
+        queue = self._buckets.get(bucket)
+        if queue is None or queue.pop(ticket, None) is None:
+            return False
+        self._waiting -= 1
+        if not queue:
+            del self._buckets[bucket]
+        return True
@@ -0,0 +1,45 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class StatusPayloadCache:
+    """
+    Serialized status payloads of recently read games, keyed by game and version,
+    one per encoding (`fmt`).
+
+    A payload is only returned for the version it was rendered from, so a move
+    made through another process can never be served stale. Moves made through
+    this process also drop the game's entry right away. Holds at most
+    `max_games` entries, evicting the least recently used.
+    """
+
+    def __init__(self, max_games: int = 10_000):
+        self.max_games = max_games
+        self._entries: OrderedDict[str, tuple[int, dict[Hashable, bytes]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, game_id: str, version: int, fmt: Hashable = "json") -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is None or entry[0] != version:
+                return None
+            self._entries.move_to_end(game_id)
+            return entry[1].get(fmt)
+
+    def put(self, game_id: str, version: int, payload: bytes, fmt: Hashable = "json") -> None:
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is None or entry[0] != version:
+                entry = self._entries[game_id] = (version, {})
+            entry[1][fmt] = payload
+            self._entries.move_to_end(game_id)
+            if len(self._entries) > self.max_games:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, game_id: str) -> None:
+        with self._lock:
+            self._entries.pop(game_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
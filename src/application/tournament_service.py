@@ -0,0 +1,210 @@
+import random
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.application.bots import get_bot
+from src.domain.entities.game import Game
+from src.domain.repositories.game_repository import GameRepository
+from src.domain.value_objects.move_outcome import MoveOutcome
+from src.domain.value_objects.position import Position
+from src.infrastructure.logging.logger import logger
+
+
+@dataclass(frozen=True)
+class Match:
+    """
+    A game to play: bot names per side and the seed driving both bots. The game ID
+    also mixes in the `run` nonce of its tournament, so runs sharing a seed do not
+    overwrite each other's stored games.
+    """
+    x: str
+    o: str
+    seed: int
+    run: int = 0
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    x: str
+    o: str
+    winner: Optional[str]  # Bot name, None for a draw
+    moves: bytes           # Row-major cell index (0-8) of each move, in order
+    game_id: str
+
+
+@dataclass
+class Standing:
+    bot: str
+    played: int = 0
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    byes: int = 0
+    bye_points: float = 0  # Awarded for the Swiss rounds sat out, as for a won match
+
+    @property
+    def points(self) -> float:
+        return self.wins + self.draws / 2 + self.bye_points
+
+
+@dataclass
+class TournamentResult:
+    standings: list[Standing]
+    results: list[MatchResult] = field(repr=False)
+
+
+def play_match(match: Match) -> MatchResult:
+    """Play one game between two bots on the Game entity. Deterministic for a given seed."""
+    rng = random.Random(match.seed)
+    game = Game(str(uuid.UUID(int=rng.getrandbits(128) ^ match.run, version=4)))
+    bots = {"X": get_bot(match.x), "O": get_bot(match.o)}
+    moves = bytearray()
+    while not game.is_finished:
+        position = bots[game.next_player.value].choose_move(game, rng)
+        if game.try_play_move(position) is not MoveOutcome.OK:
+            raise RuntimeError(f"Bot {bots[game.next_player.value].name} played an invalid move")
+        moves.append((position.y - 1) * 3 + position.x - 1)
+    winner = {"X": match.x, "O": match.o}[game.winner.value] if game.winner else None
+    return MatchResult(match.x, match.o, winner, bytes(moves), game.game_id)
+
+
+def play_chunk(matches: list[Match]) -> list[MatchResult]:
+    """Worker entry point: play a chunk of matches, returning compact results."""
+    return [play_match(match) for match in matches]
+
+
+def replay(result: MatchResult) -> Game:
+    """Rebuild the finished game of a match result."""
+    game = Game(result.game_id)
+    for cell in result.moves:
+        game.play_move(Position.at(cell % 3 + 1, cell // 3 + 1))
+    return game
+
+
+class TournamentService:
+    """
+    Runs bot-vs-bot tournaments, spreading games over worker processes.
+
+    Matches are sent to workers in chunks of `chunk_size` so a chunk costs a
+    single round trip, and come back as compact results (the move list) that
+    are replayed into games here when they need to be stored. Every match gets
+    its own seed drawn from the tournament seed, so results do not depend on
+    how matches are spread over workers. Game IDs differ from run to run.
+    """
+
+    def __init__(self, repo: Optional[GameRepository] = None, workers: Optional[int] = None,
+                 chunk_size: int = 500, store_batch_size: int = 1000):
+        """`workers=0` plays in-process; None uses one process per core."""
+        self.repo = repo
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.store_batch_size = store_batch_size
+
+    def run_round_robin(self, bots: list[str], games_per_pair: int = 10, seed: int = 0,
+                        nonce: Optional[int] = None) -> TournamentResult:
+        """
+        Every bot plays every other one `games_per_pair` times with each side.
+        `nonce` is mixed into the game IDs: random by default, so runs never share IDs.
+        """
+        rng, run = random.Random(seed), self._nonce(nonce)
+        matches = [
+            Match(x, o, rng.getrandbits(64), run)
+            for x in bots for o in bots if x != o
+            for _ in range(games_per_pair)
+        ]
+        with self._executor() as executor:
+            results = self._play(executor, matches)
+        return self._finish(bots, results)
+
+    def run_swiss(self, bots: list[str], rounds: int, games_per_match: int = 2, seed: int = 0,
+                  nonce: Optional[int] = None) -> TournamentResult:
+        """
+        Each round pairs bots with close scores that have not met yet. A pairing
+        plays `games_per_match` games, alternating sides; with an odd number of
+        bots, the lowest-ranked bot without a bye sits out, scoring as if it had
+        won all the games of its pairing. `nonce` is as for `run_round_robin`.
+        """
+        rng, run = random.Random(seed), self._nonce(nonce)
+        results: list[MatchResult] = []
+        met: set[frozenset] = set()
+        byes: dict[str, int] = {}
+        with self._executor() as executor:
+            for _ in range(rounds):
+                order = [s.bot for s in self._standings(bots, results, byes, games_per_match)]
+                if len(order) % 2:
+                    bye = next((bot for bot in reversed(order) if bot not in byes), order[-1])
+                    byes[bye] = byes.get(bye, 0) + 1
+                    order.remove(bye)
+                matches = []
+                for a, b in self._swiss_pairs(order, met):
+                    met.add(frozenset((a, b)))
+                    for game in range(games_per_match):
+                        x, o = (a, b) if game % 2 == 0 else (b, a)
+                        matches.append(Match(x, o, rng.getrandbits(64), run))
+                results.extend(self._play(executor, matches))
+        return self._finish(bots, results, byes, games_per_match)
+
+    @staticmethod
+    def _nonce(nonce: Optional[int]) -> int:
+        return uuid.uuid4().int if nonce is None else nonce
+
+    @staticmethod
+    def _swiss_pairs(order: list[str], met: set[frozenset]) -> list[tuple[str, str]]:
+        """Pair bots in ranking order, each with the next one it has not met (or the next one)."""
+        remaining = list(order)
+        pairs = []
+        while remaining:
+            a = remaining.pop(0)
+            b = next((bot for bot in remaining if frozenset((a, bot)) not in met), remaining[0])
+            remaining.remove(b)
+            pairs.append((a, b))
+        return pairs
+
+    def _executor(self) -> Executor:
+        return _InlineExecutor() if self.workers == 0 else ProcessPoolExecutor(self.workers)
+
+    def _play(self, executor: Executor, matches: list[Match]) -> list[MatchResult]:
+        chunks = [matches[i:i + self.chunk_size] for i in range(0, len(matches), self.chunk_size)]
+        results = [result for chunk in executor.map(play_chunk, chunks) for result in chunk]
+        if self.repo:
+            for start in range(0, len(results), self.store_batch_size):
+                self.repo.add_many([replay(result) for result in results[start:start + self.store_batch_size]])
+        return results
+
+    def _finish(self, bots: list[str], results: list[MatchResult], byes: Optional[dict[str, int]] = None,
+                bye_points: float = 0) -> TournamentResult:
+        standings = self._standings(bots, results, byes, bye_points)
+        logger.info(f"Tournament finished: {len(results)} games, leader {standings[0].bot if standings else None}")
+        return TournamentResult(standings, results)
+
+    @staticmethod
+    def _standings(bots: list[str], results: list[MatchResult], byes: Optional[dict[str, int]] = None,
+                   bye_points: float = 0) -> list[Standing]:
+        """
+        Standings sorted by points (1 per win, 1/2 per draw, `bye_points` per bye),
+        then wins, then name.
+        """
+        table = {bot: Standing(bot) for bot in bots}
+        for bot, count in (byes or {}).items():
+            table[bot].byes = count
+            table[bot].bye_points = count * bye_points
+        for result in results:
+            for bot in (result.x, result.o):
+                standing = table[bot]
+                standing.played += 1
+                if result.winner is None:
+                    standing.draws += 1
+                elif result.winner == bot:
+                    standing.wins += 1
+                else:
+                    standing.losses += 1
+        return sorted(table.values(), key=lambda s: (-s.points, -s.wins, s.bot))
+
+
+class _InlineExecutor(Executor):
+    """Executor running everything in the calling thread."""
+
+    def map(self, fn, *iterables, **kwargs):
+        return map(fn, *iterables)
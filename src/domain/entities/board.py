@@ -2,7 +2,14 @@ from typing import Optional
 from src.domain.value_objects.player import Player
 from src.domain.value_objects.position import Position
 
+# Zero-indexed (x, y) cells of every line (rows, columns, diagonals) through each cell
+_LINES = [[(x, y) for x in range(3)] for y in range(3)] + [[(x, y) for y in range(3)] for x in range(3)] \
+    + [[(i, i) for i in range(3)], [(2 - i, i) for i in range(3)]]
+_LINES_THROUGH = {(x, y): [line for line in _LINES if (x, y) in line] for x in range(3) for y in range(3)}
+
 class Board:
+    __slots__ = ("grid",)
+
     def __init__(self):
         # 3x3 grid initialized with None
         self.grid: list[list[Optional[Player]]] = [[None]*3 for _ in range(3)]
@@ -33,6 +40,14 @@ class Board:
             return True
         return False
 
+    def completes_line(self, player: Player, position: Position) -> bool:
+        """Check if the player owns a full line through the given position (the cell just marked)."""
+        g = self.grid
+        return any(
+            all(g[y][x] == player for x, y in line)
+            for line in _LINES_THROUGH[position.zero_indexed]
+        )
+
     def is_full(self) -> bool:
         """Return True if all cells are filled."""
         return all(all(cell is not None for cell in row) for row in self.grid)
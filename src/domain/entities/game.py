@@ -1,26 +1,43 @@
 from src.domain.entities.board import Board
+from src.domain.value_objects.move_outcome import MoveOutcome
 from src.domain.value_objects.player import Player
 from src.domain.value_objects.position import Position
 from src.domain.exceptions import InvalidMove, GameFinished
 
 class Game:
+    __slots__ = ("game_id", "board", "next_player", "winner", "is_finished", "first_move", "version")
+
     def __init__(self, game_id: str):
         self.game_id = game_id
         self.board = Board()
         self.next_player: Player = Player.X  # X always starts
         self.winner: Player | None = None
         self.is_finished: bool = False
+        self.first_move: Position | None = None  # Opening square, used for aggregate stats
+        self.version: int = 0  # Number of moves played, bumped on every accepted move
 
     def play_move(self, position: Position):
         """Play a move at the given position. Raise exceptions if invalid or finished."""
+        outcome = self.try_play_move(position)
+        if outcome is MoveOutcome.GAME_FINISHED:
+            raise GameFinished(outcome.message())
+        if outcome is MoveOutcome.CELL_TAKEN:
+            raise InvalidMove(outcome.message(x=position.x, y=position.y))
+
+    def try_play_move(self, position: Position) -> MoveOutcome:
+        """Play a move at the given position, returning a MoveOutcome instead of raising."""
         if self.is_finished:
-            raise GameFinished("The game has already finished")
+            return MoveOutcome.GAME_FINISHED
 
         if not self.board.mark(self.next_player, position):
-            raise InvalidMove(f"Cell {position.x},{position.y} is already taken")
+            return MoveOutcome.CELL_TAKEN
+
+        if self.first_move is None:
+            self.first_move = position
+        self.version += 1
 
-        # Check for win
-        if self.board.check_winner(self.next_player):
+        # Check for win (only lines through the new mark can have been completed)
+        if self.board.completes_line(self.next_player, position):
             self.winner = self.next_player
             self.is_finished = True
         # Check for draw
@@ -30,3 +47,4 @@ class Game:
         else:
             # Switch to opponent
             self.next_player = self.next_player.opponent()
+        return MoveOutcome.OK
@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class OpeningStats:
+    """Outcome counters of finished games grouped by their opening square ("x,y")."""
+    square: str
+    finished_games: int = 0
+    x_wins: int = 0
+    o_wins: int = 0
+    draws: int = 0
+
+
+@dataclass
+class GameStats:
+    """Aggregate counters over every game ever created."""
+    total_games: int = 0
+    finished_games: int = 0
+    x_wins: int = 0
+    o_wins: int = 0
+    draws: int = 0
+    abandoned_games: int = 0
+    openings: list[OpeningStats] = field(default_factory=list)
+
+    @property
+    def active_games(self) -> int:
+        return self.total_games - self.finished_games - self.abandoned_games
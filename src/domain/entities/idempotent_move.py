@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class IdempotentMove:
+    """Outcome of an accepted move, stored under the client's idempotency key for its game."""
+    game_id: str
+    key: str
+    player: str
+    x: int
+    y: int
+    message: str
+    version: int
+    winner: Optional[str] = None  # Game state after the move, replayed with it
+    is_finished: bool = False
+
+    def matches(self, player: str, x: int, y: int) -> bool:
+        """Whether a retry asks for the same move the key was first used for."""
+        return (self.player, self.x, self.y) == (player, x, y)
@@ -6,3 +6,10 @@ class GameFinished(Exception):
 
 class InvalidPlayer(Exception):
     pass
+
+class WriteConflict(Exception):
+    """
+    A write collided with a concurrent one (the same idempotency key stored first,
+    or the game deleted since it was read); nothing was stored.
+    """
+    pass
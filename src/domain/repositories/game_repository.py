@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 from src.domain.entities.game import Game
 
 class GameRepository(ABC):
@@ -9,7 +10,34 @@ class GameRepository(ABC):
         """Add or update a game in the repository."""
         pass
 
+    def add_many(self, games: list[Game]) -> None:
+        """Add or update several games at once. Defaults to calling `add` for each."""
+        for game in games:
+            self.add(game)
+
     @abstractmethod
     def get(self, game_id: str) -> Game:
         """Retrieve a game by its ID. Return None if not found."""
         pass
+
+    def get_for_read(self, game_id: str, min_version: Optional[int] = None) -> Optional[Game]:
+        """
+        Retrieve a game that will only be read, never written back.
+        Implementations may serve it from a possibly lagging copy, but never
+        older than `min_version` when given. Defaults to `get`.
+        """
+        return self.get(game_id)
+
+    def get_many(self, game_ids: list[str]) -> dict[str, Game]:
+        """Retrieve several games for reading, keyed by ID. Missing games are left out."""
+        games = {}
+        for game_id in game_ids:
+            game = self.get_for_read(game_id)
+            if game:
+                games[game_id] = game
+        return games
+
+    @abstractmethod
+    def list_game_ids(self, limit: int, after: Optional[str] = None) -> list[str]:
+        """List up to `limit` game IDs in ascending order, starting after `after`."""
+        pass
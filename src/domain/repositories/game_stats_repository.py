@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from src.domain.entities.game import Game
+from src.domain.entities.game_stats import GameStats
+
+class GameStatsRepository(ABC):
+    """Abstract repository for the incrementally maintained game counters.
+
+    Recording methods must not commit: they join the transaction of the
+    game write they belong to, so counters and games never drift apart.
+    """
+
+    @abstractmethod
+    def record_game_created(self, game: Game) -> None:
+        """Count a newly created game."""
+        pass
+
+    @abstractmethod
+    def record_game_finished(self, game: Game) -> None:
+        """Count a finished game, its outcome and its opening square."""
+        pass
+
+    @abstractmethod
+    def record_games_abandoned(self, count: int) -> None:
+        """Count unfinished games that were purged after their TTL."""
+        pass
+
+    @abstractmethod
+    def get(self) -> GameStats:
+        """Return the current counters."""
+        pass
+
+    @abstractmethod
+    def rebuild(self) -> GameStats:
+        """Recompute every counter from the stored games and return the result."""
+        pass
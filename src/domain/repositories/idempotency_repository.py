@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.domain.entities.idempotent_move import IdempotentMove
+
+class IdempotencyRepository(ABC):
+    """Abstract repository for the results of moves sent with an idempotency key.
+
+    `add` must not commit: the result joins the transaction of the game write
+    it belongs to, so a key is only ever stored for a move that was persisted.
+    """
+
+    @abstractmethod
+    def get(self, game_id: str, key: str) -> Optional[IdempotentMove]:
+        """Return the move stored under `key` for the game, or None."""
+        pass
+
+    @abstractmethod
+    def list_for_game(self, game_id: str) -> list[IdempotentMove]:
+        """Return every move stored under a key for the game (a few at most: one per accepted move)."""
+        pass
+
+    @abstractmethod
+    def add(self, move: IdempotentMove) -> None:
+        """Store the result of an accepted move, committed with the next game write."""
+        pass
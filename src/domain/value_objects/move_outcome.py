@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class MoveOutcome(Enum):
+    """
+    Result of validating or playing a move, for callers that reject invalid
+    moves without paying for an exception. Each value is its error message template.
+    """
+    OK = "Move accepted"
+    INVALID_PLAYER = "Invalid player, should be 'X' or 'O', got '{player}'"
+    NOT_YOUR_TURN = "It's not your turn"
+    OUT_OF_RANGE = "Position {x},{y} out of board range (1-3)"
+    CELL_TAKEN = "Cell {x},{y} is already taken"
+    GAME_FINISHED = "The game has already finished"
+
+    def message(self, **details) -> str:
+        return self.value.format(**details)
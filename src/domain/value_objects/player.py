@@ -1,5 +1,7 @@
 from enum import Enum
+from typing import Optional
 from src.domain.exceptions import InvalidPlayer
+from src.domain.value_objects.move_outcome import MoveOutcome
 
 class Player(str, Enum):
     X = "X"
@@ -7,10 +9,18 @@ class Player(str, Enum):
 
     @staticmethod
     def from_str(value: str) -> "Player":
-        try:
-            return Player(value)
-        except ValueError:
-            raise InvalidPlayer(f"Invalid player, should be 'X' or 'O', got '{value}'")
+        player = _PLAYERS.get(value)
+        if player is None:
+            raise InvalidPlayer(MoveOutcome.INVALID_PLAYER.message(player=value))
+        return player
+
+    @staticmethod
+    def parse(value: str) -> Optional["Player"]:
+        """Return the player for "X" or "O", or None for anything else. Never raises."""
+        return _PLAYERS.get(value)
 
     def opponent(self) -> "Player":
-        return Player.O if self == Player.X else Player.X
+        return Player.O if self is Player.X else Player.X
+
+
+_PLAYERS = {player.value: player for player in Player}
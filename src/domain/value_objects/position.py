@@ -1,15 +1,36 @@
+from typing import Optional
 from src.domain.exceptions import InvalidMove
+from src.domain.value_objects.move_outcome import MoveOutcome
 
 class Position:
+    __slots__ = ("x", "y")
+
     def __init__(self, x: int, y: int):
         if not (1 <= x <= 3 and 1 <= y <= 3):
-            raise InvalidMove(f"Position {x},{y} out of board range (1-3)")
+            raise InvalidMove(MoveOutcome.OUT_OF_RANGE.message(x=x, y=y))
         self.x = x
         self.y = y
 
+    @staticmethod
+    def at(x: int, y: int) -> Optional["Position"]:
+        """Return the shared instance for (x, y), or None when out of the board. Never raises."""
+        return _CELLS.get((x, y))
+
     @property
     def zero_indexed(self):
         return self.x - 1, self.y - 1
 
     def __eq__(self, other):
+        if not isinstance(other, Position):
+            return NotImplemented
         return self.x == other.x and self.y == other.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+    def __repr__(self):
+        return f"Position({self.x}, {self.y})"
+
+
+# Flyweights for the nine cells: positions are immutable in practice, so they are shared
+_CELLS = {(x, y): Position(x, y) for x in range(1, 4) for y in range(1, 4)}
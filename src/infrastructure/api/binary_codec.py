@@ -0,0 +1,117 @@
+import struct
+import uuid
+from typing import Optional
+
+from src.application.dtos import GameStatus, MoveResult
+from src.infrastructure.api.dtos import MoveRequest, PositionRequest
+
+# Compact fixed-layout encoding for bots, selected with Content-Type / Accept.
+# All integers are big-endian. Game IDs travel as the 16 bytes of their UUID.
+#
+#   move request   game_id[16] player[1] ("X"/"O") x[1] y[1]              19 bytes
+#   move response  version[4] flags[1]                                      5 bytes
+#   status         game_id[16] version[4] board[4] flags[1]               25 bytes
+#
+# The board packs 2 bits per cell (0 empty, 1 X, 2 O), cell (row, col) at bits
+# 2 * (3 * row + col). Flags: bits 0-1 next player, bits 2-3 winner (same
+# codes as cells), bit 4 set when the game is finished.
+BINARY_MEDIA_TYPE = "application/x-tictactoe"
+
+MOVE_REQUEST = struct.Struct("!16scBB")
+MOVE_RESPONSE = struct.Struct("!IB")
+STATUS = struct.Struct("!16sIIB")
+
+_PLAYER_CODES = {None: 0, "X": 1, "O": 2}
+_PLAYERS = (None, "X", "O", None)
+_FINISHED = 0x10
+
+
+def is_binary(content_type: Optional[str]) -> bool:
+    """Whether a Content-Type header is the binary encoding."""
+    return bool(content_type) and content_type.split(";")[0].strip().lower() == BINARY_MEDIA_TYPE
+
+
+def accepts_binary(accept: Optional[str]) -> bool:
+    """
+    Whether an Accept header prefers the binary encoding to JSON. It must be
+    named explicitly (wildcards only cover JSON, the default) with a q-value
+    above 0 and at least that of JSON.
+    """
+    if not accept:
+        return False
+    binary = json = 0.0
+    for media_range in accept.split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        media_type = media_type.lower()
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type == BINARY_MEDIA_TYPE:
+            binary = max(binary, quality)
+        elif media_type in ("application/json", "application/*", "*/*"):
+            json = max(json, quality)
+    return binary > 0 and binary >= json
+
+
+def encode_move_request(game_id: str, player_id: str, x: int, y: int) -> bytes:
+    return MOVE_REQUEST.pack(uuid.UUID(game_id).bytes, player_id.encode("ascii"), x, y)
+
+
+def decode_move_request(body: bytes) -> MoveRequest:
+    """Decode a binary move request. Raises ValueError on a malformed body."""
+    try:
+        game_id, player, x, y = MOVE_REQUEST.unpack(body)
+    except struct.error as e:
+        raise ValueError(f"Binary move request must be {MOVE_REQUEST.size} bytes") from e
+    return MoveRequest.model_construct(
+        gameId=str(uuid.UUID(bytes=game_id)),
+        playerId=player.decode("latin-1"),
+        square=PositionRequest.model_construct(x=x, y=y),
+    )
+
+
+def encode_move_response(result: MoveResult) -> bytes:
+    """Encode an accepted move: the game version and state flags after it."""
+    return MOVE_RESPONSE.pack(result.version, _flags(result.next_player, result.winner, result.is_finished))
+
+
+def decode_move_response(payload: bytes) -> MoveResult:
+    version, flags = MOVE_RESPONSE.unpack(payload)
+    return MoveResult(
+        success=True,
+        version=version,
+        next_player=_PLAYERS[flags & 3],
+        winner=_PLAYERS[(flags >> 2) & 3],
+        is_finished=bool(flags & _FINISHED),
+    )
+
+
+def encode_status(status: GameStatus) -> bytes:
+    board = 0
+    for i, cell in enumerate(cell for row in status.board for cell in row):
+        board |= _PLAYER_CODES[cell] << (2 * i)
+    flags = _flags(status.next_player, status.winner, status.is_finished)
+    return STATUS.pack(uuid.UUID(status.game_id).bytes, status.version, board, flags)
+
+
+def decode_status(payload: bytes) -> GameStatus:
+    game_id, version, board, flags = STATUS.unpack(payload)
+    cells = [_PLAYERS[(board >> (2 * i)) & 3] for i in range(9)]
+    return GameStatus(
+        game_id=str(uuid.UUID(bytes=game_id)),
+        board=[cells[0:3], cells[3:6], cells[6:9]],
+        next_player=_PLAYERS[flags & 3],
+        winner=_PLAYERS[(flags >> 2) & 3],
+        is_finished=bool(flags & _FINISHED),
+        version=version,
+    )
+
+
+def _flags(next_player: Optional[str], winner: Optional[str], is_finished: bool) -> int:
+    flags = _PLAYER_CODES[next_player] | _PLAYER_CODES[winner] << 2
+    return flags | _FINISHED if is_finished else flags
@@ -1,14 +1,141 @@
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, Optional
 from sqlalchemy.orm import Session
-from fastapi import Depends
-from src.infrastructure.db.session import get_db
+from fastapi import Depends, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from src.infrastructure.db.session import (
+    get_db, get_session, get_replica_pool, get_shard_db, get_shard_sessions, get_group_commit_writers, PRIMARY
+)
+from src.infrastructure.db.sharding import ShardSessions
+from src.infrastructure.api.binary_codec import is_binary, decode_move_request
+from src.infrastructure.api.dtos import MoveRequest
+from src.infrastructure.cache.shared_game_cache import SharedGameCache
+from src.infrastructure.repositories.cached_game_repository import CachedGameRepository
 from src.infrastructure.repositories.game_repository_impl import GameRepositoryImpl
+from src.infrastructure.repositories.game_stats_repository_impl import GameStatsRepositoryImpl
+from src.infrastructure.repositories.idempotency_repository_impl import IdempotencyRepositoryImpl
+from src.infrastructure.repositories.sharded_game_repository import ShardedGameRepository
+from src.infrastructure.repositories.sharded_game_stats_repository import ShardedGameStatsRepository
+from src.infrastructure.repositories.sharded_idempotency_repository import ShardedIdempotencyRepository
+from src.infrastructure.repositories.single_flight import SingleFlight
 from src.application.game_service import GameService
+from src.application.status_cache import StatusPayloadCache
+from src.application.idempotency_cache import IdempotencyCache
+from src.application.matchmaking_service import MatchmakingService
 
+# Shared by every request so concurrent reads of the same game run one query
+game_reads = SingleFlight() if os.getenv("READ_COALESCING_ENABLED", "true").lower() == "true" else None
+# Rendered status payloads of recently read games, shared by every request
+status_cache_size = int(os.getenv("STATUS_CACHE_MAX_GAMES", "10000"))
+status_payloads = StatusPayloadCache(status_cache_size) if status_cache_size > 0 else None
+# Results of recent moves sent with an Idempotency-Key, in front of their table
+idempotency_cache_size = int(os.getenv("IDEMPOTENCY_CACHE_MAX_KEYS", "100000"))
+idempotent_moves = IdempotencyCache(
+    idempotency_cache_size, ttl_seconds=float(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400"))
+) if idempotency_cache_size > 0 else None
 
-def get_game_service(db: Session = Depends(get_db)) -> GameService:
+# Game states shared by every worker process of the node (memory-mapped), when enabled
+shared_games = SharedGameCache.from_env()
+
+
+def build_game_service(db: Session, shards: Optional[ShardSessions] = None) -> GameService:
+    """Wire a GameService and its repositories on top of a DB session (or of shard sessions)."""
+    writers = get_group_commit_writers()
+    if shards:
+        repo = ShardedGameRepository(shards, single_flight=game_reads, writers=writers)
+        stats_repo = ShardedGameStatsRepository(shards, deferred=bool(writers))
+        idempotency_repo = ShardedIdempotencyRepository(shards, deferred=bool(writers))
+    else:
+        repo = GameRepositoryImpl(db, single_flight=game_reads, replicas=get_replica_pool(), writer=writers.get(PRIMARY))
+        stats_repo = GameStatsRepositoryImpl(db, deferred=bool(writers))
+        idempotency_repo = IdempotencyRepositoryImpl(db, deferred=bool(writers))
+    if shared_games is not None:
+        repo = CachedGameRepository(repo, shared_games)
+    return GameService(repo, stats_repo, status_payloads, idempotency_repo, idempotent_moves)
+
+
+def get_game_service(
+    db: Session = Depends(get_db),
+    shards: Optional[ShardSessions] = Depends(get_shard_db)
+) -> GameService:
     """
     Provides a GameService instance using the DB session.
     Injected into API routes via FastAPI Depends.
     """
-    repo = GameRepositoryImpl(db)
-    return GameService(repo)
+    return build_game_service(db, shards)
+
+
+async def get_move_request(request: Request) -> MoveRequest:
+    """
+    Parse the move body according to its Content-Type: the compact binary
+    encoding, or JSON (the default). Malformed bodies are rejected with a 422.
+    """
+    body = await request.body()
+    if is_binary(request.headers.get("content-type")):
+        try:
+            return decode_move_request(body)
+        except ValueError as e:
+            raise RequestValidationError([{"type": "value_error", "loc": ("body",), "msg": str(e), "input": None}])
+    try:
+        return MoveRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError([{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)])
+
+
+@contextmanager
+def open_game_service() -> Iterator[GameService]:
+    """Open a GameService on short-lived sessions (for work done outside any request session)."""
+    db = get_session()
+    shards = get_shard_sessions()
+    try:
+        yield build_game_service(db, shards)
+    finally:
+        db.close()
+        if shards:
+            shards.close()
+
+
+def create_game_in_new_session() -> str:
+    """Create a game on a short-lived session (matchmaking runs outside any request session)."""
+    with open_game_service() as service:
+        return service.create_game()
+
+
+def game_actors_enabled() -> bool:
+    return os.getenv("GAME_ACTORS_ENABLED", "false").lower() == "true"
+
+
+@lru_cache(maxsize=None)
+def get_game_actors() -> "GameActorSystem":
+    """
+    Provides the process-wide GameActorSystem (only imported when game actors are enabled).
+    Actors load and persist their game on their own short-lived sessions.
+    """
+    from src.application.game_actors import GameActorSystem
+    return GameActorSystem(
+        open_game_service,
+        status_cache=status_payloads,
+        idempotency_cache=idempotent_moves,
+        idle_seconds=float(os.getenv("GAME_ACTOR_IDLE_SECONDS", "60")),
+        mailbox_size=int(os.getenv("GAME_ACTOR_MAILBOX_SIZE", "1000")),
+        max_actors=int(os.getenv("GAME_ACTORS_MAX", "100000")),
+        write_retries=int(os.getenv("GAME_ACTOR_WRITE_RETRIES", "5")),
+        stop_timeout=float(os.getenv("GAME_ACTOR_STOP_TIMEOUT_SECONDS", "10")),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_matchmaking_service() -> MatchmakingService:
+    """
+    Provides the process-wide MatchmakingService.
+    Waiting players hold no DB session; only the pairing request opens one.
+    """
+    return MatchmakingService(
+        create_game_in_new_session,
+        max_waiting=int(os.getenv("MATCHMAKING_MAX_WAITING", "100000")),
+        bucket_width=int(os.getenv("MATCHMAKING_RATING_BUCKET_WIDTH", "100")),
+        start_timeout=float(os.getenv("MATCHMAKING_START_TIMEOUT_SECONDS", "10")),
+    )
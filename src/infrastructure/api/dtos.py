@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
 
 class PositionRequest(BaseModel):
     x: int
@@ -8,3 +9,10 @@ class MoveRequest(BaseModel):
     gameId: str
     playerId: str
     square: PositionRequest
+
+class JoinRequest(BaseModel):
+    rating: Optional[int] = None    # Players are only paired within the same rating bucket
+    timeout: Optional[float] = None # Seconds to wait for an opponent, capped by the server
+
+class BatchStatusRequest(BaseModel):
+    gameIds: List[str] = Field(min_length=1, max_length=100)
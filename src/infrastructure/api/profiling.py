@@ -0,0 +1,222 @@
+import asyncio
+import cProfile
+import functools
+import hmac
+import os
+import pstats
+import random
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.infrastructure.logging.logger import logger
+
+
+def profiling_enabled() -> bool:
+    return os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+
+
+class RequestProfile:
+    """Profiler and SQL counters of a single profiled request."""
+
+    def __init__(self):
+        self.profile_id = uuid.uuid4().hex
+        self.profiler = cProfile.Profile()
+        self.profiled = False  # Whether the profiler actually ran (see `profiled`)
+        self.sql_queries = 0
+        self.sql_seconds = 0.0
+
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("current_profile", default=None)
+# A single profiler can be active per process (Python 3.12+ refuses a second one)
+_profiler_lock = threading.Lock()
+
+
+def profiled(endpoint):
+    """
+    Run a sync endpoint under the request's profiler when the request is being profiled.
+
+    Sync endpoints run in a worker thread, out of reach of a profiler started by the
+    middleware on the event loop thread, so profiling starts here instead. Only one
+    request is profiled at a time: while another one is, the endpoint runs unprofiled.
+    Returns the endpoint untouched when profiling is disabled.
+    """
+    if not profiling_enabled():
+        return endpoint
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        profile = _current_profile.get()
+        if profile is None or not _profiler_lock.acquire(blocking=False):
+            return endpoint(*args, **kwargs)
+        try:
+            try:
+                profile.profiler.enable()
+            except ValueError as e:  # Another profiling tool is active (e.g. a debugger)
+                logger.warning(f"Request {profile.profile_id} not profiled: {e}")
+                return endpoint(*args, **kwargs)
+            profile.profiled = True
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                profile.profiler.disable()
+        finally:
+            _profiler_lock.release()
+
+    return wrapper
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        conn.info.setdefault("profiling_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    if profile is not None and conn.info.get("profiling_query_start"):
+        profile.sql_queries += 1
+        profile.sql_seconds += time.perf_counter() - conn.info["profiling_query_start"].pop()
+
+
+def collapsed_stacks(stats: pstats.Stats, max_depth: int = 64) -> list[str]:
+    """
+    Convert profiler stats into collapsed stacks ("a;b;c <microseconds>") for flamegraph tools.
+    cProfile only records caller/callee pairs, so a function's time is split over
+    its call paths in proportion to the time each caller spent in it.
+    """
+    raw = stats.stats
+    callees: dict = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+    lines: dict[str, float] = {}
+
+    def label(func) -> str:
+        filename, line, name = func
+        return f"{os.path.basename(filename)}:{name}:{line}".replace(";", ":").replace(" ", "_")
+
+    def walk(func, path: list[str], on_path: set, fraction: float):
+        stack = ";".join(path)
+        lines[stack] = lines.get(stack, 0.0) + raw[func][2] * fraction
+        if len(path) >= max_depth:
+            return
+        for callee, edge_time in callees.get(func, {}).items():
+            total = raw[callee][3]
+            if callee in on_path or total <= 0 or edge_time <= 0:
+                continue
+            walk(callee, path + [label(callee)], on_path | {callee}, fraction * edge_time / total)
+
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers:
+            walk(func, [label(func)], {func}, 1.0)
+    return [f"{stack} {round(seconds * 1e6)}" for stack, seconds in lines.items() if seconds > 0]
+
+
+class ProfilingMiddleware:
+    """
+    Opt-in ASGI middleware profiling single requests end to end.
+
+    A request is profiled when it carries `X-Profile: <PROFILING_TOKEN>` or is picked
+    by the `PROFILING_SAMPLE_RATE` sampler. Its profile is written to `output_dir`
+    as `<id>.pstats` and `<id>.collapsed` (flamegraph input), and the response gets
+    `X-Profile-Id`, `X-SQL-Queries` and `X-SQL-Time-Ms` headers (no `X-Profile-Id`
+    when the profiler was busy with another request). Only the newest `max_files`
+    profile files are kept in `output_dir`.
+    Only installed when PROFILING_ENABLED=true, so it costs nothing otherwise.
+    """
+
+    def __init__(self, app, token: Optional[str] = None, sample_rate: float = 0.0,
+                 output_dir: str = "/tmp/profiles", max_files: int = 200):
+        self.app = app
+        self.token = token.encode() if token else None
+        self.sample_rate = sample_rate
+        self.output_dir = output_dir
+        self.max_files = max_files
+        if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+    @classmethod
+    def options_from_env(cls) -> Optional[dict]:
+        """Middleware kwargs built from the environment, or None when profiling is disabled."""
+        if not profiling_enabled():
+            return None
+        return {
+            "token": os.getenv("PROFILING_TOKEN") or None,
+            "sample_rate": float(os.getenv("PROFILING_SAMPLE_RATE", "0")),
+            "output_dir": os.getenv("PROFILING_OUTPUT_DIR", "/tmp/profiles"),
+            "max_files": int(os.getenv("PROFILING_MAX_FILES", "200")),
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            return await self.app(scope, receive, send)
+
+        profile = RequestProfile()
+        reset = _current_profile.set(profile)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = [
+                    (b"x-sql-queries", str(profile.sql_queries).encode()),
+                    (b"x-sql-time-ms", f"{profile.sql_seconds * 1000:.3f}".encode()),
+                ]
+                if profile.profiled:
+                    headers.append((b"x-profile-id", profile.profile_id.encode()))
+                message["headers"] = list(message.get("headers", [])) + headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current_profile.reset(reset)
+            await asyncio.to_thread(self._store, profile, f"{scope['method']} {scope['path']}")
+
+    def _should_profile(self, scope) -> bool:
+        if self.token is not None:
+            for name, value in scope.get("headers", ()):
+                if name == b"x-profile" and hmac.compare_digest(value, self.token):
+                    return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def _store(self, profile: RequestProfile, request_line: str) -> None:
+        if not profile.profiled:
+            logger.info(
+                f"Not profiled {request_line} (profiler busy): sql_queries={profile.sql_queries}, "
+                f"sql_time_ms={profile.sql_seconds * 1000:.3f}"
+            )
+            return
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            base = os.path.join(self.output_dir, profile.profile_id)
+            stats = pstats.Stats(profile.profiler)
+            stats.dump_stats(base + ".pstats")
+            with open(base + ".collapsed", "w") as f:
+                f.write("\n".join(collapsed_stacks(stats)) + "\n")
+            logger.info(
+                f"Profiled {request_line}: id={profile.profile_id}, sql_queries={profile.sql_queries}, "
+                f"sql_time_ms={profile.sql_seconds * 1000:.3f}, files={base}.pstats/.collapsed"
+            )
+            self._prune()
+        except Exception as e:
+            logger.error(f"Failed to store profile {profile.profile_id}: {e}", exc_info=True)
+
+    def _prune(self) -> None:
+        """Delete the oldest profile files beyond `max_files` (0 keeps them all)."""
+        if self.max_files <= 0:
+            return
+        with os.scandir(self.output_dir) as entries:
+            files = [entry for entry in entries if entry.name.endswith((".pstats", ".collapsed")) and entry.is_file()]
+        if len(files) <= self.max_files:
+            return
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in files[:len(files) - self.max_files]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass  # Pruned concurrently by another worker
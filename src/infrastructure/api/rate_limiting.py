@@ -0,0 +1,138 @@
+import functools
+import hashlib
+import json
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from src.infrastructure.logging.logger import logger
+
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class TokenBucketLimiter:
+    """
+    Token buckets keyed by client, refilled lazily on access.
+
+    Each client costs one OrderedDict entry holding [tokens, last_refill]; the
+    least recently seen clients are evicted beyond `max_keys`. Not thread-safe:
+    meant to be used from the event loop only.
+    """
+
+    def __init__(self, rate: float, burst: float, max_keys: int = 100_000,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+
+    def acquire(self, key: str) -> float:
+        """Take one token for `key`. Return 0 if allowed, else the seconds until a token is available."""
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [self.burst, now]
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return 0.0
+        return (1 - bucket[0]) / self.rate
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+# Health probes are never limited, or a busy node would be restarted / taken out of rotation
+UNLIMITED_PATH_PREFIX = "/health/"
+
+
+def api_key_digest(key: bytes) -> str:
+    return hashlib.sha256(key).hexdigest()
+
+
+def client_key(scope: dict, api_keys: frozenset = frozenset()) -> str:
+    """
+    Identify a client by its IP address, or by its `X-API-Key` header when it is
+    one of the known `api_keys` (their `api_key_digest`). Unknown keys are ignored,
+    so sending a new key per request neither escapes the IP's budget nor evicts
+    other clients' buckets. Clients behind the same NAT or proxy share one budget
+    (run uvicorn with `--proxy-headers` so the IP is taken from `X-Forwarded-For`).
+    """
+    if api_keys:
+        for name, value in scope.get("headers", ()):
+            if name == b"x-api-key":
+                digest = api_key_digest(value)
+                if digest in api_keys:
+                    return "key:" + digest[:16]  # Never the key itself: bucket keys are logged
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "unknown")
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware applying separate per-client budgets to reads and writes.
+    Rejected requests get `429 Too Many Requests` with a `Retry-After` header.
+    """
+
+    def __init__(self, app, read_limiter: TokenBucketLimiter, write_limiter: TokenBucketLimiter,
+                 key_func: Callable[[dict], str] = client_key):
+        self.app = app
+        self.read_limiter = read_limiter
+        self.write_limiter = write_limiter
+        self.key_func = key_func
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(UNLIMITED_PATH_PREFIX):
+            return await self.app(scope, receive, send)
+
+        limiter = self.read_limiter if scope["method"] in READ_METHODS else self.write_limiter
+        key = self.key_func(scope)
+        wait = limiter.acquire(key)
+        if not wait:
+            return await self.app(scope, receive, send)
+
+        logger.warning(f"Rate limit exceeded for {key} on {scope['method']} {scope['path']}")
+        body = json.dumps({"detail": "Rate limit exceeded"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(math.ceil(wait)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    @classmethod
+    def options_from_env(cls) -> Optional[dict]:
+        """Middleware kwargs built from the environment, or None when rate limiting is disabled."""
+        if os.getenv("RATE_LIMIT_ENABLED", "false").lower() != "true":
+            return None
+        max_keys = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "100000"))
+        options = {
+            "read_limiter": TokenBucketLimiter(
+                rate=float(os.getenv("RATE_LIMIT_READS_PER_SECOND", "20")),
+                burst=float(os.getenv("RATE_LIMIT_READ_BURST", "40")),
+                max_keys=max_keys,
+            ),
+            "write_limiter": TokenBucketLimiter(
+                rate=float(os.getenv("RATE_LIMIT_WRITES_PER_SECOND", "5")),
+                burst=float(os.getenv("RATE_LIMIT_WRITE_BURST", "10")),
+                max_keys=max_keys,
+            ),
+        }
+        api_keys = [key.strip() for key in os.getenv("RATE_LIMIT_API_KEYS", "").split(",") if key.strip()]
+        if api_keys:
+            digests = frozenset(api_key_digest(key.encode("latin-1")) for key in api_keys)
+            options["key_func"] = functools.partial(client_key, api_keys=digests)
+        return options
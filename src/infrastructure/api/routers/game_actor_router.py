@@ -0,0 +1,77 @@
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Header, Request, Response
+from src.infrastructure.api.dependencies import get_game_actors, get_move_request
+from src.infrastructure.api import binary_codec
+from src.infrastructure.api.dtos import MoveRequest
+from src.infrastructure.api.serialization import FastJSONResponse, RawJSONResponse, dumps
+from src.infrastructure.logging.logger import logger
+from src.application.game_actors import GameActorSystem, GameBusy
+
+# Served from the game actors when GAME_ACTORS_ENABLED=true; mounted before the game router,
+# whose other endpoints still read the database
+router = APIRouter(default_response_class=FastJSONResponse)
+
+
+def busy(exc: GameBusy) -> HTTPException:
+    logger.warning(f"Shedding game actor request: {exc}")
+    return HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"})
+
+
+@router.post("/create")
+async def create_game(actors: GameActorSystem = Depends(get_game_actors)):
+    """Create a new game and return its unique ID."""
+    logger.info("POST /games/create called (actors)")
+    try:
+        game_id = await actors.create_game()
+    except GameBusy as e:
+        raise busy(e)
+    return FastJSONResponse({"gameId": game_id})
+
+
+@router.post("/move")
+async def move(
+    http_request: Request,
+    request: MoveRequest = Depends(get_move_request),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", min_length=1, max_length=255),
+    actors: GameActorSystem = Depends(get_game_actors)
+):
+    """Play a move in a given game, through the actor owning it."""
+    logger.info(
+        f"POST /games/move called with gameId={request.gameId}, "
+        f"playerId={request.playerId}, square=({request.square.x},{request.square.y}) (actors)"
+    )
+    try:
+        result = await actors.play_move(
+            request.gameId, request.playerId, request.square.x, request.square.y, idempotency_key
+        )
+    except GameBusy as e:
+        raise busy(e)
+    if not result.success:
+        raise HTTPException(status_code=400, detail=result.error)
+    headers = {"Idempotent-Replayed": "true"} if result.replayed else None
+    if binary_codec.accepts_binary(http_request.headers.get("accept")):
+        return Response(binary_codec.encode_move_response(result), media_type=binary_codec.BINARY_MEDIA_TYPE,
+                        headers=headers)
+    return FastJSONResponse({"status": result.message, "version": result.version}, headers=headers)
+
+
+@router.get("/status")
+async def status(
+    http_request: Request,
+    game_id: str,
+    min_version: Optional[int] = None,
+    actors: GameActorSystem = Depends(get_game_actors)
+):
+    """Fetch the current status of a game from the actor owning it (always its latest version)."""
+    logger.info(f"GET /games/status called with gameId={game_id} (actors)")
+    binary = binary_codec.accepts_binary(http_request.headers.get("accept"))
+    render = binary_codec.encode_status if binary else dumps
+    try:
+        payload = await actors.ask(game_id, lambda service: service.get_status_payload(game_id, render, min_version))
+    except GameBusy as e:
+        raise busy(e)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    if binary:
+        return Response(payload, media_type=binary_codec.BINARY_MEDIA_TYPE)
+    return RawJSONResponse(payload)
@@ -1,23 +1,44 @@
-from fastapi import APIRouter, HTTPException, Depends
-from src.infrastructure.api.dependencies import get_game_service
-from src.infrastructure.api.dtos import MoveRequest
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Request, Response
+from src.infrastructure.api.dependencies import get_game_service, get_move_request
+from src.infrastructure.api import binary_codec
+from src.infrastructure.api.dtos import MoveRequest, BatchStatusRequest
+from src.infrastructure.api.profiling import profiled
+from src.infrastructure.api.serialization import FastJSONResponse, RawJSONResponse, dumps
+from src.infrastructure.tracing.spans import traced
 from src.infrastructure.logging.logger import logger
 from src.application.game_service import GameService  # for typing
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 
 @router.post("/create")
+@profiled
+@traced("router.create", endpoint=True)
 def create_game(service: GameService = Depends(get_game_service)):
     """Create a new game and return its unique ID."""
     logger.info("POST /games/create called")
     game_id = service.create_game()
-    return {"gameId": game_id}
+    return FastJSONResponse({"gameId": game_id})
 
 
-@router.post("/move")
-def move(request: MoveRequest, service: GameService = Depends(get_game_service)):
-    """Play a move in a given game."""
+@router.post("/move", openapi_extra={"requestBody": {"required": True, "content": {
+    "application/json": {"schema": MoveRequest.model_json_schema()},
+    binary_codec.BINARY_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+}}})
+@profiled
+@traced("router.move", endpoint=True)
+def move(
+    http_request: Request,
+    request: MoveRequest = Depends(get_move_request),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", min_length=1, max_length=255),
+    service: GameService = Depends(get_game_service)
+):
+    """Play a move in a given game.
+    Send and accept `application/x-tictactoe` for the compact binary encoding.
+    Send an `Idempotency-Key` to retry safely: a retry of an accepted move returns
+    the original result, marked with `Idempotent-Replayed: true`.
+    """
     logger.info(
         f"POST /games/move called with gameId={request.gameId}, "
         f"playerId={request.playerId}, square=({request.square.x},{request.square.y})"
@@ -26,18 +47,71 @@ def move(request: MoveRequest, service: GameService = Depends(get_game_service))
         request.gameId,
         request.playerId,
         request.square.x,
-        request.square.y
+        request.square.y,
+        idempotency_key
     )
     if not result.success:
         raise HTTPException(status_code=400, detail=result.error)
-    return {"status": result.message}
+    headers = {"Idempotent-Replayed": "true"} if result.replayed else None
+    if binary_codec.accepts_binary(http_request.headers.get("accept")):
+        return Response(binary_codec.encode_move_response(result), media_type=binary_codec.BINARY_MEDIA_TYPE,
+                        headers=headers)
+    return FastJSONResponse({"status": result.message, "version": result.version}, headers=headers)
 
 
 @router.get("/status")
-def status(game_id: str, service: GameService = Depends(get_game_service)):
-    """Fetch the current status of a game."""
-    logger.info(f"GET /games/status called with gameId={game_id}")
-    result = service.get_status(game_id)
-    if not result:
+@profiled
+@traced("router.status", endpoint=True)
+def status(
+    http_request: Request,
+    game_id: str,
+    min_version: Optional[int] = None,
+    service: GameService = Depends(get_game_service)
+):
+    """Fetch the current status of a game.
+    Pass the `version` returned by a move as `min_version` to read your own writes.
+    Accept `application/x-tictactoe` for the compact binary encoding.
+    """
+    logger.info(f"GET /games/status called with gameId={game_id}, min_version={min_version}")
+    binary = binary_codec.accepts_binary(http_request.headers.get("accept"))
+    payload = service.get_status_payload(game_id, binary_codec.encode_status if binary else dumps, min_version)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Game not found")
-    return result
+    if binary:
+        return Response(payload, media_type=binary_codec.BINARY_MEDIA_TYPE)
+    return RawJSONResponse(payload)
+
+
+@router.post("/status/batch")
+@profiled
+@traced("router.status_batch", endpoint=True)
+def status_batch(request: BatchStatusRequest, service: GameService = Depends(get_game_service)):
+    """Fetch the status of several games at once. Unknown games are left out."""
+    logger.info(f"POST /games/status/batch called with {len(request.gameIds)} game IDs")
+    return FastJSONResponse(service.get_statuses(request.gameIds))
+
+
+@router.get("/list")
+@profiled
+@traced("router.list", endpoint=True)
+def list_games(
+    limit: int = Query(50, ge=1, le=500),
+    after: Optional[str] = None,
+    service: GameService = Depends(get_game_service)
+):
+    """List game IDs in ascending order. Pass the last ID returned as `after` to get the next page."""
+    logger.info(f"GET /games/list called with limit={limit}, after={after}")
+    game_ids = service.list_games(limit, after)
+    return FastJSONResponse({"gameIds": game_ids, "next": game_ids[-1] if len(game_ids) == limit else None})
+
+
+@router.get("/stats")
+@profiled
+@traced("router.stats", endpoint=True)
+def stats(service: GameService = Depends(get_game_service)):
+    """Fetch aggregate game counters and first-move win rates."""
+    logger.info("GET /games/stats called")
+    result = service.get_stats()
+    if not result:
+        raise HTTPException(status_code=503, detail="Game stats are not available")
+    return FastJSONResponse(result)
@@ -0,0 +1,25 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from src.infrastructure.startup import startup_report
+
+router = APIRouter()
+
+
+@router.get("/live")
+def live():
+    """Liveness: the process is up and serving requests (never touches the database)."""
+    return {"status": "alive"}
+
+
+@router.get("/ready")
+def ready():
+    """Readiness: the schema is up to date and the connection pool is warm."""
+    if not startup_report.ready:
+        return JSONResponse(status_code=503, content={"status": "starting", "error": startup_report.error})
+    return {"status": "ready"}
+
+
+@router.get("/startup")
+def startup():
+    """Timing report of the startup phases of this process."""
+    return startup_report.to_dict()
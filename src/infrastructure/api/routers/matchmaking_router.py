@@ -0,0 +1,54 @@
+import asyncio
+import os
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from src.infrastructure.api.dependencies import get_matchmaking_service
+from src.infrastructure.api.dtos import JoinRequest
+from src.infrastructure.logging.logger import logger
+from src.application.matchmaking_service import MatchmakingService, MatchmakingQueueFull
+
+router = APIRouter()
+
+MAX_WAIT_SECONDS = float(os.getenv("MATCHMAKING_TIMEOUT_SECONDS", "30"))
+DISCONNECT_POLL_SECONDS = 1.0
+
+
+async def _until_disconnected(http_request: Request) -> None:
+    while not await http_request.is_disconnected():
+        await asyncio.sleep(DISCONNECT_POLL_SECONDS)
+
+
+@router.post("/join")
+async def join(
+    http_request: Request,
+    request: Optional[JoinRequest] = None,
+    service: MatchmakingService = Depends(get_matchmaking_service)
+):
+    """
+    Long-poll until paired with an opponent, then return the game ID and assigned side.
+    A client going away leaves the queue, rather than being paired into a game nobody plays.
+    """
+    request = request or JoinRequest()
+    timeout = min(request.timeout or MAX_WAIT_SECONDS, MAX_WAIT_SECONDS)
+    logger.info(f"POST /matchmaking/join called with rating={request.rating}, timeout={timeout}")
+    pairing = asyncio.ensure_future(service.join(request.rating, timeout))
+    disconnected = asyncio.ensure_future(_until_disconnected(http_request))
+    try:
+        await asyncio.wait([pairing, disconnected], return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        pairing.cancel()
+        raise
+    finally:
+        disconnected.cancel()
+    if not pairing.done():
+        logger.info("Matchmaking client disconnected, leaving the queue")
+        pairing.cancel()
+        await asyncio.wait([pairing])
+        return Response(status_code=499)
+    try:
+        assignment = pairing.result()
+    except MatchmakingQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    if not assignment:
+        raise HTTPException(status_code=408, detail="No opponent found, try again")
+    return {"gameId": assignment.game_id, "playerId": assignment.player}
@@ -0,0 +1,41 @@
+import dataclasses
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
+
+def _default(obj: Any):
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize to compact JSON bytes. Dataclasses (our DTOs) are serialized natively."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson when available.
+    Returning it from an endpoint skips FastAPI's `jsonable_encoder` pass, so only
+    return content made of plain types and DTO dataclasses.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class RawJSONResponse(JSONResponse):
+    """Response for an already serialized JSON payload."""
+
+    def render(self, content: bytes) -> bytes:
+        return content
@@ -0,0 +1,205 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from src.domain.entities.game import Game
+from src.domain.value_objects.player import Player
+from src.infrastructure.logging.logger import logger
+
+# File layout: a header, then `buckets * ways` fixed-size slots. A game lives in one
+# of the `ways` slots of the bucket picked by the hash of its ID.
+#
+#   header  magic[8] layout[4] buckets[4] ways[4]                              20 bytes
+#   slot    seq[4] key[16] version[4] board[4] flags[1] pad[3] stored_at[8]   40 bytes
+#
+# `key` is the blake2b digest of the game ID (all zeros: empty slot). The board
+# and flags use the binary protocol's packing: 2 bits per cell (0 empty, 1 X,
+# 2 O); flags bits 0-1 next player, bits 2-3 winner, bit 4 finished.
+# `seq` is a seqlock: odd while the slot is being written (and left odd by a
+# process that crashed mid-write, until the slot's next write).
+HEADER = struct.Struct("<8sIII")
+SLOT = struct.Struct("<I16sIIB3xd")
+SEQ = struct.Struct("<I")
+FIELDS = struct.Struct("<16sIIB3xd")  # The slot after its seq
+MAGIC = b"TTTGAMES"
+LAYOUT_VERSION = 1
+EMPTY_KEY = bytes(16)
+READ_RETRIES = 8
+THREAD_LOCK_STRIPES = 64
+
+_CODES = {None: 0, Player.X: 1, Player.O: 2}
+_PLAYERS = (None, Player.X, Player.O, None)
+_FINISHED = 0x10
+
+
+class SharedGameCache:
+    """
+    Cache of active game states shared by every worker process of a node,
+    in a memory-mapped file (on /dev/shm by default): its size is fixed,
+    whatever the number of workers.
+
+    Reads take no lock: they copy a slot and retry if its seqlock shows a
+    concurrent write. Writers are serialized per bucket by a thread lock and an
+    fcntl byte-range lock (shared by the processes). A slot never goes back to
+    an older version of its game; entries from other nodes' writes are bounded
+    by `ttl_seconds` of staleness. The file persists across restarts, and is
+    reused if its layout matches.
+    """
+
+    def __init__(self, path: str, slots: int = 65_536, ways: int = 4, ttl_seconds: float = 5,
+                 clock: Callable[[], float] = time.time):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._thread_locks = [threading.Lock() for _ in range(THREAD_LOCK_STRIPES)]
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self._map, self.buckets, self.ways = self._open(max(1, slots // ways), ways)
+        except Exception:
+            os.close(self._fd)
+            raise
+
+    @classmethod
+    def from_env(cls) -> Optional["SharedGameCache"]:
+        """The node's shared cache if SHARED_GAME_CACHE_ENABLED=true, else None."""
+        if os.getenv("SHARED_GAME_CACHE_ENABLED", "false").lower() != "true":
+            return None
+        default_dir = "/dev/shm" if os.path.isdir("/dev/shm") else "/tmp"
+        return cls(
+            os.getenv("SHARED_GAME_CACHE_PATH", os.path.join(default_dir, "tictactoe-games")),
+            slots=int(os.getenv("SHARED_GAME_CACHE_SLOTS", "65536")),
+            ttl_seconds=float(os.getenv("SHARED_GAME_CACHE_TTL_SECONDS", "5")),
+        )
+
+    @property
+    def size(self) -> int:
+        """Bytes of shared memory used, the same for every process attached."""
+        return len(self._map)
+
+    def get(self, game_id: str, min_version: Optional[int] = None) -> Optional[Game]:
+        """The cached state of a game if fresh (and at least `min_version`), else None."""
+        key = self._key(game_id)
+        base = self._bucket_offset(key)
+        for way in range(self.ways):
+            entry = self._read(base + way * SLOT.size)
+            if entry is None or entry[1] != key:
+                continue
+            _, _, version, board, flags, stored_at = entry
+            if self.clock() - stored_at > self.ttl_seconds or (min_version is not None and version < min_version):
+                return None
+            return self._to_game(game_id, version, board, flags)
+        return None
+
+    def put(self, game: Game) -> None:
+        """Store the state of a game, unless a newer version of it is already cached."""
+        key = self._key(game.game_id)
+        base = self._bucket_offset(key)
+        with self._write_lock(base):
+            target = empty = oldest = None
+            for way in range(self.ways):
+                offset = base + way * SLOT.size
+                _, slot_key, version, _, _, stored_at = SLOT.unpack_from(self._map, offset)
+                if slot_key == key:
+                    if version > game.version:
+                        return
+                    target = offset
+                    break
+                if slot_key == EMPTY_KEY:
+                    empty = empty if empty is not None else offset
+                elif oldest is None or stored_at < oldest[0]:
+                    oldest = (stored_at, offset)
+            if target is None:
+                target = empty if empty is not None else oldest[1]
+
+            # Odd while writing, even after, whatever a writer that crashed mid-write left behind
+            writing = SEQ.unpack_from(self._map, target)[0] | 1
+            SEQ.pack_into(self._map, target, writing)
+            FIELDS.pack_into(self._map, target + SEQ.size, key, game.version, *self._pack(game), self.clock())
+            SEQ.pack_into(self._map, target, (writing + 1) & 0xFFFFFFFF)
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+    # ----- Private helpers -----
+    def _open(self, buckets: int, ways: int) -> tuple[mmap.mmap, int, int]:
+        """Map the file, initializing it if this process is the first (under a lock on the header)."""
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, HEADER.size, 0)
+        try:
+            size = os.fstat(self._fd).st_size
+            if size == 0:
+                size = HEADER.size + buckets * ways * SLOT.size
+                os.ftruncate(self._fd, size)
+                shared = mmap.mmap(self._fd, size)
+                HEADER.pack_into(shared, 0, MAGIC, LAYOUT_VERSION, buckets, ways)
+                logger.info(f"Shared game cache created at {self.path} ({size} bytes)")
+                return shared, buckets, ways
+
+            shared = mmap.mmap(self._fd, size)
+            magic, layout, existing_buckets, existing_ways = HEADER.unpack_from(shared, 0)
+            if magic != MAGIC or layout != LAYOUT_VERSION or size != HEADER.size + existing_buckets * existing_ways * SLOT.size:
+                shared.close()
+                raise ValueError(f"{self.path} is not a shared game cache of this version, remove it")
+            if (existing_buckets, existing_ways) != (buckets, ways):
+                logger.warning(f"Shared game cache at {self.path} has {existing_buckets * existing_ways} slots, using it")
+            return shared, existing_buckets, existing_ways
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, HEADER.size, 0)
+
+    @staticmethod
+    def _key(game_id: str) -> bytes:
+        return hashlib.blake2b(game_id.encode(), digest_size=16).digest()
+
+    def _bucket_offset(self, key: bytes) -> int:
+        bucket = int.from_bytes(key[:8], "little") % self.buckets
+        return HEADER.size + bucket * self.ways * SLOT.size
+
+    def _read(self, offset: int) -> Optional[tuple]:
+        """Copy a slot consistently, or None if it kept being written meanwhile."""
+        for _ in range(READ_RETRIES):
+            before = SEQ.unpack_from(self._map, offset)[0]
+            if before & 1:
+                continue
+            entry = SLOT.unpack_from(self._map, offset)
+            if SEQ.unpack_from(self._map, offset)[0] == before == entry[0]:
+                return entry
+        return None
+
+    @contextmanager
+    def _write_lock(self, offset: int) -> Iterator[None]:
+        """Exclude the other writers of a bucket: threads of this process, then other processes."""
+        bucket = (offset - HEADER.size) // (self.ways * SLOT.size)
+        with self._thread_locks[bucket % THREAD_LOCK_STRIPES]:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, offset)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, offset)
+
+    @staticmethod
+    def _pack(game: Game) -> tuple[int, int]:
+        board = 0
+        for i, cell in enumerate(cell for row in game.board.grid for cell in row):
+            board |= _CODES[cell] << (2 * i)
+        flags = _CODES[None if game.is_finished else game.next_player] | _CODES[game.winner] << 2
+        if game.is_finished:
+            flags |= _FINISHED
+        return board, flags
+
+    @staticmethod
+    def _to_game(game_id: str, version: int, board: int, flags: int) -> Game:
+        """Rebuild a game for reading (its opening square is not cached)."""
+        cells = [_PLAYERS[(board >> (2 * i)) & 3] for i in range(9)]
+        game = Game(game_id)
+        game.board.grid = [cells[0:3], cells[3:6], cells[6:9]]
+        game.next_player = _PLAYERS[flags & 3]
+        game.winner = _PLAYERS[(flags >> 2) & 3]
+        game.is_finished = bool(flags & _FINISHED)
+        game.version = version
+        return game
@@ -0,0 +1,124 @@
+"""Move games to the shard owning them after the set of shards changed.
+
+Usage:
+    DB_SHARD_HOSTS=db1:5432,db2:5432,db3:5432 \\
+    python -m src.infrastructure.commands.rebalance_shards --previous db1:5432,db2:5432
+
+Games, then the idempotency keys of their moves, are copied to their new shard
+before being deleted from the old one, batch by batch, so the command can be
+interrupted and re-run safely.
+Stats counters stay where they are: the global stats are the sum of all shards.
+
+Run the application with DB_SHARD_PREVIOUS_HOSTS set to the previous shards
+until the command is done: games and keys not moved yet are then read from
+their previous shard, and a game written on its new shard meanwhile is not
+overwritten by its older copy.
+"""
+import argparse
+from typing import Optional
+from sqlalchemy.orm import Session, sessionmaker
+from src.infrastructure.db.models import GameModel, ArchivedGameModel, IdempotencyKeyModel
+from src.infrastructure.db.session import get_shard_hosts, get_shard_session_factories
+from src.infrastructure.db.sharding import ConsistentHashRing
+from src.infrastructure.logging.logger import logger
+
+# Tables moved, in order. Keys go last: a retry finds them on the previous shard until then
+MOVED_MODELS = (GameModel, ArchivedGameModel, IdempotencyKeyModel)
+# Tables whose rows are rewritten by moves: the copy with the highest version wins
+VERSIONED_MODELS = (GameModel, ArchivedGameModel)
+
+
+def rebalance(factories: dict[str, sessionmaker], ring: ConsistentHashRing,
+              sources: Optional[list[str]] = None, batch_size: int = 500) -> int:
+    """
+    Move every game (hot or archived) and idempotency key stored on one of `sources`
+    (default: all shards) that `ring` assigns to another shard. Return the number of rows moved.
+    """
+    moved = 0
+    for shard in sources or list(factories):
+        for model in MOVED_MODELS:
+            moved += _rebalance_table(factories, ring, shard, model, batch_size)
+    return moved
+
+
+def _rebalance_table(factories, ring, shard, model, batch_size) -> int:
+    """Move the rows of `batch_size` games at a time, paging through the game IDs of the table."""
+    moved, after = 0, None
+    columns = [column.name for column in model.__table__.columns]
+    source = factories[shard]()
+    try:
+        while True:
+            query = source.query(model.game_id).distinct().order_by(model.game_id)
+            if after is not None:
+                query = query.filter(model.game_id > after)
+            game_ids = [game_id for (game_id,) in query.limit(batch_size).all()]
+            if not game_ids:
+                return moved
+            after = game_ids[-1]
+
+            targets: dict[str, list[str]] = {}
+            for game_id in game_ids:
+                owner = ring.shard_for(game_id)
+                if owner != shard:
+                    targets.setdefault(owner, []).append(game_id)
+            for owner, ids in targets.items():
+                rows = source.query(model).filter(model.game_id.in_(ids)).all()
+                values = [{name: getattr(row, name) for name in columns} for row in rows]
+                target = factories[owner]()
+                try:
+                    _copy_rows(target, model, values)
+                    target.commit()
+                finally:
+                    target.close()
+                source.query(model).filter(model.game_id.in_(ids)).delete(synchronize_session=False)
+                source.commit()
+                moved += len(values)
+                logger.info(f"Moved {len(values)} rows of {model.__tablename__} from {shard} to {owner}")
+    finally:
+        source.close()
+
+
+def _copy_rows(db: Session, model, values: list[dict]) -> None:
+    """
+    Insert rows on their new shard in one statement. A row already there is kept
+    unless older (a game written on the new shard since the ring changed is newer);
+    checking and writing in the same statement leaves no window for a concurrent move.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"Rebalancing needs INSERT ... ON CONFLICT, not available on {dialect}")
+    statement = insert(model).values(values)
+    keys = [column.name for column in model.__table__.primary_key]
+    if model not in VERSIONED_MODELS:
+        db.execute(statement.on_conflict_do_nothing(index_elements=keys))
+        return
+    db.execute(statement.on_conflict_do_update(
+        index_elements=keys,
+        set_={name: statement.excluded[name] for name in values[0] if name not in keys},
+        where=model.version < statement.excluded.version,
+    ))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--previous", required=True, help="Comma-separated shard hosts before the change")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    current = get_shard_hosts()
+    previous = [host.strip() for host in args.previous.split(",") if host.strip()]
+    missing = [host for host in previous if host not in current]
+    if missing:
+        raise SystemExit(f"Previous shards must still be configured in DB_SHARD_HOSTS: {missing}")
+
+    # Only the previous shards can hold misplaced games
+    moved = rebalance(get_shard_session_factories(), ConsistentHashRing(current), previous, args.batch_size)
+    logger.info(f"Rebalancing done: {moved} rows moved across {len(current)} shards")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Recompute the aggregate game counters from scratch.
+
+Usage: python -m src.infrastructure.commands.rebuild_stats
+"""
+from src.infrastructure.db.session import get_session, get_shard_sessions
+from src.infrastructure.repositories.game_stats_repository_impl import GameStatsRepositoryImpl
+from src.infrastructure.repositories.sharded_game_stats_repository import ShardedGameStatsRepository
+from src.infrastructure.logging.logger import logger
+
+
+def main() -> None:
+    db = get_session()
+    shards = get_shard_sessions()
+    try:
+        stats_repo = ShardedGameStatsRepository(shards) if shards else GameStatsRepositoryImpl(db)
+        stats = stats_repo.rebuild()
+        logger.info(
+            f"Stats rebuilt: total={stats.total_games}, active={stats.active_games}, "
+            f"finished={stats.finished_games}, x_wins={stats.x_wins}, "
+            f"o_wins={stats.o_wins}, draws={stats.draws}"
+        )
+    finally:
+        db.close()
+        if shards:
+            shards.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Run a bot-vs-bot tournament on a process pool and print the standings.
+
+Usage:
+    python -m src.infrastructure.commands.run_tournament --bots random,greedy,minimax --games 1000
+    python -m src.infrastructure.commands.run_tournament --format swiss --rounds 5 --store
+
+Stored games do not update the stats counters: run rebuild_stats afterwards.
+"""
+import argparse
+
+from src.application.bots import BOTS
+from src.application.tournament_service import TournamentService
+from src.infrastructure.db.session import get_session, get_shard_sessions
+from src.infrastructure.repositories.game_repository_impl import GameRepositoryImpl
+from src.infrastructure.repositories.sharded_game_repository import ShardedGameRepository
+from src.infrastructure.logging.logger import logger
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bots", default=",".join(BOTS), help=f"Comma-separated bots among: {', '.join(BOTS)}")
+    parser.add_argument("--format", choices=["round-robin", "swiss"], default="round-robin")
+    parser.add_argument("--games", type=int, default=100, help="Games per pairing (and side, in round-robin)")
+    parser.add_argument("--rounds", type=int, default=5, help="Swiss rounds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per core, 0: in-process)")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--store", action="store_true", help="Store the games in the database")
+    args = parser.parse_args()
+
+    bots = [bot.strip() for bot in args.bots.split(",") if bot.strip()]
+    unknown = [bot for bot in bots if bot not in BOTS]
+    if unknown:
+        raise SystemExit(f"Unknown bots: {unknown}")
+
+    db = get_session() if args.store else None
+    shards = get_shard_sessions() if args.store else None
+    try:
+        repo = (ShardedGameRepository(shards) if shards else GameRepositoryImpl(db)) if args.store else None
+        service = TournamentService(repo, workers=args.workers, chunk_size=args.chunk_size)
+        if args.format == "swiss":
+            result = service.run_swiss(bots, args.rounds, args.games, seed=args.seed)
+        else:
+            result = service.run_round_robin(bots, args.games, seed=args.seed)
+    finally:
+        if db:
+            db.close()
+        if shards:
+            shards.close()
+
+    for rank, standing in enumerate(result.standings, 1):
+        logger.info(
+            f"{rank}. {standing.bot}: {standing.points} pts "
+            f"({standing.wins}W {standing.draws}D {standing.losses}L in {standing.played}"
+            + (f", {standing.byes} bye(s))" if standing.byes else ")")
+        )
+
+
+if __name__ == "__main__":
+    main()
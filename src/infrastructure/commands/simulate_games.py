@@ -0,0 +1,62 @@
+"""Simulate random or greedy games in bulk, for opening analyses and load-test data.
+
+Usage:
+    python -m src.infrastructure.commands.simulate_games --games 1000000 --out games.jsonl
+    python -m src.infrastructure.commands.simulate_games --games 100000 --store
+
+Stored games do not update the stats counters: run rebuild_stats afterwards.
+Requires numpy (listed in requirements.txt).
+"""
+import argparse
+import json
+
+from src.infrastructure.db.session import get_session, get_shard_sessions
+from src.infrastructure.repositories.game_repository_impl import GameRepositoryImpl
+from src.infrastructure.repositories.sharded_game_repository import ShardedGameRepository
+from src.infrastructure.simulation.batch_simulator import (
+    BatchSimulator, greedy_policy, random_policy, write_jsonl, write_to_repository
+)
+from src.infrastructure.logging.logger import logger
+
+POLICIES = {"random": random_policy, "greedy": greedy_policy}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, required=True)
+    parser.add_argument("--policy-x", choices=POLICIES, default="random")
+    parser.add_argument("--policy-o", choices=POLICIES, default="random")
+    parser.add_argument("--opening", help='Force X\'s opening square, as "x,y"')
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--out", help="Write the games to this JSON lines file")
+    parser.add_argument("--store", action="store_true", help="Store the games in the database")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    opening = None
+    if args.opening:
+        x, y = (int(v) for v in args.opening.split(","))
+        opening = (y - 1) * 3 + (x - 1)
+
+    simulator = BatchSimulator(POLICIES[args.policy_x], POLICIES[args.policy_o], seed=args.seed)
+    result = simulator.simulate(args.games, opening)
+    logger.info(f"Simulated {len(result)} games, outcomes per opening: {json.dumps(result.opening_summary())}")
+
+    if args.out:
+        write_jsonl(result, args.out)
+        logger.info(f"Games written to {args.out}")
+    if args.store:
+        db = get_session()
+        shards = get_shard_sessions()
+        try:
+            repo = ShardedGameRepository(shards) if shards else GameRepositoryImpl(db)
+            stored = write_to_repository(result, repo, args.batch_size)
+            logger.info(f"{stored} games stored, run rebuild_stats to update the counters")
+        finally:
+            db.close()
+            if shards:
+                shards.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import os
+import threading
+
+
+class DatabaseOverloaded(Exception):
+    """Raised when no DB session slot frees up in time; the request should be shed."""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ConcurrencyLimiter:
+    """
+    Global cap on concurrently open DB sessions.
+
+    Callers wait at most `max_wait_seconds` for a slot, then are rejected instead
+    of piling up on the connection pool (whose own timeout is far longer).
+    """
+
+    def __init__(self, max_concurrent: int, max_wait_seconds: float = 0.05):
+        self.max_concurrent = max_concurrent
+        self.max_wait_seconds = max_wait_seconds
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+
+    @classmethod
+    def from_env(cls) -> "ConcurrencyLimiter":
+        return cls(
+            max_concurrent=int(os.getenv("DB_MAX_CONCURRENT_SESSIONS", "15")),
+            max_wait_seconds=int(os.getenv("DB_ADMISSION_MAX_WAIT_MS", "50")) / 1000,
+        )
+
+    def acquire(self) -> None:
+        if not self._slots.acquire(timeout=self.max_wait_seconds):
+            raise DatabaseOverloaded("Database is overloaded, try again later")
+
+    def release(self) -> None:
+        self._slots.release()
@@ -0,0 +1,85 @@
+import threading
+from typing import Callable, Optional
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import sessionmaker
+from src.infrastructure.db.migrations import ensure_schema
+from src.infrastructure.startup import StartupReport
+from src.infrastructure.logging.logger import logger
+
+
+def warm_pool(engine: Engine, connections: int) -> int:
+    """Open up to `connections` pooled connections at once and return them to the pool. Return how many."""
+    size = getattr(engine.pool, "size", None)
+    connections = min(connections, size()) if callable(size) else min(connections, 1)
+    opened = []
+    try:
+        for _ in range(connections):
+            connection = engine.connect()
+            opened.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+
+class DatabaseBootstrap:
+    """
+    Gets the databases ready in a background thread, so the process answers
+    liveness probes right away: creates the engines, brings each schema up to
+    date (a single version read once migrated) and warms its connection pool.
+    Retries every `retry_seconds` until it succeeds, then runs the `on_ready`
+    callbacks and marks the startup report ready.
+    """
+
+    def __init__(self, databases: Callable[[], dict[str, sessionmaker]], report: StartupReport,
+                 warmup_connections: int = 5, retry_seconds: float = 2,
+                 on_ready: Optional[Callable[[dict[str, sessionmaker]], None]] = None):
+        self.databases = databases
+        self.report = report
+        self.warmup_connections = warmup_connections
+        self.retry_seconds = retry_seconds
+        self.on_ready = on_ready
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> None:
+        with self.report.phase("create engines"):
+            databases = self.databases()
+        for name, factory in databases.items():
+            with self.report.phase(f"schema check ({name})"):
+                db = factory()
+                try:
+                    applied = ensure_schema(db)
+                finally:
+                    db.close()
+            if applied:
+                logger.info(f"Applied {applied} schema migrations on {name}.")
+            with self.report.phase(f"pool warm-up ({name})"):
+                warm_pool(factory.kw["bind"], self.warmup_connections)
+        if self.on_ready:
+            self.on_ready(databases)
+        self.report.mark_ready()
+        logger.info(f"Ready after {self.report.ready_after * 1000:.0f}ms: {self.report.to_dict()['phases']}")
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="db-bootstrap", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+                return
+            except Exception as e:
+                self.report.mark_failed(e)
+                logger.error(f"Database bootstrap failed, retrying in {self.retry_seconds}s: {e}", exc_info=True)
+                self._stop.wait(self.retry_seconds)
@@ -0,0 +1,22 @@
+from typing import Optional
+
+# Compact text encoding of a stored game's board and turn: 9 cells (row-major)
+# followed by the next player, "-" standing for an empty cell / no player.
+# E.g. [["X","O",None],["X",None,None],["O",None,None]] + "O" -> "XO-X--O--O"
+EMPTY = "-"
+STATE_LENGTH = 10
+
+BoardRows = list[list[Optional[str]]]
+
+
+def encode_state(board: BoardRows, next_player: Optional[str]) -> str:
+    """Encode a 3x3 board of "X"/"O"/None and the next player into 10 characters."""
+    return "".join(cell or EMPTY for row in board for cell in row) + (next_player or EMPTY)
+
+
+def decode_state(state: str) -> tuple[BoardRows, Optional[str]]:
+    """Decode a string produced by `encode_state` back into (board, next_player)."""
+    if len(state) != STATE_LENGTH:
+        raise ValueError(f"Invalid encoded game state: {state!r}")
+    cells = [None if c == EMPTY else c for c in state]
+    return [cells[0:3], cells[3:6], cells[6:9]], cells[9]
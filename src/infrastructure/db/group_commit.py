@@ -0,0 +1,170 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, Optional
+from sqlalchemy.orm import Session
+from src.infrastructure.db.admission import DatabaseOverloaded
+from src.infrastructure.logging.logger import logger
+
+# A write to apply on the flusher's session (add/merge rows, run UPDATEs...), never committing itself
+WriteOp = Callable[[Session], None]
+
+PENDING_OPS_KEY = "group_commit_pending_ops"
+
+
+def defer(db: Session, op: WriteOp) -> None:
+    """Queue a write on a request session, to be committed with the next write submitted for it."""
+    db.info.setdefault(PENDING_OPS_KEY, []).append(op)
+
+
+def take_pending(db: Session) -> list[WriteOp]:
+    """Remove and return the writes deferred on a session."""
+    return db.info.pop(PENDING_OPS_KEY, [])
+
+
+class _Write:
+    __slots__ = ("ops", "future")
+
+    def __init__(self, ops: list[WriteOp]):
+        self.ops = ops
+        self.future: Future = Future()
+
+
+class GroupCommitWriter:
+    """
+    Commits the writes of concurrent requests together, in one transaction.
+
+    A background thread opens a batch at the first queued write, then keeps
+    collecting until `max_batch_size` writes are queued or `max_delay_seconds`
+    have passed, and commits them all at once: one commit (and WAL flush)
+    for the whole batch. Callers block until their batch is committed, for at
+    most `write_timeout_seconds`. If a batch fails, its writes are retried one
+    transaction each so a single bad write only fails its own request. Once the
+    writer is stopping, new writes are refused and those it could not commit
+    before stopping are failed.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], max_batch_size: int = 64,
+                 max_delay_seconds: float = 0.005, max_queue_size: int = 10_000,
+                 write_timeout_seconds: float = 10):
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self.max_delay_seconds = max_delay_seconds
+        self.write_timeout_seconds = write_timeout_seconds
+        self._queue: queue.Queue[_Write] = queue.Queue(maxsize=max_queue_size)
+        self._stop = threading.Event()
+        self._lock = threading.Lock()  # Orders submissions against stop()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls, session_factory: Callable[[], Session]) -> "GroupCommitWriter":
+        return cls(
+            session_factory,
+            max_batch_size=int(os.getenv("GROUP_COMMIT_MAX_BATCH_SIZE", "64")),
+            max_delay_seconds=float(os.getenv("GROUP_COMMIT_MAX_DELAY_MS", "5")) / 1000,
+            max_queue_size=int(os.getenv("GROUP_COMMIT_MAX_QUEUE_SIZE", "10000")),
+            write_timeout_seconds=float(os.getenv("GROUP_COMMIT_WRITE_TIMEOUT_SECONDS", "10")),
+        )
+
+    def submit(self, ops: list[WriteOp]) -> Future:
+        """Queue writes to commit together. Raises DatabaseOverloaded when the queue is full or the writer stopping."""
+        write = _Write(ops)
+        with self._lock:
+            if self._thread is None:
+                raise RuntimeError("GroupCommitWriter is not started")
+            if self._stop.is_set():
+                raise DatabaseOverloaded("Database writer is shutting down")
+            try:
+                self._queue.put_nowait(write)
+            except queue.Full:
+                raise DatabaseOverloaded("Too many writes waiting to be committed") from None
+        return write.future
+
+    def write(self, ops: list[WriteOp], timeout: Optional[float] = None) -> None:
+        """
+        Queue writes and wait until they are committed, re-raising their error if they failed.
+        Raises DatabaseOverloaded if they are not committed within `timeout` (default
+        `write_timeout_seconds`); they may still be committed later.
+        """
+        try:
+            self.submit(ops).result(self.write_timeout_seconds if timeout is None else timeout)
+        except FutureTimeoutError:
+            raise DatabaseOverloaded("Write not committed in time, try again later") from None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="group-commit", daemon=True)
+            self._thread.start()
+            logger.info(f"Group commit writer started (batch={self.max_batch_size}, "
+                        f"delay={self.max_delay_seconds * 1000:g}ms)")
+
+    def stop(self, timeout: float = 10) -> None:
+        """Stop after committing the writes already queued, failing those not committed within `timeout`."""
+        if self._thread is not None:
+            with self._lock:
+                self._stop.set()
+            self._thread.join(timeout)
+            self._thread = None
+            self._fail_queued(DatabaseOverloaded("Database writer is shutting down"))
+
+    def _run(self) -> None:
+        while not (self._stop.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=0.1)]
+            except queue.Empty:
+                continue
+            deadline = time.monotonic() + self.max_delay_seconds
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _fail_queued(self, error: Exception) -> None:
+        failed = 0
+        while True:
+            try:
+                write = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            write.future.set_exception(error)
+            failed += 1
+        if failed:
+            logger.error(f"Group commit writer stopped with {failed} writes not committed")
+
+    def _flush(self, batch: list[_Write]) -> None:
+        db = self.session_factory()
+        try:
+            try:
+                for write in batch:
+                    for op in write.ops:
+                        op(db)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"Group commit of {len(batch)} writes failed, retrying one by one: {e}")
+                self._flush_one_by_one(db, batch)
+                return
+            for write in batch:
+                write.future.set_result(None)
+            logger.debug(f"Group committed {len(batch)} writes.")
+        finally:
+            db.close()
+
+    @staticmethod
+    def _flush_one_by_one(db: Session, batch: list[_Write]) -> None:
+        for write in batch:
+            try:
+                for op in write.ops:
+                    op(db)
+                db.commit()
+                write.future.set_result(None)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Write failed: {e}", exc_info=True)
+                write.future.set_exception(e)
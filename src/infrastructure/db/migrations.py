@@ -0,0 +1,205 @@
+from typing import Callable
+from sqlalchemy import inspect, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from src.infrastructure.db.models import SchemaVersionModel, utcnow
+from src.infrastructure.logging.logger import logger
+
+SCHEMA_VERSION_ID = 1
+# Serializes the migrations of replicas booting together against the same PostgreSQL database
+MIGRATION_LOCK_ID = 7_720_431
+
+
+# DDL of the tables as of schema version 1. Frozen: schema changes are new
+# migrations, never edits of these statements or of the models they came from.
+# Tables that already exist (games of the first release) are left as they are.
+SCHEMA_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    id INTEGER NOT NULL PRIMARY KEY,
+    version INTEGER NOT NULL,
+    migrated_at TIMESTAMP WITH TIME ZONE NOT NULL
+)"""
+
+TABLES_V1 = [
+    """
+    CREATE TABLE IF NOT EXISTS games (
+        game_id VARCHAR NOT NULL PRIMARY KEY,
+        board {json} NOT NULL,
+        next_player VARCHAR,
+        winner VARCHAR,
+        is_finished BOOLEAN NOT NULL,
+        first_move VARCHAR(3),
+        version INTEGER NOT NULL,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+        updated_at TIMESTAMP WITH TIME ZONE NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS ix_games_game_id ON games (game_id)",
+    """
+    CREATE TABLE IF NOT EXISTS games_archive (
+        game_id VARCHAR NOT NULL PRIMARY KEY,
+        state VARCHAR(10) NOT NULL,
+        winner VARCHAR(1),
+        first_move VARCHAR(3),
+        version INTEGER NOT NULL,
+        finished_at TIMESTAMP WITH TIME ZONE NOT NULL
+    )""",
+    """
+    CREATE TABLE IF NOT EXISTS game_stats (
+        id INTEGER NOT NULL PRIMARY KEY,
+        total_games BIGINT NOT NULL,
+        finished_games BIGINT NOT NULL,
+        x_wins BIGINT NOT NULL,
+        o_wins BIGINT NOT NULL,
+        draws BIGINT NOT NULL,
+        abandoned_games BIGINT NOT NULL
+    )""",
+    """
+    CREATE TABLE IF NOT EXISTS game_opening_stats (
+        square VARCHAR(3) NOT NULL PRIMARY KEY,
+        finished_games BIGINT NOT NULL,
+        x_wins BIGINT NOT NULL,
+        o_wins BIGINT NOT NULL,
+        draws BIGINT NOT NULL
+    )""",
+    """
+    CREATE TABLE IF NOT EXISTS move_idempotency_keys (
+        game_id VARCHAR NOT NULL,
+        key VARCHAR(255) NOT NULL,
+        move VARCHAR(4) NOT NULL,
+        message VARCHAR NOT NULL,
+        version INTEGER NOT NULL,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+        PRIMARY KEY (game_id, key)
+    )""",
+    "CREATE INDEX IF NOT EXISTS ix_move_idempotency_keys_created_at ON move_idempotency_keys (created_at)",
+]
+
+# Counter rows seeded by migrations, frozen too. Rows already there are left as they are.
+SEED_STATS_ROW = """
+INSERT INTO game_stats (id, total_games, finished_games, x_wins, o_wins, draws, abandoned_games)
+SELECT CAST(:id AS INTEGER), 0, 0, 0, 0, 0, 0
+WHERE NOT EXISTS (SELECT 1 FROM game_stats WHERE id = CAST(:id AS INTEGER))"""
+SEED_OPENING_STATS_ROW = """
+INSERT INTO game_opening_stats (square, finished_games, x_wins, o_wins, draws)
+SELECT CAST(:square AS VARCHAR(3)), 0, 0, 0, 0
+WHERE NOT EXISTS (SELECT 1 FROM game_opening_stats WHERE square = CAST(:square AS VARCHAR(3)))"""
+OPENING_SQUARES_V3 = [f"{x},{y}" for y in range(1, 4) for x in range(1, 4)]
+STATS_STRIPES_V4 = range(2, 17)
+
+
+# Rows stored before the game state was: it is read back from their result message, as worded then
+ADD_IDEMPOTENCY_GAME_STATE = [
+    "ALTER TABLE move_idempotency_keys ADD COLUMN winner VARCHAR(1)",
+    "ALTER TABLE move_idempotency_keys ADD COLUMN is_finished BOOLEAN NOT NULL DEFAULT FALSE",
+    """
+    UPDATE move_idempotency_keys SET winner = SUBSTR(move, 1, 1), is_finished = TRUE
+    WHERE message = 'Player ' || SUBSTR(move, 1, 1) || ' has won!'""",
+    "UPDATE move_idempotency_keys SET is_finished = TRUE WHERE message = 'The game is a draw'",
+]
+
+
+def _create_tables(db: Session) -> None:
+    json_type = "JSONB" if db.bind.dialect.name == "postgresql" else "JSON"
+    for statement in TABLES_V1:
+        db.execute(text(statement.format(json=json_type)))
+
+
+def _upgrade_games_table(db: Session) -> None:
+    """Add the columns `games` gained after the first release (stats, versioning, archival) if missing."""
+    columns = {column["name"] for column in inspect(db.connection()).get_columns("games")}
+    added = [
+        (name, ddl) for name, ddl in [
+            ("first_move", "VARCHAR(3)"),
+            ("version", "INTEGER NOT NULL DEFAULT 0"),
+            ("created_at", "TIMESTAMP WITH TIME ZONE"),
+            ("updated_at", "TIMESTAMP WITH TIME ZONE"),
+        ] if name not in columns
+    ]
+    for name, ddl in added:
+        db.execute(text(f"ALTER TABLE games ADD COLUMN {name} {ddl}"))
+    for name in ("created_at", "updated_at"):
+        if any(added_name == name for added_name, _ in added):
+            db.execute(text(f"UPDATE games SET {name} = :now"), {"now": utcnow()})
+            if db.bind.dialect.name == "postgresql":
+                db.execute(text(f"ALTER TABLE games ALTER COLUMN {name} SET NOT NULL"))
+    if added:
+        logger.info(f"Added columns {[name for name, _ in added]} to games.")
+    db.execute(text("CREATE INDEX IF NOT EXISTS ix_games_is_finished_updated_at ON games (is_finished, updated_at)"))
+
+
+def _seed_stats_rows(db: Session) -> None:
+    """The global counters row and one row per opening square."""
+    db.execute(text(SEED_STATS_ROW), [{"id": 1}])
+    db.execute(text(SEED_OPENING_STATS_ROW), [{"square": square} for square in OPENING_SQUARES_V3])
+
+
+def _seed_stats_stripes(db: Session) -> None:
+    """The rows the global counters were striped over (besides row 1) once migration 3 had shipped."""
+    db.execute(text(SEED_STATS_ROW), [{"id": stripe} for stripe in STATS_STRIPES_V4])
+
+
+def _add_idempotency_game_state(db: Session) -> None:
+    for statement in ADD_IDEMPOTENCY_GAME_STATE:
+        db.execute(text(statement))
+
+
+# Append only: (version, description, migration). Each runs once per database, in its own transaction.
+MIGRATIONS: list[tuple[int, str, Callable[[Session], None]]] = [
+    (1, "create tables", _create_tables),
+    (2, "upgrade games tables created before versioned migrations", _upgrade_games_table),
+    (3, "seed the stats counter rows", _seed_stats_rows),
+    (4, "seed the striped global stats rows", _seed_stats_stripes),
+    (5, "store the game state after each idempotent move", _add_idempotency_game_state),
+]
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def current_version(db: Session) -> int:
+    """Version of the last migration applied, 0 for a database never migrated."""
+    try:
+        return db.execute(
+            select(SchemaVersionModel.version).where(SchemaVersionModel.id == SCHEMA_VERSION_ID)
+        ).scalar() or 0
+    except DBAPIError:
+        db.rollback()  # No schema_version table yet
+        return 0
+
+
+def ensure_schema(db: Session) -> int:
+    """
+    Bring the database schema up to date and return the number of migrations applied.
+
+    Once migrated, this is a single primary-key read of `schema_version`. Otherwise
+    the pending migrations are applied in order, each in a transaction committing
+    the version it reaches. On PostgreSQL each transaction holds an advisory lock
+    and re-checks the version, so replicas booting together migrate only once.
+    """
+    if current_version(db) >= LATEST_VERSION:
+        db.rollback()  # End the read transaction, returning the connection to the pool
+        return 0
+
+    applied = 0
+    try:
+        _lock(db)
+        db.execute(text(SCHEMA_VERSION_TABLE))
+        db.commit()
+        for target, description, migrate in MIGRATIONS:
+            _lock(db)
+            if current_version(db) >= target:
+                db.rollback()
+                continue
+            migrate(db)
+            db.merge(SchemaVersionModel(id=SCHEMA_VERSION_ID, version=target))
+            db.commit()
+            applied += 1
+            logger.info(f"Applied schema migration {target}: {description}")
+        return applied
+    except Exception:
+        db.rollback()
+        raise
+
+
+def _lock(db: Session) -> None:
+    """Take the migration lock until the end of the current transaction (PostgreSQL only)."""
+    if db.bind.dialect.name == "postgresql":
+        db.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": MIGRATION_LOCK_ID})
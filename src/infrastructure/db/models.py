@@ -1,15 +1,101 @@
-from sqlalchemy import Column, String, Boolean
-from sqlalchemy.dialects.postgresql import JSONB
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, Boolean, Integer, BigInteger, JSON, DateTime, Index
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.types import TypeDecorator
 
 Base = declarative_base()
 
+
+class BoardType(TypeDecorator):
+    """
+    JSONB on PostgreSQL, plain JSON elsewhere (e.g. SQLite in local tests).
+    The PostgreSQL dialect is only imported once an engine uses it, keeping it off the import path.
+    """
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import JSONB
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(JSON())
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
 class GameModel(Base):
     """SQLAlchemy model representing a Tic-Tac-Toe game in the database."""
     __tablename__ = "games"
 
     game_id = Column(String, primary_key=True, index=True)
-    board = Column(JSONB, nullable=False)        # Board state: 3x3 list of "X", "O", or None
+    board = Column(BoardType, nullable=False)    # Board state: 3x3 list of "X", "O", or None
     next_player = Column(String, nullable=True)  # Next player: "X" or "O", None if game finished
     winner = Column(String, nullable=True)       # Winner: "X", "O" or None
     is_finished = Column(Boolean, default=False, nullable=False)
+    first_move = Column(String(3), nullable=True)  # Opening square as "x,y", None until the first move
+    version = Column(Integer, default=0, nullable=False)  # Moves played, lets readers detect stale copies
+    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False)
+
+    # Lets the archiver find old finished / abandoned games without scanning the table
+    __table_args__ = (Index("ix_games_is_finished_updated_at", "is_finished", "updated_at"),)
+
+
+class ArchivedGameModel(Base):
+    """Cold storage for finished games moved out of `games` by the archiver."""
+    __tablename__ = "games_archive"
+
+    game_id = Column(String, primary_key=True)
+    state = Column(String(10), nullable=False)     # Board + next player, see db.codec
+    winner = Column(String(1), nullable=True)      # Winner: "X", "O" or None for a draw
+    first_move = Column(String(3), nullable=True)  # Opening square as "x,y"
+    version = Column(Integer, default=0, nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class GameStatsModel(Base):
+    """Global game counters, striped over a few rows summed on read (see GameStatsRepositoryImpl)."""
+    __tablename__ = "game_stats"
+
+    id = Column(Integer, primary_key=True)
+    total_games = Column(BigInteger, default=0, nullable=False)
+    finished_games = Column(BigInteger, default=0, nullable=False)
+    x_wins = Column(BigInteger, default=0, nullable=False)
+    o_wins = Column(BigInteger, default=0, nullable=False)
+    draws = Column(BigInteger, default=0, nullable=False)
+    abandoned_games = Column(BigInteger, default=0, nullable=False)  # Unfinished games purged after their TTL
+
+
+class OpeningStatsModel(Base):
+    """Outcome counters of finished games, one row per opening square."""
+    __tablename__ = "game_opening_stats"
+
+    square = Column(String(3), primary_key=True)  # Opening square as "x,y"
+    finished_games = Column(BigInteger, default=0, nullable=False)
+    x_wins = Column(BigInteger, default=0, nullable=False)
+    o_wins = Column(BigInteger, default=0, nullable=False)
+    draws = Column(BigInteger, default=0, nullable=False)
+
+
+class IdempotencyKeyModel(Base):
+    """Result of an accepted move, stored under the client's Idempotency-Key for its game."""
+    __tablename__ = "move_idempotency_keys"
+
+    game_id = Column(String, primary_key=True)
+    key = Column(String(255), primary_key=True)
+    move = Column(String(4), nullable=False)       # Player and square as "Xx,y"
+    message = Column(String, nullable=False)
+    version = Column(Integer, nullable=False)      # Game version after the move
+    winner = Column(String(1), nullable=True)      # Game state after the move: winner and whether finished
+    is_finished = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False, index=True)  # For the TTL purge
+
+
+class SchemaVersionModel(Base):
+    """Single-row table holding the version of the last schema migration applied (see db.migrations)."""
+    __tablename__ = "schema_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False)
+    migrated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False)
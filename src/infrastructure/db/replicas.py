@@ -0,0 +1,91 @@
+import itertools
+import threading
+import time
+from typing import Callable, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from src.infrastructure.logging.logger import logger
+
+
+class ReplicaPool:
+    """
+    Read replicas picked round-robin, skipping the ones marked unhealthy.
+
+    A replica is marked unhealthy when a read against it fails and is retried
+    after `cooldown_seconds`. When no replica is healthy callers should fall
+    back to the primary. Once started, a daemon thread also pings every replica
+    each `health_check_seconds`, so failed replicas are skipped before a read
+    hits them and recovered ones are used again before their cooldown ends.
+    """
+
+    def __init__(self, engines: list[Engine], cooldown_seconds: float = 30,
+                 clock: Callable[[], float] = time.monotonic, health_check_seconds: float = 10):
+        self.engines = engines
+        self.cooldown_seconds = cooldown_seconds
+        self.health_check_seconds = health_check_seconds
+        self._clock = clock
+        self._sessionmakers = {id(engine): sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                               for engine in engines}
+        self._unhealthy_until: dict[int, float] = {}
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def choose(self) -> Optional[Engine]:
+        """Return the next healthy replica, or None if none is available."""
+        now = self._clock()
+        for _ in range(len(self.engines)):
+            engine = self.engines[next(self._next) % len(self.engines)]
+            if self._unhealthy_until.get(id(engine), 0) <= now:
+                return engine
+        return None
+
+    def session(self, engine: Engine) -> Session:
+        return self._sessionmakers[id(engine)]()
+
+    def mark_failed(self, engine: Engine) -> None:
+        with self._lock:
+            self._unhealthy_until[id(engine)] = self._clock() + self.cooldown_seconds
+        logger.warning(f"Replica {engine.url.render_as_string()} marked unhealthy for {self.cooldown_seconds}s")
+
+    def mark_healthy(self, engine: Engine) -> None:
+        with self._lock:
+            self._unhealthy_until.pop(id(engine), None)
+
+    def check_health(self) -> int:
+        """Ping every replica, updating their health. Return the number of healthy replicas."""
+        healthy = 0
+        for engine in self.engines:
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                self.mark_healthy(engine)
+                healthy += 1
+            except Exception as e:
+                logger.warning(f"Replica health check failed: {e}")
+                self.mark_failed(engine)
+        return healthy
+
+    def start(self) -> None:
+        """Run `check_health` periodically in a daemon thread (not if `health_check_seconds` is 0)."""
+        if self.health_check_seconds <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="replica-health", daemon=True)
+        self._thread.start()
+        logger.info(f"Replica health checks started (interval={self.health_check_seconds}s)")
+
+    def stop(self, timeout: float = 10) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.health_check_seconds):
+            try:
+                self.check_health()
+            except Exception:
+                logger.error("Replica health check run failed", exc_info=True)
@@ -1,28 +1,138 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from src.infrastructure.db.admission import ConcurrencyLimiter
+from src.infrastructure.db.group_commit import GroupCommitWriter
+from src.infrastructure.db.replicas import ReplicaPool
+from src.infrastructure.db.sharding import ConsistentHashRing, ShardSessions
 import os
 
-def get_engine():
-    DATABASE_URL = (
+# Sheds requests before they queue on the connection pool
+db_admission = ConcurrencyLimiter.from_env()
+
+def get_database_url(host=None, port=None):
+    return (
         f"postgresql://{os.getenv('DB_USER','user')}:"
         f"{os.getenv('DB_PASSWORD','pass')}@"
-        f"{os.getenv('DB_HOST','localhost')}:"
-        f"{os.getenv('DB_PORT','5432')}/"
+        f"{host or os.getenv('DB_HOST','localhost')}:"
+        f"{port or os.getenv('DB_PORT','5432')}/"
         f"{os.getenv('DB_NAME','test_db')}"
     )
-    return create_engine(DATABASE_URL, echo=True)
+
+@lru_cache(maxsize=None)
+def get_engine():
+    """Build the process-wide engine (and its connection pool) once."""
+    return create_engine(get_database_url(), echo=True)
+
+@lru_cache(maxsize=None)
+def get_replica_pool():
+    """
+    Build the read replica pool from DB_REPLICA_HOSTS ("host[:port],host[:port]"),
+    using the primary's credentials and database name. None if no replica is set.
+    """
+    hosts = [h.strip() for h in os.getenv("DB_REPLICA_HOSTS", "").split(",") if h.strip()]
+    if not hosts:
+        return None
+    engines = [create_engine(get_database_url(*host.split(":", 1)), pool_pre_ping=True) for host in hosts]
+    return ReplicaPool(
+        engines,
+        cooldown_seconds=float(os.getenv("DB_REPLICA_COOLDOWN_SECONDS", "30")),
+        health_check_seconds=float(os.getenv("DB_REPLICA_HEALTH_CHECK_SECONDS", "10")),
+    )
+
+def get_shard_hosts():
+    """Shard hosts from DB_SHARD_HOSTS ("host[:port],host[:port]"); empty when not sharded."""
+    return [h.strip() for h in os.getenv("DB_SHARD_HOSTS", "").split(",") if h.strip()]
+
+@lru_cache(maxsize=None)
+def get_shard_session_factories():
+    """One pooled engine per shard, keyed by its host (the stable name used on the hash ring)."""
+    return {
+        host: sessionmaker(autocommit=False, autoflush=False, bind=create_engine(get_database_url(*host.split(":", 1))))
+        for host in get_shard_hosts()
+    }
+
+@lru_cache(maxsize=None)
+def get_shard_ring():
+    hosts = get_shard_hosts()
+    return ConsistentHashRing(hosts) if hosts else None
+
+@lru_cache(maxsize=None)
+def get_shard_previous_ring():
+    """
+    Ring of DB_SHARD_PREVIOUS_HOSTS, the shards before the last change, set while
+    rebalancing so games not moved yet are still found. None otherwise.
+    """
+    hosts = [h.strip() for h in os.getenv("DB_SHARD_PREVIOUS_HOSTS", "").split(",") if h.strip()]
+    return ConsistentHashRing(hosts) if hosts else None
+
+@lru_cache(maxsize=None)
+def get_shard_admission():
+    """One admission limiter per shard: each database gets the cap of the primary."""
+    return {host: ConcurrencyLimiter.from_env() for host in get_shard_hosts()}
+
+@lru_cache(maxsize=None)
+def get_shard_executor():
+    """Worker threads running scatter-gather queries across shards."""
+    return ThreadPoolExecutor(max_workers=int(os.getenv("SHARD_SCATTER_WORKERS", "16")),
+                              thread_name_prefix="shard-scatter")
+
+def get_shard_sessions():
+    """Open a set of lazily created shard sessions, or None when not sharded."""
+    ring = get_shard_ring()
+    if not ring:
+        return None
+    return ShardSessions(ring, get_shard_session_factories(), get_shard_executor(),
+                         previous_ring=get_shard_previous_ring(), admission=get_shard_admission())
+
+@lru_cache(maxsize=None)
+def get_session_factory():
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
 
 def get_session():
-    engine = get_engine()
-    return sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    return get_session_factory()()
+
+PRIMARY = "primary"
+
+def get_game_databases():
+    """Session factories of the databases holding the games: one per shard host, else PRIMARY."""
+    return get_shard_session_factories() or {PRIMARY: get_session_factory()}
+
+@lru_cache(maxsize=None)
+def get_group_commit_writers():
+    """
+    Group commit writers keyed by shard host (PRIMARY when not sharded), or an
+    empty dict unless GROUP_COMMIT_ENABLED=true. Started and stopped by the app.
+    """
+    if os.getenv("GROUP_COMMIT_ENABLED", "false").lower() != "true":
+        return {}
+    return {name: GroupCommitWriter.from_env(factory) for name, factory in get_game_databases().items()}
 
 def get_db():
     """
     Provides a SQLAlchemy database session.
+    Raises DatabaseOverloaded if too many sessions are already open.
     Ensures the session is closed after use.
     """
-    db = get_session()
+    db_admission.acquire()
+    try:
+        db = get_session()
+        try:
+            yield db
+        finally:
+            db.close()
+    finally:
+        db_admission.release()
+
+def get_shard_db():
+    """
+    Provides request-scoped shard sessions (None when not sharded).
+    Ensures every session opened on a shard is closed after use.
+    """
+    shards = get_shard_sessions()
     try:
-        yield db
+        yield shards
     finally:
-        db.close()
+        if shards:
+            shards.close()
@@ -0,0 +1,99 @@
+import bisect
+import hashlib
+from concurrent.futures import Executor
+from typing import Callable, Iterable, Optional, TypeVar
+from sqlalchemy.orm import Session, sessionmaker
+from src.infrastructure.db.admission import ConcurrencyLimiter
+
+T = TypeVar("T")
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing:
+    """
+    Maps keys (game IDs) to shards on a hash ring with virtual nodes.
+    Adding a shard only moves about 1/N of the keys, all of them to the new shard.
+    """
+
+    def __init__(self, shards: Iterable[str], vnodes: int = 100):
+        points = sorted((_hash(f"{shard}#{i}"), shard) for shard in shards for i in range(vnodes))
+        if not points:
+            raise ValueError("A hash ring needs at least one shard")
+        self._hashes = [h for h, _ in points]
+        self._shards = [shard for _, shard in points]
+        self.shards = sorted(set(self._shards))
+
+    def shard_for(self, key: str) -> str:
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._shards[index]
+
+    def group(self, keys: Iterable[str]) -> dict[str, list[str]]:
+        """Group keys by owning shard."""
+        groups: dict[str, list[str]] = {}
+        for key in keys:
+            groups.setdefault(self.shard_for(key), []).append(key)
+        return groups
+
+
+class ShardSessions:
+    """
+    Request-scoped sessions, one per shard, opened on first use.
+    Shared by the sharded repositories so a game and its stats commit together.
+
+    Each shard's sessions are admitted by that shard's ConcurrencyLimiter, if any
+    (raising DatabaseOverloaded). While games are being rebalanced, `previous_ring`
+    is the ring before the change: a game not found on its shard may still be on
+    the shard that owned it before.
+    """
+
+    def __init__(self, ring: ConsistentHashRing, factories: dict[str, sessionmaker], executor: Executor,
+                 previous_ring: Optional[ConsistentHashRing] = None,
+                 admission: Optional[dict[str, ConcurrencyLimiter]] = None):
+        self.ring = ring
+        self.factories = factories
+        self.executor = executor
+        self.previous_ring = previous_ring
+        self.admission = admission or {}
+        self._sessions: dict[str, Session] = {}
+
+    def session(self, shard: str) -> Session:
+        db = self._sessions.get(shard)
+        if db is None:
+            limiter = self.admission.get(shard)
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                db = self._sessions[shard] = self.factories[shard]()
+            except Exception:
+                if limiter is not None:
+                    limiter.release()
+                raise
+        return db
+
+    def session_for(self, game_id: str) -> Session:
+        return self.session(self.ring.shard_for(game_id))
+
+    def previous_shard_for(self, game_id: str) -> Optional[str]:
+        """The shard that owned a game before the ring changed, if rebalancing and it was another one."""
+        if self.previous_ring is None:
+            return None
+        shard = self.previous_ring.shard_for(game_id)
+        return shard if shard != self.ring.shard_for(game_id) else None
+
+    def scatter(self, shards: Iterable[str], fn: Callable[[Session, str], T]) -> dict[str, T]:
+        """Run `fn(session, shard)` on each shard in parallel and gather the results by shard."""
+        futures = {shard: self.executor.submit(fn, self.session(shard), shard) for shard in shards}
+        return {shard: future.result() for shard, future in futures.items()}
+
+    def close(self) -> None:
+        for shard, db in self._sessions.items():
+            try:
+                db.close()
+            finally:
+                limiter = self.admission.get(shard)
+                if limiter is not None:
+                    limiter.release()
+        self._sessions.clear()
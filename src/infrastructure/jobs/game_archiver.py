@@ -0,0 +1,184 @@
+import os
+import threading
+from datetime import timedelta
+from typing import Callable, Optional
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+from src.infrastructure.db.codec import encode_state
+from src.infrastructure.db.models import GameModel, ArchivedGameModel, IdempotencyKeyModel, utcnow
+from src.infrastructure.repositories.game_stats_repository_impl import GameStatsRepositoryImpl
+from src.infrastructure.logging.logger import logger
+
+
+class GameArchiver:
+    """
+    Background job keeping the hot `games` table small.
+
+    - Finished games older than `finished_max_age` are moved to `games_archive`.
+    - Unfinished games untouched for `abandoned_ttl` are deleted.
+    - Idempotency keys older than `idempotency_key_ttl` are deleted.
+
+    Work is done in batches of at most `batch_size` rows, each in its own short
+    transaction. Candidate rows are locked with SKIP LOCKED so the archiver never
+    waits on (or blocks) a game that is being played.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        finished_max_age: timedelta,
+        abandoned_ttl: timedelta,
+        batch_size: int = 500,
+        interval_seconds: float = 300,
+        max_batches_per_run: int = 100,
+        idempotency_key_ttl: timedelta = timedelta(days=1),
+    ):
+        self.session_factory = session_factory
+        self.finished_max_age = finished_max_age
+        self.abandoned_ttl = abandoned_ttl
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self.max_batches_per_run = max_batches_per_run
+        self.idempotency_key_ttl = idempotency_key_ttl
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls, session_factory: Callable[[], Session]) -> "GameArchiver":
+        return cls(
+            session_factory,
+            finished_max_age=timedelta(seconds=int(os.getenv("ARCHIVE_FINISHED_AFTER_SECONDS", "86400"))),
+            abandoned_ttl=timedelta(seconds=int(os.getenv("ABANDONED_GAME_TTL_SECONDS", "604800"))),
+            batch_size=int(os.getenv("ARCHIVE_BATCH_SIZE", "500")),
+            interval_seconds=float(os.getenv("ARCHIVE_INTERVAL_SECONDS", "300")),
+            idempotency_key_ttl=timedelta(seconds=int(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400"))),
+        )
+
+    def archive_finished_batch(self) -> int:
+        """Move one batch of old finished games to the archive. Return the number moved."""
+        cutoff = utcnow() - self.finished_max_age
+        db = self.session_factory()
+        try:
+            rows = self._lock_batch(db, GameModel.is_finished.is_(True), cutoff)
+            if not rows:
+                return 0
+
+            for row in rows:
+                db.add(ArchivedGameModel(
+                    game_id=row.game_id,
+                    state=encode_state(row.board, row.next_player),
+                    winner=row.winner,
+                    first_move=row.first_move,
+                    version=row.version,
+                    finished_at=row.updated_at,
+                ))
+            ids = [row.game_id for row in rows]
+            db.query(GameModel).filter(GameModel.game_id.in_(ids)).delete(synchronize_session=False)
+            db.commit()
+            logger.info(f"Archived {len(ids)} finished games.")
+            return len(ids)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to archive finished games: {e}", exc_info=True)
+            raise
+        finally:
+            db.close()
+
+    def purge_abandoned_batch(self) -> int:
+        """Delete one batch of abandoned unfinished games. Return the number deleted."""
+        cutoff = utcnow() - self.abandoned_ttl
+        db = self.session_factory()
+        try:
+            rows = self._lock_batch(db, GameModel.is_finished.is_(False), cutoff)
+            if not rows:
+                return 0
+
+            ids = [row.game_id for row in rows]
+            db.query(GameModel).filter(GameModel.game_id.in_(ids)).delete(synchronize_session=False)
+            GameStatsRepositoryImpl(db).record_games_abandoned(len(ids))
+            db.commit()
+            logger.info(f"Purged {len(ids)} abandoned games.")
+            return len(ids)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to purge abandoned games: {e}", exc_info=True)
+            raise
+        finally:
+            db.close()
+
+    def purge_idempotency_keys_batch(self) -> int:
+        """Delete one batch of expired idempotency keys. Return the number deleted."""
+        cutoff = utcnow() - self.idempotency_key_ttl
+        db = self.session_factory()
+        try:
+            expired = (
+                db.query(IdempotencyKeyModel.game_id, IdempotencyKeyModel.key)
+                .filter(IdempotencyKeyModel.created_at < cutoff)
+                .limit(self.batch_size)
+                .all()
+            )
+            if expired:
+                key_columns = tuple_(IdempotencyKeyModel.game_id, IdempotencyKeyModel.key)
+                db.query(IdempotencyKeyModel).filter(key_columns.in_(expired)).delete(synchronize_session=False)
+            db.commit()
+            if expired:
+                logger.info(f"Purged {len(expired)} expired idempotency keys.")
+            return len(expired)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to purge idempotency keys: {e}", exc_info=True)
+            raise
+        finally:
+            db.close()
+
+    def run_once(self) -> tuple[int, int]:
+        """Process batches until caught up (or the per-run cap). Return (archived, purged)."""
+        archived = self._drain(self.archive_finished_batch)
+        purged = self._drain(self.purge_abandoned_batch)
+        self._drain(self.purge_idempotency_keys_batch)
+        return archived, purged
+
+    def start(self) -> None:
+        """Run the archiver periodically in a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="game-archiver", daemon=True)
+        self._thread.start()
+        logger.info(f"Game archiver started (interval={self.interval_seconds}s, batch_size={self.batch_size})")
+
+    def stop(self, timeout: float = 10) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # ----- Private helpers -----
+    def _lock_batch(self, db: Session, criteria, cutoff) -> list[GameModel]:
+        return (
+            db.query(GameModel)
+            .filter(criteria, GameModel.updated_at < cutoff)
+            .order_by(GameModel.updated_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+    def _drain(self, batch: Callable[[], int]) -> int:
+        total = 0
+        for _ in range(self.max_batches_per_run):
+            if self._stop.is_set():
+                break
+            processed = batch()
+            total += processed
+            if processed < self.batch_size:
+                break
+        return total
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                pass  # Already logged, retry on the next tick
+            self._stop.wait(self.interval_seconds)
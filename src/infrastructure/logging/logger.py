@@ -1,14 +1,26 @@
 import logging
 import sys
 
+from src.infrastructure.tracing.spans import request_id_var
+
+
+class RequestIdFilter(logging.Filter):
+    """Adds the ID of the request being served (or "-") to log records."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get() or "-"
+        return True
+
+
 logger = logging.getLogger("tic_tac_toe")
 logger.setLevel(logging.INFO)
 
 stderr_handler = logging.StreamHandler(sys.stderr)
 stderr_handler.setLevel(logging.INFO)
+stderr_handler.addFilter(RequestIdFilter())
 
 formatter = logging.Formatter(
-    "%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    "%(asctime)s | %(levelname)s | %(request_id)s | %(name)s | %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S"
 )
 stderr_handler.setFormatter(formatter)
@@ -0,0 +1,46 @@
+from typing import Optional
+from src.domain.entities.game import Game
+from src.domain.repositories.game_repository import GameRepository
+from src.infrastructure.cache.shared_game_cache import SharedGameCache
+
+
+class CachedGameRepository(GameRepository):
+    """
+    GameRepository decorator serving reads from the node's SharedGameCache.
+
+    Reads for display (`get_for_read`) are answered from the cache when it holds
+    a fresh enough copy, and fill it otherwise. Committed writes refresh it, so
+    every worker of the node sees them. Reads leading to a write (`get`) always
+    go to the database.
+    """
+
+    def __init__(self, inner: GameRepository, cache: SharedGameCache):
+        self.inner = inner
+        self.cache = cache
+
+    def add(self, game: Game) -> None:
+        self.inner.add(game)
+        self.cache.put(game)
+
+    def add_many(self, games: list[Game]) -> None:
+        self.inner.add_many(games)
+        for game in games:
+            self.cache.put(game)
+
+    def get(self, game_id: str) -> Optional[Game]:
+        return self.inner.get(game_id)
+
+    def get_for_read(self, game_id: str, min_version: Optional[int] = None) -> Optional[Game]:
+        game = self.cache.get(game_id, min_version)
+        if game is not None:
+            return game
+        game = self.inner.get_for_read(game_id, min_version)
+        if game is not None:
+            self.cache.put(game)
+        return game
+
+    def get_many(self, game_ids: list[str]) -> dict[str, Game]:
+        return self.inner.get_many(game_ids)
+
+    def list_game_ids(self, limit: int, after: Optional[str] = None) -> list[str]:
+        return self.inner.list_game_ids(limit, after)
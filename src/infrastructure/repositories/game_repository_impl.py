@@ -1,39 +1,176 @@
-from typing import Optional
+from typing import NamedTuple, Optional
+from sqlalchemy import update
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.orm import Session
-from src.infrastructure.db.models import GameModel
+from src.infrastructure.db.models import GameModel, ArchivedGameModel
+from src.infrastructure.db.codec import decode_state
+from src.infrastructure.db.replicas import ReplicaPool
+from src.infrastructure.db.group_commit import GroupCommitWriter, take_pending
 from src.domain.entities.game import Game
+from src.domain.exceptions import WriteConflict
 from src.domain.repositories.game_repository import GameRepository
 from src.domain.value_objects.player import Player
+from src.domain.value_objects.position import Position
+from src.infrastructure.repositories.single_flight import SingleFlight
 from src.infrastructure.logging.logger import logger
+from src.infrastructure.tracing.spans import span, traced
+
+
+# Columns written when a played game is updated in place (updated_at is set by the model)
+UPDATED_COLUMNS = ("board", "next_player", "winner", "is_finished", "first_move", "version")
+
+
+class GameRecord(NamedTuple):
+    """Immutable, session-independent copy of a stored game row."""
+    game_id: str
+    board: tuple
+    next_player: Optional[str]
+    winner: Optional[str]
+    is_finished: bool
+    first_move: Optional[str]
+    version: int
 
 
 class GameRepositoryImpl(GameRepository):
     """Concrete implementation of GameRepository using SQLAlchemy."""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, single_flight: Optional[SingleFlight] = None,
+                 replicas: Optional[ReplicaPool] = None, writer: Optional[GroupCommitWriter] = None):
+        """
+        `single_flight`, shared across requests, makes concurrent `get_for_read`
+        calls for the same game share one query instead of each running their own.
+        `get` never shares: a game read to be modified must not come from a query
+        started before a concurrent write committed.
+        `replicas` serve `get_for_read`; everything else uses the primary session.
+        `writer` commits `add` together with concurrent writes, along with the
+        writes deferred on the session (e.g. stats counters).
+        """
         self.db = db_session
+        self.single_flight = single_flight
+        self.replicas = replicas
+        self.writer = writer
 
-    def add(self, game: Game) -> None:
+    @traced("repository.add")
+    def add(self, game: Game, insert_missing: bool = False) -> None:
         """
         Insert or update a game in the database.
         Transaction commit is handled by the calling service.
+        A game with moves played is only updated: if its row is gone (purged by the
+        archiver since it was read), WriteConflict is raised instead of inserting it
+        back, unless `insert_missing` (a game moving to its new shard).
+        Also raises WriteConflict, having stored nothing, when a row written along
+        with the game (e.g. an idempotency key) was committed concurrently.
         """
         try:
             db_game = self._to_db_model(game)
-            self.db.merge(db_game)
-            self.db.commit()
+            existing_only = game.version > 0 and not insert_missing
+            if self.writer:
+                with span("db.group_commit"):
+                    self.writer.write(take_pending(self.db) + [lambda db: self._write(db, db_game, existing_only)])
+                logger.info(f"Game {game.game_id} merged into database (group commit).")
+                return
+            self._write(self.db, db_game, existing_only)
+            with span("db.commit"):
+                self.db.commit()
             logger.info(f"Game {game.game_id} merged into database.")
+        except WriteConflict:
+            self.db.rollback()
+            raise
+        except IntegrityError as e:
+            self.db.rollback()
+            logger.warning(f"Write of game {game.game_id} conflicted with a concurrent one: {e.orig}")
+            raise WriteConflict(f"Concurrent write to game {game.game_id}") from e
         except Exception as e:
             logger.error(f"Failed to add/merge game {game.game_id}: {e}", exc_info=True)
             raise
 
+    def add_many(self, games: list[Game]) -> None:
+        """Insert or update several games in a single transaction (one lookup for all of them)."""
+        try:
+            game_ids = [game.game_id for game in games]
+            existing = {
+                game_id for (game_id,) in
+                self.db.query(GameModel.game_id).filter(GameModel.game_id.in_(game_ids)).all()
+            }
+            for game in games:
+                db_game = self._to_db_model(game)
+                if game.game_id in existing:
+                    self.db.merge(db_game)
+                else:
+                    self.db.add(db_game)
+            self.db.commit()
+            logger.info(f"{len(games)} games stored in database ({len(existing)} updated).")
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to store {len(games)} games: {e}", exc_info=True)
+            raise
+
+    @traced("repository.get")
     def get(self, game_id: str) -> Optional[Game]:
         """
         Retrieve a game from the database and convert it into a domain entity.
+        Games moved to the archive by the archiver are resolved transparently.
         Returns None if the game is not found.
         """
+        return self._get_from_primary(game_id, coalesce=False)
+
+    @traced("repository.get_for_read")
+    def get_for_read(self, game_id: str, min_version: Optional[int] = None) -> Optional[Game]:
+        """
+        Retrieve a game for reading only, from a read replica when one is healthy.
+        Falls back to the primary when the replica fails, lacks the game, or is
+        behind `min_version` (so clients can read their own writes).
+        """
+        engine = self.replicas.choose() if self.replicas else None
+        if engine is None:
+            return self._get_from_primary(game_id, coalesce=True, min_version=min_version)
+
+        try:
+            read_db = self.replicas.session(engine)
+            try:
+                record = self._load(game_id, read_db, flight_key=(id(engine), game_id))
+            finally:
+                read_db.close()
+        except DBAPIError as e:
+            logger.warning(f"Replica read failed for game {game_id}, using primary: {e}")
+            self.replicas.mark_failed(engine)
+            return self._get_from_primary(game_id, coalesce=True, min_version=min_version)
+
+        if record is None or (min_version is not None and record.version < min_version):
+            logger.debug(f"Replica copy of game {game_id} missing or stale, using primary.")
+            return self._get_from_primary(game_id, coalesce=True, min_version=min_version)
+        logger.info(f"Game {game_id} retrieved from read replica.")
+        return self._from_db_model(record)
+
+    def get_many(self, game_ids: list[str]) -> dict[str, Game]:
+        """Retrieve several games with one query (plus one on the archive for the rest)."""
+        try:
+            rows = self.db.query(GameModel).filter(GameModel.game_id.in_(game_ids)).all()
+            games = {row.game_id: self._from_db_model(row) for row in rows}
+            missing = [game_id for game_id in game_ids if game_id not in games]
+            if missing:
+                archived = self.db.query(ArchivedGameModel).filter(ArchivedGameModel.game_id.in_(missing)).all()
+                for row in archived:
+                    games[row.game_id] = self._from_db_model(self._from_archive_model(row))
+            logger.info(f"Retrieved {len(games)} of {len(game_ids)} requested games from database.")
+            return games
+        except Exception as e:
+            logger.error(f"Error retrieving games {game_ids}: {e}", exc_info=True)
+            raise
+
+    def list_game_ids(self, limit: int, after: Optional[str] = None) -> list[str]:
+        """List IDs of games in the hot table in ascending order (keyset pagination)."""
+        query = self.db.query(GameModel.game_id)
+        if after is not None:
+            query = query.filter(GameModel.game_id > after)
+        return [game_id for (game_id,) in query.order_by(GameModel.game_id).limit(limit).all()]
+
+    def _get_from_primary(self, game_id: str, coalesce: bool, min_version: Optional[int] = None) -> Optional[Game]:
+        """Load a game from the primary, sharing an in-flight query for it if `coalesce` (reads only)."""
         try:
-            db_game = self.db.query(GameModel).filter(GameModel.game_id == game_id).first()
+            db_game = self._load(game_id, self.db, flight_key=game_id) if coalesce else self._fetch(game_id, self.db)
+            if db_game is not None and min_version is not None and (db_game.version or 0) < min_version:
+                db_game = self._fetch(game_id, self.db)  # The shared query started before the caller's write
             if not db_game:
                 logger.warning(f"Game {game_id} not found in database.")
                 return None
@@ -46,6 +183,39 @@ class GameRepositoryImpl(GameRepository):
             logger.error(f"Error retrieving game {game_id}: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    def _write(db: Session, db_game: GameModel, existing_only: bool) -> None:
+        """Merge a game row, or with `existing_only` update it in place, refusing to re-insert it if it is gone."""
+        if not existing_only:
+            db.merge(db_game)
+            return
+        values = {name: getattr(db_game, name) for name in UPDATED_COLUMNS}
+        result = db.execute(update(GameModel).where(GameModel.game_id == db_game.game_id).values(**values))
+        if result.rowcount == 0:
+            logger.warning(f"Game {db_game.game_id} was deleted since it was read, not writing it back.")
+            raise WriteConflict(f"Game {db_game.game_id} no longer exists")
+
+    def _load(self, game_id: str, db: Session, flight_key):
+        """Fetch a game row, coalescing concurrent fetches of the same key when enabled."""
+        if not self.single_flight:
+            return self._fetch(game_id, db)
+        # Shared with concurrent callers: snapshot it off this session first
+        record, shared = self.single_flight.do(flight_key, lambda: self._snapshot(self._fetch(game_id, db)))
+        if shared:
+            logger.debug(f"Game {game_id} read shared with an in-flight query.")
+        return record
+
+    def _fetch(self, game_id: str, db: Session):
+        """Load a game row, falling back to the archive. Return None if not found."""
+        db_game = db.query(GameModel).filter(GameModel.game_id == game_id).first()
+        if db_game:
+            return db_game
+        archived = db.query(ArchivedGameModel).filter(ArchivedGameModel.game_id == game_id).first()
+        if archived:
+            logger.info(f"Game {game_id} found in archive.")
+            return self._from_archive_model(archived)
+        return None
+
     # ----- Private conversion methods -----
     def _to_db_model(self, game: Game) -> GameModel:
         """Convert domain Game entity into DB model."""
@@ -58,11 +228,13 @@ class GameRepositoryImpl(GameRepository):
             board=board_as_str,
             next_player=game.next_player.value if game.next_player else None,
             winner=game.winner.value if game.winner else None,
-            is_finished=game.is_finished
+            is_finished=game.is_finished,
+            first_move=f"{game.first_move.x},{game.first_move.y}" if game.first_move else None,
+            version=game.version
         )
 
-    def _from_db_model(self, db_game: GameModel) -> Game:
-        """Convert DB model into domain Game entity."""
+    def _from_db_model(self, db_game: GameModel | GameRecord) -> Game:
+        """Convert DB model (or game record) into domain Game entity."""
         game = Game(db_game.game_id)
         game.board.grid = [
             [Player(cell) if cell else None for cell in row]
@@ -71,4 +243,36 @@ class GameRepositoryImpl(GameRepository):
         game.next_player = Player(db_game.next_player) if db_game.next_player else None
         game.winner = Player(db_game.winner) if db_game.winner else None
         game.is_finished = db_game.is_finished
+        game.first_move = self._parse_square(db_game.first_move)
+        game.version = db_game.version or 0
         return game
+
+    @staticmethod
+    def _from_archive_model(archived: ArchivedGameModel) -> GameRecord:
+        """Convert an archived (always finished) game into a game record."""
+        board, next_player = decode_state(archived.state)
+        return GameRecord(archived.game_id, tuple(map(tuple, board)), next_player, archived.winner, True,
+                          archived.first_move, archived.version)
+
+    @staticmethod
+    def _snapshot(db_game) -> Optional[GameRecord]:
+        """Copy a loaded row into an immutable record that is safe to share across threads."""
+        if db_game is None or isinstance(db_game, GameRecord):
+            return db_game
+        return GameRecord(
+            db_game.game_id,
+            tuple(tuple(row) for row in db_game.board),
+            db_game.next_player,
+            db_game.winner,
+            db_game.is_finished,
+            db_game.first_move,
+            db_game.version,
+        )
+
+    @staticmethod
+    def _parse_square(square: Optional[str]) -> Optional[Position]:
+        """Parse an "x,y" square column into a Position."""
+        if not square:
+            return None
+        x, y = square.split(",")
+        return Position.at(int(x), int(y)) or Position(int(x), int(y))
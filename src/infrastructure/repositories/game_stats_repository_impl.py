@@ -0,0 +1,185 @@
+import random
+import zlib
+from sqlalchemy import update, func
+from sqlalchemy.orm import Session
+from src.infrastructure.db.group_commit import defer
+from src.infrastructure.db.models import GameModel, ArchivedGameModel, GameStatsModel, OpeningStatsModel
+from src.domain.entities.game import Game
+from src.domain.entities.game_stats import GameStats, OpeningStats
+from src.domain.repositories.game_stats_repository import GameStatsRepository
+from src.domain.value_objects.player import Player
+from src.infrastructure.logging.logger import logger
+
+GLOBAL_STATS_ID = 1
+# The global counters are striped over rows 1..STATS_STRIPES (summed on read) so
+# concurrent writers do not all queue on the lock of a single row
+STATS_STRIPES = 16
+OPENING_SQUARES = [f"{x},{y}" for y in range(1, 4) for x in range(1, 4)]
+
+# Outcome counter incremented for each possible winner (None means draw)
+OUTCOME_COLUMNS = {Player.X: "x_wins", Player.O: "o_wins", None: "draws"}
+
+
+class GameStatsRepositoryImpl(GameStatsRepository):
+    """Counter-table implementation of GameStatsRepository using SQLAlchemy.
+
+    Counters are bumped with in-place UPDATEs on the caller's session and are
+    committed together with the game write, so reading them is a read of a few
+    counter rows instead of a scan over `games`. The global counters of a game
+    go to one of `STATS_STRIPES` rows picked by its ID. With `deferred=True` (group commit),
+    the increments are deferred on the session and committed by the group commit
+    writer in the same transaction as the game.
+    """
+
+    def __init__(self, db_session: Session, deferred: bool = False):
+        self.db = db_session
+        self.deferred = deferred
+
+    def record_game_created(self, game: Game) -> None:
+        self._increment(GameStatsModel, {"total_games": 1}, id=self._stripe_for(game.game_id))
+
+    def record_game_finished(self, game: Game) -> None:
+        deltas = {"finished_games": 1, OUTCOME_COLUMNS[game.winner]: 1}
+        self._increment(GameStatsModel, deltas, id=self._stripe_for(game.game_id))
+        if game.first_move is not None:
+            self._increment(OpeningStatsModel, deltas, square=f"{game.first_move.x},{game.first_move.y}")
+
+    def record_games_abandoned(self, count: int) -> None:
+        if count:
+            self._increment(GameStatsModel, {"abandoned_games": count}, id=random.randint(1, STATS_STRIPES))
+
+    def get(self) -> GameStats:
+        """Read the counters: the global stripes, summed, plus one row per opening square."""
+        try:
+            rows = self.db.query(GameStatsModel).all()
+            openings = self.db.query(OpeningStatsModel).order_by(OpeningStatsModel.square).all()
+            return self._to_entity(rows, openings)
+        except Exception as e:
+            logger.error(f"Error retrieving game stats: {e}", exc_info=True)
+            raise
+
+    def ensure_initialized(self) -> None:
+        """Insert any missing counter rows (columns default to 0) so increments never have to."""
+        try:
+            stripes = {stripe for (stripe,) in self.db.query(GameStatsModel.id).all()}
+            for stripe in range(GLOBAL_STATS_ID, GLOBAL_STATS_ID + STATS_STRIPES):
+                if stripe not in stripes:
+                    self.db.add(GameStatsModel(id=stripe))
+            existing = {square for (square,) in self.db.query(OpeningStatsModel.square).all()}
+            for square in OPENING_SQUARES:
+                if square not in existing:
+                    self.db.add(OpeningStatsModel(square=square))
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to initialize game stats rows: {e}", exc_info=True)
+            raise
+
+    def rebuild(self) -> GameStats:
+        """
+        Recompute all counters from the `games` and `games_archive` tables with
+        grouped scans and replace the stored counters in one transaction.
+        Purged abandoned games no longer exist, so they are not counted anymore.
+        """
+        try:
+            rows = (
+                self.db.query(GameModel.first_move, GameModel.winner, GameModel.is_finished, func.count())
+                .group_by(GameModel.first_move, GameModel.winner, GameModel.is_finished)
+                .all()
+            ) + [
+                (first_move, winner, True, count)
+                for first_move, winner, count in self.db.query(
+                    ArchivedGameModel.first_move, ArchivedGameModel.winner, func.count()
+                ).group_by(ArchivedGameModel.first_move, ArchivedGameModel.winner).all()
+            ]
+            stats = GameStats()
+            openings = {square: OpeningStats(square) for square in OPENING_SQUARES}
+            for first_move, winner, is_finished, count in rows:
+                stats.total_games += count
+                if not is_finished:
+                    continue
+                column = OUTCOME_COLUMNS[Player(winner) if winner else None]
+                stats.finished_games += count
+                setattr(stats, column, getattr(stats, column) + count)
+                opening = openings.get(first_move)
+                if opening is not None:
+                    opening.finished_games += count
+                    setattr(opening, column, getattr(opening, column) + count)
+            stats.openings = list(openings.values())
+
+            self.db.query(GameStatsModel).delete()
+            self.db.query(OpeningStatsModel).delete()
+            self.db.add(GameStatsModel(
+                id=GLOBAL_STATS_ID,
+                total_games=stats.total_games,
+                finished_games=stats.finished_games,
+                x_wins=stats.x_wins,
+                o_wins=stats.o_wins,
+                draws=stats.draws,
+            ))
+            for stripe in range(GLOBAL_STATS_ID + 1, GLOBAL_STATS_ID + STATS_STRIPES):
+                self.db.add(GameStatsModel(id=stripe))
+            for opening in stats.openings:
+                self.db.add(OpeningStatsModel(
+                    square=opening.square,
+                    finished_games=opening.finished_games,
+                    x_wins=opening.x_wins,
+                    o_wins=opening.o_wins,
+                    draws=opening.draws,
+                ))
+            self.db.commit()
+            logger.info(f"Game stats rebuilt: total_games={stats.total_games}, finished_games={stats.finished_games}")
+            return stats
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to rebuild game stats: {e}", exc_info=True)
+            raise
+
+    # ----- Private helpers -----
+    def _increment(self, model, deltas: dict, **key) -> None:
+        """Atomically add `deltas` to the counter row identified by `key` (no commit)."""
+        if self.deferred:
+            defer(self.db, lambda db: self._apply_increment(db, model, deltas, key))
+        else:
+            self._apply_increment(self.db, model, deltas, key)
+
+    @staticmethod
+    def _stripe_for(game_id: str) -> int:
+        return GLOBAL_STATS_ID + zlib.crc32(game_id.encode()) % STATS_STRIPES
+
+    @staticmethod
+    def _apply_increment(db: Session, model, deltas: dict, key: dict) -> None:
+        criteria = [getattr(model, name) == value for name, value in key.items()]
+        values = {name: getattr(model, name) + delta for name, delta in deltas.items()}
+        result = db.execute(update(model).where(*criteria).values(**values))
+        if result.rowcount == 0:
+            # Counter rows are normally seeded by the migrations. Concurrent writers may
+            # both find one missing: an upsert lets them both count
+            logger.warning(f"Stats row {model.__tablename__} {key} missing, creating it.")
+            dialect = db.get_bind().dialect.name
+            # Dialects supporting INSERT ... ON CONFLICT DO UPDATE, imported only when needed
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as upsert
+            elif dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as upsert
+            else:
+                logger.error(f"Cannot create stats row on {dialect}, run rebuild_stats to fix the counters.")
+                return
+            insert = upsert(model).values(**key, **deltas)
+            db.execute(insert.on_conflict_do_update(index_elements=list(key), set_=values))
+
+    @staticmethod
+    def _to_entity(rows: list[GameStatsModel], openings: list[OpeningStatsModel]) -> GameStats:
+        stats = GameStats()
+        for row in rows:
+            stats.total_games += row.total_games
+            stats.finished_games += row.finished_games
+            stats.x_wins += row.x_wins
+            stats.o_wins += row.o_wins
+            stats.draws += row.draws
+            stats.abandoned_games += row.abandoned_games
+        stats.openings = [
+            OpeningStats(o.square, o.finished_games, o.x_wins, o.o_wins, o.draws)
+            for o in openings
+        ]
+        return stats
@@ -0,0 +1,60 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+from src.infrastructure.db.group_commit import defer
+from src.infrastructure.db.models import IdempotencyKeyModel
+from src.domain.entities.idempotent_move import IdempotentMove
+from src.domain.repositories.idempotency_repository import IdempotencyRepository
+from src.infrastructure.logging.logger import logger
+
+
+class IdempotencyRepositoryImpl(IdempotencyRepository):
+    """SQLAlchemy implementation of IdempotencyRepository.
+
+    Rows are added to the caller's session without committing, so they are
+    committed by the game write they belong to. With `deferred=True` (group
+    commit), the insert is deferred on the session and committed by the group
+    commit writer in the same transaction as the game.
+    """
+
+    def __init__(self, db_session: Session, deferred: bool = False):
+        self.db = db_session
+        self.deferred = deferred
+
+    def get(self, game_id: str, key: str) -> Optional[IdempotentMove]:
+        """Primary-key lookup of a stored result; never reads the game row."""
+        try:
+            row = self.db.get(IdempotencyKeyModel, (game_id, key))
+            return self._to_entity(row) if row else None
+        except Exception as e:
+            logger.error(f"Error retrieving idempotency key for game {game_id}: {e}", exc_info=True)
+            raise
+
+    def list_for_game(self, game_id: str) -> list[IdempotentMove]:
+        """Range scan of the game's keys on the primary key."""
+        try:
+            rows = self.db.query(IdempotencyKeyModel).filter(IdempotencyKeyModel.game_id == game_id).all()
+            return [self._to_entity(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error listing idempotency keys for game {game_id}: {e}", exc_info=True)
+            raise
+
+    def add(self, move: IdempotentMove) -> None:
+        row = IdempotencyKeyModel(
+            game_id=move.game_id,
+            key=move.key,
+            move=f"{move.player}{move.x},{move.y}",
+            message=move.message,
+            version=move.version,
+            winner=move.winner,
+            is_finished=move.is_finished,
+        )
+        if self.deferred:
+            defer(self.db, lambda db: db.add(row))
+        else:
+            self.db.add(row)
+
+    @staticmethod
+    def _to_entity(row: IdempotencyKeyModel) -> IdempotentMove:
+        x, y = row.move[1:].split(",")
+        return IdempotentMove(row.game_id, row.key, row.move[0], int(x), int(y), row.message, row.version,
+                              row.winner, row.is_finished)
@@ -0,0 +1,76 @@
+import heapq
+from typing import Optional
+from src.domain.entities.game import Game
+from src.domain.repositories.game_repository import GameRepository
+from src.infrastructure.db.group_commit import GroupCommitWriter
+from src.infrastructure.db.sharding import ShardSessions
+from src.infrastructure.repositories.game_repository_impl import GameRepositoryImpl
+from src.infrastructure.repositories.single_flight import SingleFlight
+
+
+class ShardedGameRepository(GameRepository):
+    """
+    GameRepository spreading games over several databases by consistent hashing
+    of the game ID. Single-game operations go to the owning shard; multi-game
+    operations scatter to the shards involved in parallel and gather the results.
+    While rebalancing, reads missing a game fall back to its previous shard, and
+    its next write lands on its new shard.
+    """
+
+    def __init__(self, shards: ShardSessions, single_flight: Optional[SingleFlight] = None,
+                 writers: Optional[dict[str, GroupCommitWriter]] = None):
+        """`writers`, keyed by shard, enable group commit of each shard's writes."""
+        self.shards = shards
+        self.single_flight = single_flight
+        self.writers = writers or {}
+
+    def add(self, game: Game) -> None:
+        # While rebalancing, a game read from its previous shard is written to its new one
+        moving = self.shards.previous_shard_for(game.game_id) is not None
+        self._repo_for(game.game_id).add(game, insert_missing=moving)
+
+    def add_many(self, games: list[Game]) -> None:
+        by_id = {game.game_id: game for game in games}
+        groups = self.shards.ring.group(list(by_id))
+        self.shards.scatter(
+            groups, lambda db, shard: GameRepositoryImpl(db).add_many([by_id[game_id] for game_id in groups[shard]])
+        )
+
+    def get(self, game_id: str) -> Optional[Game]:
+        game = self._repo_for(game_id).get(game_id)
+        previous = self.shards.previous_shard_for(game_id) if game is None else None
+        return GameRepositoryImpl(self.shards.session(previous)).get(game_id) if previous else game
+
+    def get_for_read(self, game_id: str, min_version: Optional[int] = None) -> Optional[Game]:
+        game = self._repo_for(game_id).get_for_read(game_id, min_version)
+        previous = self.shards.previous_shard_for(game_id) if game is None else None
+        return GameRepositoryImpl(self.shards.session(previous)).get_for_read(game_id, min_version) if previous else game
+
+    def get_many(self, game_ids: list[str]) -> dict[str, Game]:
+        games = self._gather(self.shards.ring.group(game_ids))
+        moving: dict[str, list[str]] = {}
+        for game_id in game_ids:
+            previous = self.shards.previous_shard_for(game_id) if game_id not in games else None
+            if previous:
+                moving.setdefault(previous, []).append(game_id)
+        if moving:
+            games.update(self._gather(moving))
+        return games
+
+    def list_game_ids(self, limit: int, after: Optional[str] = None) -> list[str]:
+        results = self.shards.scatter(
+            self.shards.ring.shards, lambda db, shard: GameRepositoryImpl(db).list_game_ids(limit, after)
+        )
+        return list(heapq.merge(*results.values()))[:limit]
+
+    def _gather(self, groups: dict[str, list[str]]) -> dict[str, Game]:
+        results = self.shards.scatter(groups, lambda db, shard: GameRepositoryImpl(db).get_many(groups[shard]))
+        games = {}
+        for shard_games in results.values():
+            games.update(shard_games)
+        return games
+
+    def _repo_for(self, game_id: str) -> GameRepositoryImpl:
+        shard = self.shards.ring.shard_for(game_id)
+        return GameRepositoryImpl(self.shards.session(shard), single_flight=self.single_flight,
+                                  writer=self.writers.get(shard))
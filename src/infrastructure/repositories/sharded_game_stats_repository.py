@@ -0,0 +1,52 @@
+from src.domain.entities.game import Game
+from src.domain.entities.game_stats import GameStats, OpeningStats
+from src.domain.repositories.game_stats_repository import GameStatsRepository
+from src.infrastructure.db.sharding import ShardSessions
+from src.infrastructure.repositories.game_stats_repository_impl import GameStatsRepositoryImpl
+
+
+class ShardedGameStatsRepository(GameStatsRepository):
+    """
+    Game counters kept per shard, next to the games they count, so each update
+    still commits in the same transaction as its game. Reads sum every shard.
+    Updates that belong to no single game go to the first shard of the ring.
+    """
+
+    def __init__(self, shards: ShardSessions, deferred: bool = False):
+        """`deferred` leaves counter updates for the group commit writer (see GameStatsRepositoryImpl)."""
+        self.shards = shards
+        self.deferred = deferred
+
+    def record_game_created(self, game: Game) -> None:
+        self._repo_for(game).record_game_created(game)
+
+    def record_game_finished(self, game: Game) -> None:
+        self._repo_for(game).record_game_finished(game)
+
+    def record_games_abandoned(self, count: int) -> None:
+        """Count purged games on the first shard (each shard's archiver records its own directly)."""
+        shard = self.shards.ring.shards[0]
+        GameStatsRepositoryImpl(self.shards.session(shard), deferred=self.deferred).record_games_abandoned(count)
+
+    def get(self) -> GameStats:
+        return self._sum(lambda repo: repo.get())
+
+    def rebuild(self) -> GameStats:
+        return self._sum(lambda repo: repo.rebuild())
+
+    def _repo_for(self, game: Game) -> GameStatsRepositoryImpl:
+        return GameStatsRepositoryImpl(self.shards.session_for(game.game_id), deferred=self.deferred)
+
+    def _sum(self, fn) -> GameStats:
+        results = self.shards.scatter(self.shards.ring.shards, lambda db, shard: fn(GameStatsRepositoryImpl(db)))
+        total = GameStats()
+        openings: dict[str, OpeningStats] = {}
+        for stats in results.values():
+            for name in ("total_games", "finished_games", "x_wins", "o_wins", "draws", "abandoned_games"):
+                setattr(total, name, getattr(total, name) + getattr(stats, name))
+            for opening in stats.openings:
+                merged = openings.setdefault(opening.square, OpeningStats(opening.square))
+                for name in ("finished_games", "x_wins", "o_wins", "draws"):
+                    setattr(merged, name, getattr(merged, name) + getattr(opening, name))
+        total.openings = sorted(openings.values(), key=lambda o: o.square)
+        return total
@@ -0,0 +1,36 @@
+from typing import Optional
+from src.domain.entities.idempotent_move import IdempotentMove
+from src.domain.repositories.idempotency_repository import IdempotencyRepository
+from src.infrastructure.db.sharding import ShardSessions
+from src.infrastructure.repositories.idempotency_repository_impl import IdempotencyRepositoryImpl
+
+
+class ShardedIdempotencyRepository(IdempotencyRepository):
+    """
+    Idempotency keys stored on the shard of their game, so each result still
+    commits in the same transaction as the move it belongs to. While rebalancing,
+    keys not found there are looked up on the game's previous shard.
+    """
+
+    def __init__(self, shards: ShardSessions, deferred: bool = False):
+        self.shards = shards
+        self.deferred = deferred
+
+    def get(self, game_id: str, key: str) -> Optional[IdempotentMove]:
+        move = self._repo_for(game_id).get(game_id, key)
+        previous = self.shards.previous_shard_for(game_id) if move is None else None
+        return IdempotencyRepositoryImpl(self.shards.session(previous)).get(game_id, key) if previous else move
+
+    def list_for_game(self, game_id: str) -> list[IdempotentMove]:
+        moves = {move.key: move for move in self._repo_for(game_id).list_for_game(game_id)}
+        previous = self.shards.previous_shard_for(game_id)
+        if previous:
+            for move in IdempotencyRepositoryImpl(self.shards.session(previous)).list_for_game(game_id):
+                moves.setdefault(move.key, move)
+        return list(moves.values())
+
+    def add(self, move: IdempotentMove) -> None:
+        self._repo_for(move.game_id).add(move)
+
+    def _repo_for(self, game_id: str) -> IdempotencyRepositoryImpl:
+        return IdempotencyRepositoryImpl(self.shards.session_for(game_id), deferred=self.deferred)
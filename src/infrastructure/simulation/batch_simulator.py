@@ -0,0 +1,162 @@
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+
+from src.domain.entities.game import Game
+from src.domain.repositories.game_repository import GameRepository
+from src.domain.value_objects.player import Player
+from src.domain.value_objects.position import Position
+
+# Boards are (N, 9) int8 arrays, cell i holding grid[i // 3][i % 3] (row y, column x)
+# with the same rules as Board/Game: X moves first, a game ends on a full line or a full board.
+EMPTY, X, O = 0, 1, 2
+WIN_LINES = np.array([
+    [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
+    [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
+    [0, 4, 8], [2, 4, 6],             # Diagonals
+])
+NO_MOVE = -1
+
+# policy(boards, player, rng) -> cell index to play on each board, empty cells only
+Policy = Callable[[np.ndarray, int, np.random.Generator], np.ndarray]
+
+
+def winners_mask(boards: np.ndarray, player: int) -> np.ndarray:
+    """Vectorized `Board.check_winner`: which boards have a full line of `player`."""
+    return (boards[:, WIN_LINES] == player).all(axis=2).any(axis=1)
+
+
+def random_policy(boards: np.ndarray, player: int, rng: np.random.Generator) -> np.ndarray:
+    """Play a uniformly random empty cell."""
+    scores = rng.random(boards.shape, dtype=np.float32)
+    scores[boards != EMPTY] = -1
+    return scores.argmax(axis=1)
+
+
+def greedy_policy(boards: np.ndarray, player: int, rng: np.random.Generator) -> np.ndarray:
+    """Complete a line when possible, else block the opponent's, else play randomly."""
+    cells = random_policy(boards, player, rng)
+    opponent = X + O - player
+    decided = np.zeros(len(boards), dtype=bool)
+    for target in (player, opponent):
+        for cell in range(9):
+            candidates = ~decided & (boards[:, cell] == EMPTY)
+            if not candidates.any():
+                continue
+            trial = boards[candidates]
+            trial[:, cell] = target
+            hits = np.flatnonzero(candidates)[winners_mask(trial, target)]
+            cells[hits] = cell
+            decided[hits] = True
+    return cells
+
+
+@dataclass
+class SimulationResult:
+    """Finished games: final boards, moves played (cell per turn, -1 once over) and winners (0 for a draw)."""
+    boards: np.ndarray
+    moves: np.ndarray
+    winners: np.ndarray
+    move_counts: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.boards)
+
+    def opening_summary(self) -> dict[str, dict[str, int]]:
+        """Outcome counts per opening square ("x,y"), as in the game stats."""
+        first = self.moves[:, 0]
+        summary = {}
+        for cell in range(9):
+            outcomes = np.bincount(self.winners[first == cell], minlength=3)
+            summary[f"{cell % 3 + 1},{cell // 3 + 1}"] = {
+                "games": int(outcomes.sum()),
+                "x_wins": int(outcomes[X]),
+                "o_wins": int(outcomes[O]),
+                "draws": int(outcomes[EMPTY]),
+            }
+        return summary
+
+
+class BatchSimulator:
+    """
+    Plays many games at once, one vectorized step per turn over every unfinished game.
+    Games are simulated `chunk_size` at a time to bound memory.
+    """
+
+    def __init__(self, policy_x: Policy = random_policy, policy_o: Policy = random_policy,
+                 seed: Optional[int] = None, chunk_size: int = 1_000_000):
+        self.policies = {X: policy_x, O: policy_o}
+        self.rng = np.random.default_rng(seed)
+        self.chunk_size = chunk_size
+
+    def simulate(self, n_games: int, opening: Optional[int] = None) -> SimulationResult:
+        """Play `n_games` games to the end, optionally forcing X's opening cell."""
+        chunks = [
+            self._simulate_chunk(min(self.chunk_size, n_games - start), opening)
+            for start in range(0, n_games, self.chunk_size)
+        ] or [self._simulate_chunk(0, opening)]
+        return SimulationResult(*(np.concatenate(parts) for parts in zip(
+            *((c.boards, c.moves, c.winners, c.move_counts) for c in chunks)
+        )))
+
+    def _simulate_chunk(self, n: int, opening: Optional[int]) -> SimulationResult:
+        boards = np.zeros((n, 9), dtype=np.int8)
+        moves = np.full((n, 9), NO_MOVE, dtype=np.int8)
+        winners = np.zeros(n, dtype=np.int8)
+        active = np.arange(n)
+        player = X
+        for turn in range(9):
+            if turn == 0 and opening is not None:
+                cells = np.full(len(active), opening)
+            else:
+                cells = self.policies[player](boards[active], player, self.rng)
+            boards[active, cells] = player
+            moves[active, turn] = cells
+            won = winners_mask(boards[active], player)
+            winners[active[won]] = player
+            active = active[~won]
+            player = X + O - player
+        move_counts = (moves != NO_MOVE).sum(axis=1).astype(np.int8)
+        return SimulationResult(boards, moves, winners, move_counts)
+
+
+def to_games(result: SimulationResult, start: int = 0, stop: Optional[int] = None) -> Iterator[Game]:
+    """Convert simulated games into finished domain games with fresh IDs."""
+    players = (None, Player.X, Player.O)
+    for i in range(start, len(result) if stop is None else stop):
+        game = Game(str(uuid.uuid4()))
+        cells = result.boards[i].tolist()
+        game.board.grid = [[players[cell] for cell in cells[row:row + 3]] for row in (0, 3, 6)]
+        first = int(result.moves[i, 0])
+        game.first_move = Position.at(first % 3 + 1, first // 3 + 1)
+        game.version = int(result.move_counts[i])
+        game.winner = players[result.winners[i]]
+        game.is_finished = True
+        # Like Game, the last player to move stays as next player once the game is over
+        game.next_player = Player.X if game.version % 2 else Player.O
+        yield game
+
+
+def write_jsonl(result: SimulationResult, path: str) -> None:
+    """Write simulated games as JSON lines shaped like the game status (plus `first_move`)."""
+    with open(path, "w", encoding="utf-8") as f:
+        for game in to_games(result):
+            f.write(json.dumps({
+                "game_id": game.game_id,
+                "board": [[cell.value if cell else None for cell in row] for row in game.board.grid],
+                "next_player": None,
+                "winner": game.winner.value if game.winner else None,
+                "is_finished": True,
+                "version": game.version,
+                "first_move": f"{game.first_move.x},{game.first_move.y}",
+            }) + "\n")
+
+
+def write_to_repository(result: SimulationResult, repo: GameRepository, batch_size: int = 1000) -> int:
+    """Store simulated games through `repo.add_many`, `batch_size` games per call. Return the count."""
+    for start in range(0, len(result), batch_size):
+        repo.add_many(list(to_games(result, start, min(start + batch_size, len(result)))))
+    return len(result)
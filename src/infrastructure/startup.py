@@ -0,0 +1,56 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+
+class StartupReport:
+    """
+    Timing of the startup phases of this process (imports, app setup, schema
+    check, pool warm-up...) and whether it is ready to serve traffic.
+
+    The clock starts when this module is first imported, which `src.main` does
+    before anything else.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.started = clock()
+        self.phases: list[tuple[str, float]] = []
+        self.ready_after: Optional[float] = None
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.ready_after is not None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = self.clock()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.phases.append((name, self.clock() - start))
+
+    def mark_ready(self) -> None:
+        self.error = None
+        self.ready_after = self.clock() - self.started
+
+    def mark_failed(self, error: Exception) -> None:
+        self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            phases = [{"phase": name, "ms": round(seconds * 1000, 2)} for name, seconds in self.phases]
+        return {
+            "ready": self.ready,
+            "ready_after_ms": round(self.ready_after * 1000, 2) if self.ready else None,
+            "uptime_ms": round((self.clock() - self.started) * 1000, 2),
+            "error": self.error,
+            "phases": phases,
+        }
+
+
+startup_report = StartupReport()
@@ -0,0 +1,49 @@
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+
+from src.infrastructure.tracing.spans import Span
+
+
+class SpanExporter(ABC):
+    """Destination of finished spans. Called from the span processor's worker thread only."""
+
+    @abstractmethod
+    def export(self, spans: list[Span]) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+
+class RingBufferExporter(SpanExporter):
+    """Keeps the last `capacity` spans in memory, for inspection and tests."""
+
+    def __init__(self, capacity: int = 10_000):
+        self._spans: deque[Span] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def spans(self, request_id: str | None = None) -> list[Span]:
+        """Buffered spans, oldest first, optionally only those of one request."""
+        with self._lock:
+            return [s for s in self._spans if request_id is None or s.request_id == request_id]
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends spans to a file as JSON lines."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, spans: list[Span]) -> None:
+        self._file.write("".join(json.dumps(s.to_dict()) + "\n" for s in spans))
+        self._file.flush()
+
+    def shutdown(self) -> None:
+        self._file.close()
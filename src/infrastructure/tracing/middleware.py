@@ -0,0 +1,51 @@
+import uuid
+
+from src.infrastructure.tracing.spans import Span, request_id_var, current_span_var, get_span_processor
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening the root `http.request` span of each request.
+
+    The request ID is taken from the `X-Request-ID` header (or generated), made
+    available to spans and log lines through a contextvar, and echoed back in
+    the `X-Request-ID` response header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        processor = get_span_processor()
+        if scope["type"] != "http" or processor is None:
+            return await self.app(scope, receive, send)
+
+        request_id = None
+        for name, value in scope.get("headers", ()):
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:64]
+                break
+        request_id = request_id or uuid.uuid4().hex
+
+        root = Span("http.request", request_id, None, {"method": scope["method"], "path": scope["path"]})
+        request_token = request_id_var.set(request_id)
+        span_token = current_span_var.set(root)
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                root.attributes["status_code"] = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-request-id", request_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        except BaseException as e:
+            root.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            current_span_var.reset(span_token)
+            request_id_var.reset(request_token)
+            root.end()
+            processor.on_end(root)
@@ -0,0 +1,73 @@
+import os
+import queue
+import threading
+from typing import Optional
+
+from src.infrastructure.tracing.exporters import SpanExporter, RingBufferExporter, FileSpanExporter
+from src.infrastructure.tracing.spans import Span
+from src.infrastructure.logging.logger import logger
+
+
+class BatchSpanProcessor:
+    """
+    Hands finished spans to an exporter in batches, from a background thread.
+
+    Requests only pay for a non-blocking put into a bounded queue; when the
+    exporter falls behind and the queue is full, new spans are dropped and counted.
+    """
+
+    def __init__(self, exporter: SpanExporter, max_queue_size: int = 2048,
+                 max_batch_size: int = 256, schedule_delay_seconds: float = 1.0):
+        self.exporter = exporter
+        self.max_batch_size = max_batch_size
+        self.schedule_delay_seconds = schedule_delay_seconds
+        self.dropped = 0
+        self._queue: queue.Queue[Span] = queue.Queue(maxsize=max_queue_size)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_env(cls) -> Optional["BatchSpanProcessor"]:
+        """Processor configured from the environment, or None when tracing is disabled."""
+        if os.getenv("TRACING_ENABLED", "false").lower() != "true":
+            return None
+        if os.getenv("TRACING_EXPORTER", "memory") == "file":
+            exporter = FileSpanExporter(os.getenv("TRACING_FILE_PATH", "spans.jsonl"))
+        else:
+            exporter = RingBufferExporter(int(os.getenv("TRACING_RING_BUFFER_SIZE", "10000")))
+        return cls(exporter, max_queue_size=int(os.getenv("TRACING_MAX_QUEUE_SIZE", "2048")))
+
+    def on_end(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self) -> None:
+        """Stop the worker after exporting the spans still queued."""
+        self._stopped.set()
+        self._thread.join()
+        self.exporter.shutdown()
+        if self.dropped:
+            logger.warning(f"{self.dropped} spans were dropped because the export queue was full")
+
+    def _run(self) -> None:
+        while True:
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=self.schedule_delay_seconds))
+                while len(batch) < self.max_batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            if batch:
+                self._export(batch)
+            elif self._stopped.is_set():
+                return
+
+    def _export(self, batch: list[Span]) -> None:
+        try:
+            self.exporter.export(batch)
+        except Exception as e:
+            logger.error(f"Failed to export {len(batch)} spans: {e}", exc_info=True)
@@ -0,0 +1,119 @@
+import functools
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
+
+
+class Span:
+    """A timed operation within a request. Times are in nanoseconds (wall clock start, monotonic duration)."""
+
+    __slots__ = ("request_id", "span_id", "parent_id", "name", "start_ns", "duration_ns",
+                 "attributes", "error", "_started")
+
+    def __init__(self, name: str, request_id: Optional[str], parent_id: Optional[str],
+                 attributes: Optional[dict] = None):
+        self.request_id = request_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.name = name
+        self.start_ns = time.time_ns()
+        self.duration_ns: Optional[int] = None
+        self.attributes: dict[str, Any] = attributes or {}
+        self.error: Optional[str] = None
+        self._started = time.perf_counter_ns()
+
+    def end(self) -> None:
+        self.duration_ns = time.perf_counter_ns() - self._started
+
+    def to_dict(self) -> dict:
+        return {
+            "request_id": self.request_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "duration_ms": round(self.duration_ns / 1e6, 3) if self.duration_ns is not None else None,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+current_span_var: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_processor = None
+
+
+def set_span_processor(processor) -> None:
+    """Install the processor receiving finished spans (None disables tracing)."""
+    global _processor
+    _processor = processor
+
+
+def get_span_processor():
+    return _processor
+
+
+def current_span() -> Optional[Span]:
+    return current_span_var.get()
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    Time the enclosed block as a child of the current span.
+    Yields None, doing nothing, while tracing is disabled.
+    """
+    processor = _processor
+    if processor is None:
+        yield None
+        return
+
+    parent = current_span_var.get()
+    current = Span(name, request_id_var.get(), parent.span_id if parent else None, attributes)
+    token = current_span_var.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current_span_var.reset(token)
+        current.end()
+        processor.on_end(current)
+
+
+def traced(name: str, endpoint: bool = False):
+    """
+    Decorator recording every call of the function as a span named `name`.
+    On API endpoints (`endpoint=True`) the request parsing time is recorded too.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _processor is None:
+                return fn(*args, **kwargs)
+            if endpoint:
+                record_request_parsed()
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_request_parsed() -> None:
+    """
+    Record a `request.parse` span from the start of the current request until now.
+    Called on endpoint entry, it covers reading and validating the request and
+    resolving the endpoint dependencies.
+    """
+    processor = _processor
+    root = current_span_var.get()
+    if processor is None or root is None:
+        return
+    parsed = Span("request.parse", root.request_id, root.span_id)
+    parsed.start_ns = root.start_ns
+    parsed._started = root._started
+    parsed.end()
+    processor.on_end(parsed)
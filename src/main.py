@@ -1,20 +1,110 @@
-from fastapi import FastAPI
-from src.infrastructure.db.session import get_engine
-from src.infrastructure.db.models import Base
-from src.infrastructure.api.routers.game_router import router as game_router
-from src.infrastructure.logging.logger import logger
+from src.infrastructure.startup import startup_report  # First import: the startup clock starts here
+
+with startup_report.phase("import web framework"):
+    import os
+    from fastapi import FastAPI, Request
+    from fastapi.responses import JSONResponse
+
+with startup_report.phase("import application"):
+    from src.infrastructure.db.session import get_game_databases, get_group_commit_writers, get_replica_pool
+    from src.infrastructure.db.bootstrap import DatabaseBootstrap
+    from src.infrastructure.api.routers.game_router import router as game_router
+    from src.infrastructure.api.routers.matchmaking_router import router as matchmaking_router
+    from src.infrastructure.api.routers.health_router import router as health_router
+    from src.infrastructure.api.dependencies import game_actors_enabled
+    from src.infrastructure.db.admission import DatabaseOverloaded
+    from src.infrastructure.api.rate_limiting import RateLimitMiddleware
+    from src.infrastructure.api.profiling import ProfilingMiddleware
+    from src.infrastructure.tracing.middleware import TracingMiddleware
+    from src.infrastructure.tracing.processor import BatchSpanProcessor
+    from src.infrastructure.tracing.spans import set_span_processor
+    from src.infrastructure.logging.logger import logger
 
 app = FastAPI(title="Tic-Tac-Toe API")
+archivers = []
+
+
+def start_archivers(databases) -> None:
+    """Once the schema is ready, archive the games (and their stats) of every database holding them."""
+    if os.getenv("ARCHIVER_ENABLED", "false").lower() != "true":
+        return
+    from src.infrastructure.jobs.game_archiver import GameArchiver
+    for factory in databases.values():
+        archiver = GameArchiver.from_env(factory)
+        archiver.start()
+        archivers.append(archiver)
+
+# Engines, schema check and pool warm-up run in the background: /health/live answers
+# right away, /health/ready once the databases are usable
+bootstrap = DatabaseBootstrap(
+    get_game_databases,
+    startup_report,
+    warmup_connections=int(os.getenv("DB_POOL_WARMUP_CONNECTIONS", "5")),
+    retry_seconds=float(os.getenv("DB_BOOTSTRAP_RETRY_SECONDS", "2")),
+    on_ready=start_archivers,
+)
 
 @app.on_event("startup")
 def startup():
-    try:
-        Base.metadata.create_all(bind=get_engine())
-        logger.info("Database tables created successfully.")
-    except Exception as e:
-        logger.exception("Failed to initialize database tables: %s", e)
-        raise
-
-# Registrar routers
-app.include_router(game_router, prefix="/games", tags=["games"])
-logger.info("Game router registered under /games")
+    bootstrap.start()
+    for writer in get_group_commit_writers().values():
+        writer.start()
+    replicas = get_replica_pool()
+    if replicas:
+        replicas.start()
+
+@app.on_event("shutdown")
+def shutdown():
+    bootstrap.stop()
+    for archiver in archivers:
+        archiver.stop()
+    for writer in get_group_commit_writers().values():
+        writer.stop()
+    replicas = get_replica_pool()
+    if replicas:
+        replicas.stop()
+    if span_processor:
+        span_processor.shutdown()
+
+@app.exception_handler(DatabaseOverloaded)
+def database_overloaded_handler(request: Request, exc: DatabaseOverloaded):
+    logger.warning(f"Shedding {request.method} {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+with startup_report.phase("app setup"):
+    rate_limit_options = RateLimitMiddleware.options_from_env()
+    if rate_limit_options:
+        app.add_middleware(RateLimitMiddleware, **rate_limit_options)
+        logger.info("Per-client rate limiting enabled")
+
+    profiling_options = ProfilingMiddleware.options_from_env()
+    if profiling_options:
+        app.add_middleware(ProfilingMiddleware, **profiling_options)
+        logger.info("On-demand request profiling enabled")
+
+    span_processor = BatchSpanProcessor.from_env()
+    if span_processor:
+        set_span_processor(span_processor)
+        app.add_middleware(TracingMiddleware)
+        logger.info(f"Request tracing enabled, exporting to {type(span_processor.exporter).__name__}")
+
+    # Registrar routers
+    app.include_router(health_router, prefix="/health", tags=["health"])
+    if game_actors_enabled():
+        from src.infrastructure.api.dependencies import get_game_actors
+        from src.infrastructure.api.routers.game_actor_router import router as game_actor_router
+
+        @app.on_event("shutdown")
+        async def stop_game_actors():
+            await get_game_actors().stop()
+
+        app.include_router(game_actor_router, prefix="/games", tags=["games"])
+        logger.info("Game actors enabled: create, move and status are served from memory")
+    app.include_router(game_router, prefix="/games", tags=["games"])
+    logger.info("Game router registered under /games")
+    app.include_router(matchmaking_router, prefix="/matchmaking", tags=["matchmaking"])
+    logger.info("Matchmaking router registered under /matchmaking")
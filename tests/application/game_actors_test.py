@@ -0,0 +1,212 @@
+import asyncio
+import copy
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.game_actors import GameActorSystem, GameBusy
+from src.application.game_service import GameService
+from src.domain.entities.game import Game
+from src.domain.entities.idempotent_move import IdempotentMove
+from src.domain.value_objects.position import Position
+
+
+class FakeStore:
+    """Games 'persisted' by the actors, with repositories recording the calls made on them."""
+
+    def __init__(self):
+        self.games = {}
+        self.repo = MagicMock()
+        self.repo.get.side_effect = lambda game_id: copy.deepcopy(self.games.get(game_id))
+        self.repo.add.side_effect = lambda game: self.games.__setitem__(game.game_id, game)
+        self.stats_repo = MagicMock()
+        self.idempotency_repo = MagicMock()
+        self.idempotency_repo.get.return_value = None
+        self.idempotency_repo.list_for_game.return_value = []
+
+    @contextmanager
+    def open_service(self):
+        yield GameService(self.repo, self.stats_repo, idempotency_repo=self.idempotency_repo)
+
+@pytest.fixture
+def store():
+    return FakeStore()
+
+def make_system(store, **options):
+    return GameActorSystem(store.open_service, **options)
+
+WINNING_MOVES = [("X", 1, 1), ("O", 1, 2), ("X", 2, 1), ("O", 2, 2), ("X", 3, 1)]
+
+def test_moves_are_handled_in_order_and_written_behind(store):
+    async def scenario():
+        system = make_system(store)
+        game_id = await system.create_game()
+        results = await asyncio.gather(*(system.play_move(game_id, *move) for move in WINNING_MOVES))
+        await system.stop()
+        return game_id, results
+
+    game_id, results = asyncio.run(scenario())
+    assert [r.version for r in results] == [1, 2, 3, 4, 5]
+    assert results[-1].message == "Player X has won!"
+    store.repo.get.assert_not_called()  # Created in memory, never read back
+    assert store.games[game_id].is_finished and store.games[game_id].version == 5
+    store.stats_repo.record_game_created.assert_called_once()
+    store.stats_repo.record_game_finished.assert_called_once()
+
+def test_game_is_loaded_once_then_evicted_when_idle(store):
+    store.games["g1"] = Game("g1")
+
+    async def scenario():
+        system = make_system(store, idle_seconds=0.05)
+        assert (await system.play_move("g1", "X", 2, 2)).success
+        assert (await system.play_move("g1", "O", 1, 1)).success
+        assert len(system) == 1
+        await asyncio.sleep(0.2)
+        assert len(system) == 0
+        assert store.games["g1"].version == 2  # Persisted before eviction
+        assert (await system.play_move("g1", "X", 3, 3)).version == 3
+        await system.stop()
+
+    asyncio.run(scenario())
+    assert store.repo.get.call_count == 2
+
+def test_unknown_game_keeps_no_actor(store):
+    async def scenario():
+        system = make_system(store)
+        result = await system.play_move("missing", "X", 1, 1)
+        await asyncio.sleep(0)
+        return result, len(system)
+
+    result, actors = asyncio.run(scenario())
+    assert result.error == "Game not found"
+    assert actors == 0
+
+def test_idempotent_retry_is_replayed_and_key_persisted(store):
+    async def scenario():
+        system = make_system(store)
+        game_id = await system.create_game()
+        first = await system.play_move(game_id, "X", 1, 1, "k1")
+        retry = await system.play_move(game_id, "X", 1, 1, "k1")
+        await system.stop()
+        return first, retry
+
+    first, retry = asyncio.run(scenario())
+    assert retry.replayed and (retry.message, retry.version) == (first.message, first.version)
+    store.idempotency_repo.add.assert_called_once()
+
+def test_full_mailbox_sheds_requests(store):
+    store.games["g1"] = Game("g1")
+
+    async def scenario():
+        system = make_system(store, mailbox_size=1)
+        pending = asyncio.ensure_future(system.play_move("g1", "X", 1, 1))
+        await asyncio.sleep(0)
+        with pytest.raises(GameBusy):
+            await system.play_move("g1", "O", 2, 2)
+        await pending
+        await system.stop()
+
+    asyncio.run(scenario())
+
+def test_created_game_is_persisted_before_it_is_returned(store):
+    store.repo.add.side_effect = RuntimeError("db down")
+
+    async def scenario():
+        system = make_system(store)
+        with pytest.raises(RuntimeError):
+            await system.create_game()
+        return len(system)
+
+    assert asyncio.run(scenario()) == 0
+
+def test_failed_write_is_retried(store):
+    store.games["g1"] = Game("g1")
+    store.repo.add.side_effect = [RuntimeError("db down"), None]
+
+    async def scenario():
+        system = make_system(store, retry_seconds=0.01)
+        await system.play_move("g1", "X", 1, 1, "k1")
+        await system.stop()
+
+    asyncio.run(scenario())
+    assert store.repo.add.call_count == 2
+    assert store.idempotency_repo.add.call_count == 2  # Replayed with the retried write
+
+def test_write_failing_past_its_retries_is_dropped_and_game_reloaded(store):
+    store.games["g1"] = Game("g1")
+    store.repo.add.side_effect = RuntimeError("db down")
+
+    async def scenario():
+        system = make_system(store, retry_seconds=0.01, write_retries=2)
+        assert (await system.play_move("g1", "X", 1, 1)).version == 1
+        actor = system._actors["g1"]
+        await actor.flush()
+        assert store.repo.add.call_count == 3
+        assert system.dropped_writes == 1
+        result = await system.play_move("g1", "X", 2, 2)  # Reloaded: the dropped move is not there
+        await system.stop()
+        return result
+
+    assert asyncio.run(scenario()).version == 1
+
+def test_stop_gives_up_on_writes_after_its_timeout(store):
+    store.games["g1"] = Game("g1")
+    store.repo.add.side_effect = RuntimeError("db down")
+
+    async def scenario():
+        system = make_system(store, retry_seconds=10, stop_timeout=0.05)
+        await system.play_move("g1", "X", 1, 1)
+        await asyncio.wait_for(system.stop(), 1)
+
+    asyncio.run(scenario())
+
+def test_retry_of_a_move_persisted_before_the_actor_was_loaded_is_replayed(store):
+    game = Game("g1")
+    game.play_move(Position(1, 1))
+    store.games["g1"] = game
+    store.idempotency_repo.list_for_game.return_value = [IdempotentMove("g1", "k1", "X", 1, 1, "Move accepted", 1)]
+
+    async def scenario():
+        system = make_system(store)
+        retry = await system.play_move("g1", "X", 1, 1, "k1")
+        again = await system.play_move("g1", "X", 1, 1, "k1")
+        moved = await system.play_move("g1", "O", 2, 2, "k2")
+        await system.stop()
+        return retry, again, moved
+
+    retry, again, moved = asyncio.run(scenario())
+    assert retry.replayed and (retry.message, retry.version) == ("Move accepted", 1)
+    assert again.replayed
+    assert not moved.replayed and moved.version == 2
+    store.idempotency_repo.list_for_game.assert_called_once_with("g1")  # Read with the game
+    store.idempotency_repo.get.assert_not_called()  # A new key costs no database read
+    assert [move.key for move in (c.args[0] for c in store.idempotency_repo.add.call_args_list)] == ["k2"]
+
+def test_actor_stats_repository_delegates_other_operations(store):
+    store.stats_repo.get.return_value = "stats"
+
+    async def scenario():
+        system = make_system(store)
+        game_id = await system.create_game()
+        stats_repo = system._actors[game_id].service.stats_repo
+        stats_repo.record_games_abandoned(3)
+        result = stats_repo.get()
+        await system.stop()
+        return result
+
+    assert asyncio.run(scenario()) == "stats"
+    store.stats_repo.record_games_abandoned.assert_called_once_with(3)
+
+def test_actor_game_repository_lists_from_the_durable_repository(store):
+    store.repo.list_game_ids.return_value = ["g1"]
+
+    async def scenario():
+        system = make_system(store)
+        game_id = await system.create_game()
+        result = system._actors[game_id].service.repo.list_game_ids(10, "g0")
+        await system.stop()
+        return result
+
+    assert asyncio.run(scenario()) == ["g1"]
+    store.repo.list_game_ids.assert_called_once_with(10, "g0")
@@ -5,7 +5,12 @@ from src.application.game_service import GameService
 from src.domain.value_objects.player import Player
 from src.domain.entities.game import Game
 from src.domain.value_objects.position import Position
+from src.domain.value_objects.move_outcome import MoveOutcome
 from src.application.dtos import GameStatus
+from src.application.status_cache import StatusPayloadCache
+from src.application.idempotency_cache import IdempotencyCache
+from src.domain.entities.idempotent_move import IdempotentMove
+from src.domain.entities.game_stats import GameStats, OpeningStats
 
 
 @pytest.fixture
@@ -40,32 +45,35 @@ def test_play_move_success(service, repo, game_x_turn):
     result = service.play_move("game123", "X", 1, 1)
     assert result.success is True
     assert "Move registered" in result.message or "has won" in result.message or "draw" in result.message
+    assert result.version == 1
     repo.add.assert_called()
 
-def test_play_move_winner_branch(service, repo, game_x_turn):
+def test_play_move_winner_branch(service, repo, game_x_turn, monkeypatch):
     game = game_x_turn
 
-    # Mock play_move to force a win
-    def fake_play_move(position):
-        game.is_finished = True
-        game.winner = Player.X
+    # Mock try_play_move to force a win
+    def fake_play_move(self, position):
+        self.is_finished = True
+        self.winner = Player.X
+        return MoveOutcome.OK
 
-    game.play_move = fake_play_move
+    monkeypatch.setattr(Game, "try_play_move", fake_play_move)
     repo.get.return_value = game
 
     result = service.play_move("game123", "X", 1, 1)
     assert result.success is True
     assert "has won" in result.message
 
-def test_play_move_draw_branch(service, repo, game_x_turn):
+def test_play_move_draw_branch(service, repo, game_x_turn, monkeypatch):
     game = game_x_turn
 
     # Simulate a move that ends in a draw
-    def fake_play_move(position):
-        game.is_finished = True
-        game.winner = None
+    def fake_play_move(self, position):
+        self.is_finished = True
+        self.winner = None
+        return MoveOutcome.OK
 
-    game.play_move = fake_play_move
+    monkeypatch.setattr(Game, "try_play_move", fake_play_move)
     repo.get.return_value = game
 
     result = service.play_move("game123", "X", 1, 1)
@@ -100,14 +108,174 @@ def test_play_move_invalid_move(service, repo, game):
     assert result.success is False
     assert "already taken" in result.error or "Error" in result.error
 
-def test_get_status_success(service, repo, game):
+def test_play_move_out_of_range(service, repo, game):
+    repo.get.return_value = game
+    result = service.play_move("game123", "X", 0, 4)
+    assert result.success is False
+    assert result.error == "Position 0,4 out of board range (1-3)"
+    repo.add.assert_not_called()
+
+def test_play_move_on_finished_game(service, repo, game):
+    game.is_finished = True
     repo.get.return_value = game
+    result = service.play_move("game123", "X", 1, 1)
+    assert result.success is False
+    assert result.error == "The game has already finished"
+
+def test_get_status_success(service, repo, game):
+    repo.get_for_read.return_value = game
     status_result = service.get_status("game123")
     assert isinstance(status_result, GameStatus)
     assert status_result.game_id == "game123"
     assert status_result.board is not None
 
+def test_get_status_passes_min_version(service, repo, game):
+    game.play_move(Position(1, 1))
+    repo.get_for_read.return_value = game
+    status_result = service.get_status("game123", min_version=1)
+    assert status_result.version == 1
+    repo.get_for_read.assert_called_once_with("game123", 1)
+
 def test_get_status_game_not_found(service, repo):
-    repo.get.return_value = None
+    repo.get_for_read.return_value = None
     status_result = service.get_status("bad_id")
     assert status_result is None
+
+def test_get_status_payload_is_cached_per_version(repo, game):
+    service = GameService(repo, status_cache=StatusPayloadCache())
+    repo.get_for_read.return_value = game
+    render = MagicMock(side_effect=lambda status: f"{status.game_id}@{status.version}".encode())
+
+    assert service.get_status_payload("game123", render) == b"game123@0"
+    assert service.get_status_payload("game123", render) == b"game123@0"
+    assert render.call_count == 1
+
+    game.version = 1  # Moved through another process
+    assert service.get_status_payload("game123", render) == b"game123@1"
+    assert render.call_count == 2
+
+def test_get_status_payload_game_not_found(service, repo):
+    repo.get_for_read.return_value = None
+    assert service.get_status_payload("bad_id", MagicMock()) is None
+
+def test_play_move_invalidates_cached_status(repo, game_x_turn):
+    cache = StatusPayloadCache()
+    cache.put("game123", 0, b"stale")
+    service = GameService(repo, status_cache=cache)
+    repo.get.return_value = game_x_turn
+    assert service.play_move("game123", "X", 1, 1).success
+    assert len(cache) == 0
+
+@pytest.fixture
+def stats_repo():
+    return MagicMock()
+
+@pytest.fixture
+def service_with_stats(repo, stats_repo):
+    return GameService(repo, stats_repo)
+
+def test_create_game_records_stats(service_with_stats, stats_repo):
+    service_with_stats.create_game()
+    stats_repo.record_game_created.assert_called_once()
+
+def test_play_move_records_finished_game(service_with_stats, repo, stats_repo, game):
+    for player, x, y in [(Player.X, 1, 1), (Player.O, 1, 2), (Player.X, 2, 1), (Player.O, 2, 2)]:
+        mark_cell(game, x, y, player)
+    game.next_player = Player.X
+    repo.get.return_value = game
+    result = service_with_stats.play_move("game123", "X", 3, 1)
+    assert "has won" in result.message
+    stats_repo.record_game_finished.assert_called_once_with(game)
+    assert game.winner == Player.X and game.first_move == Position(1, 1)
+
+def test_play_move_unfinished_does_not_record(service_with_stats, repo, stats_repo, game):
+    repo.get.return_value = game
+    service_with_stats.play_move("game123", "X", 1, 1)
+    stats_repo.record_game_finished.assert_not_called()
+
+def test_get_stats_computes_rates(service_with_stats, stats_repo):
+    stats_repo.get.return_value = GameStats(
+        total_games=10, finished_games=4, x_wins=2, o_wins=1, draws=1,
+        openings=[OpeningStats("2,2", finished_games=4, x_wins=2, o_wins=1, draws=1)]
+    )
+    result = service_with_stats.get_stats()
+    assert result.active_games == 6
+    assert result.first_move_win_rates[0].x_win_rate == 0.5
+    assert result.first_move_win_rates[0].draw_rate == 0.25
+
+def test_get_stats_without_stats_repo(service):
+    assert service.get_stats() is None
+
+def test_get_statuses_keeps_requested_order(service, repo):
+    repo.get_many.return_value = {"g2": Game("g2"), "g1": Game("g1")}
+    statuses = service.get_statuses(["g1", "missing", "g2"])
+    assert [s.game_id for s in statuses] == ["g1", "g2"]
+
+def test_list_games(service, repo):
+    repo.list_game_ids.return_value = ["g1", "g2"]
+    assert service.list_games(2, "g0") == ["g1", "g2"]
+    repo.list_game_ids.assert_called_once_with(2, "g0")
+
+@pytest.fixture
+def idempotency_repo():
+    repo = MagicMock()
+    repo.get.return_value = None
+    return repo
+
+def test_play_move_stores_idempotency_key(repo, idempotency_repo, game_x_turn):
+    cache = IdempotencyCache()
+    service = GameService(repo, idempotency_repo=idempotency_repo, idempotency_cache=cache)
+    repo.get.return_value = game_x_turn
+
+    result = service.play_move("game123", "X", 1, 1, idempotency_key="k1")
+    stored = IdempotentMove("game123", "k1", "X", 1, 1, result.message, 1)
+    idempotency_repo.add.assert_called_once_with(stored)
+    assert cache.get("game123", "k1") == stored
+
+def test_play_move_replays_idempotency_key_without_reading_game(repo, idempotency_repo):
+    cache = IdempotencyCache()
+    service = GameService(repo, idempotency_repo=idempotency_repo, idempotency_cache=cache)
+    idempotency_repo.get.return_value = IdempotentMove("game123", "k1", "X", 1, 1, "Move registered", 1)
+
+    for _ in range(2):  # From the repository, then from the cache
+        result = service.play_move("game123", "X", 1, 1, idempotency_key="k1")
+        assert (result.success, result.message, result.version, result.replayed) == (True, "Move registered", 1, True)
+    idempotency_repo.get.assert_called_once_with("game123", "k1")
+    repo.get.assert_not_called()
+    repo.add.assert_not_called()
+
+def test_replayed_move_reports_the_same_game_state(repo, idempotency_repo):
+    service = GameService(repo, idempotency_repo=idempotency_repo)
+    results = []
+    for moves, last in [([(1, 1), (1, 2)], (2, 2)), ([(1, 1), (1, 2), (2, 1), (2, 2)], (3, 1))]:
+        game = Game("game123")
+        for x, y in moves:
+            game.play_move(Position(x, y))
+        repo.get.return_value = game
+        idempotency_repo.get.return_value = None
+        first = service.play_move("game123", "X", *last, idempotency_key=f"k{len(moves)}")
+        idempotency_repo.get.return_value = idempotency_repo.add.call_args.args[0]
+        retry = service.play_move("game123", "X", *last, idempotency_key=f"k{len(moves)}")
+        assert retry.replayed
+        results.append([(r.next_player, r.winner, r.is_finished) for r in (first, retry)])
+
+    assert results == [[("O", None, False)] * 2, [(None, "X", True)] * 2]
+
+def test_replay_reports_the_stored_game_state_whatever_its_message(repo, idempotency_repo):
+    service = GameService(repo, idempotency_repo=idempotency_repo)
+    idempotency_repo.get.return_value = IdempotentMove("game123", "k1", "O", 2, 2, "O wins", 6, "O", True)
+    result = service.play_move("game123", "O", 2, 2, idempotency_key="k1")
+    assert (result.next_player, result.winner, result.is_finished) == (None, "O", True)
+
+def test_play_move_rejects_idempotency_key_reused_for_another_move(repo, idempotency_repo):
+    service = GameService(repo, idempotency_repo=idempotency_repo)
+    idempotency_repo.get.return_value = IdempotentMove("game123", "k1", "X", 1, 1, "Move registered", 1)
+    result = service.play_move("game123", "X", 2, 2, idempotency_key="k1")
+    assert result.success is False
+    repo.get.assert_not_called()
+
+def test_rejected_move_does_not_store_idempotency_key(repo, idempotency_repo, game):
+    service = GameService(repo, idempotency_repo=idempotency_repo)
+    repo.get.return_value = game
+    assert not service.play_move("game123", "O", 1, 1, idempotency_key="k1").success
+    idempotency_repo.add.assert_not_called()
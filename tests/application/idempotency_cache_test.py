@@ -0,0 +1,38 @@
+from src.application.idempotency_cache import IdempotencyCache
+from src.domain.entities.idempotent_move import IdempotentMove
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def move(key, game_id="g1"):
+    return IdempotentMove(game_id, key, "X", 1, 1, "Move registered, next player is O", 1)
+
+def test_get_returns_stored_move():
+    cache = IdempotencyCache()
+    cache.put(move("k1"))
+    assert cache.get("g1", "k1") == move("k1")
+    assert cache.get("g2", "k1") is None  # Keys are scoped to their game
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = IdempotencyCache(ttl_seconds=60, clock=clock)
+    cache.put(move("k1"))
+    clock.now = 59
+    assert cache.get("g1", "k1") is not None
+    clock.now = 60
+    assert cache.get("g1", "k1") is None
+    assert len(cache) == 0
+
+def test_evicts_least_recently_used():
+    cache = IdempotencyCache(max_keys=2)
+    cache.put(move("k1"))
+    cache.put(move("k2"))
+    cache.get("g1", "k1")
+    cache.put(move("k3"))
+    assert cache.get("g1", "k2") is None
+    assert cache.get("g1", "k1") is not None and cache.get("g1", "k3") is not None
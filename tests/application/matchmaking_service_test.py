@@ -0,0 +1,106 @@
+import asyncio
+import itertools
+import threading
+import pytest
+from src.application.matchmaking_service import MatchmakingService, MatchmakingQueueFull
+
+
+@pytest.fixture
+def service():
+    ids = itertools.count()
+    return MatchmakingService(lambda: f"game{next(ids)}", max_waiting=2)
+
+def test_pairs_players_in_fifo_order(service):
+    async def scenario():
+        first = asyncio.create_task(service.join(timeout=1))
+        await asyncio.sleep(0)
+        second = await service.join(timeout=1)
+        return await first, second
+
+    first, second = asyncio.run(scenario())
+    assert first.game_id == second.game_id == "game0"
+    assert (first.player, second.player) == ("X", "O")
+    assert service.waiting == 0
+
+def test_rating_buckets_are_separate(service):
+    async def scenario():
+        low = asyncio.create_task(service.join(rating=50, timeout=0.05))
+        await asyncio.sleep(0)
+        high = await service.join(rating=950, timeout=0.05)
+        return await low, high
+
+    assert asyncio.run(scenario()) == (None, None)
+    assert service.waiting == 0
+
+def test_timeout_leaves_queue(service):
+    assert asyncio.run(service.join(timeout=0.01)) is None
+    assert service.waiting == 0
+
+def test_queue_full(service):
+    async def scenario():
+        waiters = [asyncio.create_task(service.join(rating=r, timeout=0.05)) for r in (0, 500)]
+        await asyncio.sleep(0)
+        with pytest.raises(MatchmakingQueueFull):
+            await service.join(rating=900, timeout=0.05)
+        await asyncio.gather(*waiters)
+
+    asyncio.run(scenario())
+
+def test_create_game_failure_propagates_to_both_players():
+    def fail():
+        raise RuntimeError("db down")
+    service = MatchmakingService(fail)
+
+    async def scenario():
+        first = asyncio.create_task(service.join(timeout=1))
+        await asyncio.sleep(0)
+        with pytest.raises(RuntimeError):
+            await service.join(timeout=1)
+        with pytest.raises(RuntimeError):
+            await first
+
+    asyncio.run(scenario())
+
+def test_cancelled_pairing_releases_the_waiting_player():
+    release = threading.Event()
+    service = MatchmakingService(lambda: release.wait(1) and "game0")
+
+    async def scenario():
+        first = asyncio.create_task(service.join(timeout=0.2))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(service.join(timeout=0.2))
+        await asyncio.sleep(0.05)
+        second.cancel()
+        try:
+            return await asyncio.wait_for(first, 1)
+        finally:
+            release.set()
+
+    assert asyncio.run(scenario()) is None
+
+def test_wait_for_the_game_of_a_late_pairing_is_bounded():
+    release = threading.Event()
+    service = MatchmakingService(lambda: release.wait(1) and "game0", start_timeout=0.05)
+
+    async def scenario():
+        first = asyncio.create_task(service.join(timeout=0.05))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(service.join(timeout=0.05))
+        late = await asyncio.wait_for(first, 1)
+        release.set()
+        return late, await second
+
+    late, second = asyncio.run(scenario())
+    assert late is None and second.game_id == "game0"
+
+def test_cancelled_waiter_leaves_the_queue(service):
+    async def scenario():
+        first = asyncio.create_task(service.join(timeout=1))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await service.join(timeout=0.01)
+
+    assert asyncio.run(scenario()) is None
+    assert service.waiting == 0
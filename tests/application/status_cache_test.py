@@ -0,0 +1,35 @@
+from src.application.status_cache import StatusPayloadCache
+
+
+def test_payload_is_only_returned_for_its_version():
+    cache = StatusPayloadCache()
+    cache.put("g1", 2, b"v2")
+    assert cache.get("g1", 2) == b"v2"
+    assert cache.get("g1", 3) is None
+    assert cache.get("g2", 2) is None
+
+def test_invalidate_drops_the_game():
+    cache = StatusPayloadCache()
+    cache.put("g1", 0, b"v0")
+    cache.invalidate("g1")
+    cache.invalidate("unknown")
+    assert cache.get("g1", 0) is None
+
+def test_least_recently_used_games_are_evicted():
+    cache = StatusPayloadCache(max_games=2)
+    cache.put("g1", 0, b"1")
+    cache.put("g2", 0, b"2")
+    cache.get("g1", 0)
+    cache.put("g3", 0, b"3")
+    assert len(cache) == 2
+    assert cache.get("g2", 0) is None
+    assert cache.get("g1", 0) == b"1"
+
+def test_payloads_are_kept_per_format_until_the_version_changes():
+    cache = StatusPayloadCache()
+    cache.put("g1", 0, b"json")
+    cache.put("g1", 0, b"bin", fmt="binary")
+    assert cache.get("g1", 0) == b"json"
+    assert cache.get("g1", 0, fmt="binary") == b"bin"
+    cache.put("g1", 1, b"json1")
+    assert cache.get("g1", 1, fmt="binary") is None
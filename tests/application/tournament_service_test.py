@@ -0,0 +1,88 @@
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.bots import MinimaxBot, GreedyBot, get_bot
+from src.application.tournament_service import TournamentService, Match, play_match, replay
+from src.domain.entities.game import Game
+from src.domain.value_objects.position import Position
+
+
+def test_play_match_is_deterministic_and_replayable():
+    first = play_match(Match("random", "greedy", seed=42))
+    assert first == play_match(Match("random", "greedy", seed=42))
+
+    game = replay(first)
+    assert game.is_finished
+    assert game.game_id == first.game_id
+    assert game.version == len(first.moves)
+
+def test_minimax_never_loses():
+    for seed in range(30):
+        for x, o in (("minimax", "random"), ("random", "minimax"), ("minimax", "greedy")):
+            assert play_match(Match(x, o, seed)).winner in ("minimax", None)
+
+def test_minimax_self_play_is_a_draw():
+    assert play_match(Match("minimax", "minimax", 1)).winner is None
+
+def test_greedy_bot_takes_the_win():
+    game = Game("g1")
+    for x, y in [(1, 1), (1, 2), (2, 1), (2, 2)]:
+        game.play_move(Position(x, y))
+    assert GreedyBot().choose_move(game, random.Random(0)) == Position(3, 1)
+    assert MinimaxBot().choose_move(game, random.Random(0)) == Position(3, 1)
+
+def test_unknown_bot():
+    with pytest.raises(ValueError):
+        get_bot("nope")
+
+def test_round_robin_standings():
+    service = TournamentService(workers=0, chunk_size=7)
+    result = service.run_round_robin(["random", "greedy", "minimax"], games_per_pair=10, seed=1)
+
+    assert len(result.results) == 3 * 2 * 10
+    assert all(standing.played == 40 for standing in result.standings)
+    assert result.standings[0].bot == "minimax"
+    assert result.standings[0].losses == 0
+    assert sum(s.wins for s in result.standings) == sum(s.losses for s in result.standings)
+
+def test_process_pool_gives_the_same_results_as_in_process():
+    bots = ["random", "greedy"]
+    inline = TournamentService(workers=0).run_round_robin(bots, games_per_pair=20, seed=9, nonce=1)
+    pooled = TournamentService(workers=2, chunk_size=5).run_round_robin(bots, games_per_pair=20, seed=9, nonce=1)
+    assert pooled.results == inline.results
+    assert pooled.standings == inline.standings
+
+def test_swiss_pairs_new_opponents_and_gives_byes():
+    service = TournamentService(workers=0)
+    bots = ["random", "greedy", "minimax"]
+    result = service.run_swiss(bots, rounds=3, games_per_match=2, seed=3)
+
+    assert len(result.results) == 3 * 2  # One pairing per round with three bots
+    pairings = [frozenset((r.x, r.o)) for r in result.results[::2]]
+    assert len(set(pairings)) == 3
+    assert {r.x for r in result.results[:2]} == set(pairings[0])  # Sides alternate
+
+def test_swiss_bye_scores_as_a_won_match():
+    service = TournamentService(workers=0)
+    result = service.run_swiss(["random", "greedy", "minimax"], rounds=1, games_per_match=2, seed=3)
+
+    idle = next(s for s in result.standings if s.played == 0)
+    assert (idle.byes, idle.points) == (1, 2)
+    assert sum(s.points for s in result.standings) == 2 * 2
+
+def test_runs_with_the_same_seed_play_the_same_games_under_new_ids():
+    service = TournamentService(workers=0)
+    first, second = (service.run_round_robin(["random", "greedy"], games_per_pair=3, seed=0) for _ in range(2))
+    assert [r.moves for r in first.results] == [r.moves for r in second.results]
+    assert not {r.game_id for r in first.results} & {r.game_id for r in second.results}
+
+def test_results_are_stored_in_batches():
+    repo = MagicMock()
+    service = TournamentService(repo, workers=0, store_batch_size=4)
+    service.run_round_robin(["random", "greedy"], games_per_pair=5, seed=0)
+
+    stored = [game for call in repo.add_many.call_args_list for game in call.args[0]]
+    assert [len(call.args[0]) for call in repo.add_many.call_args_list] == [4, 4, 2]
+    assert all(game.is_finished for game in stored)
@@ -2,6 +2,7 @@ import pytest
 from src.domain.entities.game import Game
 from src.domain.value_objects.position import Position
 from src.domain.value_objects.player import Player
+from src.domain.value_objects.move_outcome import MoveOutcome
 from src.domain.exceptions import InvalidMove, GameFinished
 
 @pytest.fixture
@@ -64,3 +65,30 @@ def test_draw(game):
 
     assert game.is_finished is True
     assert game.winner is None
+
+def test_version_counts_accepted_moves(game):
+    game.play_move(Position(1, 1))
+    with pytest.raises(InvalidMove):
+        game.play_move(Position(1, 1))
+    assert game.version == 1
+
+def test_first_move_is_recorded(game):
+    game.play_move(Position(2, 2))
+    game.play_move(Position(1, 1))
+    assert game.first_move == Position(2, 2)
+
+def test_try_play_move_returns_outcomes_without_raising(game):
+    assert game.try_play_move(Position.at(1, 1)) is MoveOutcome.OK
+    assert game.try_play_move(Position.at(1, 1)) is MoveOutcome.CELL_TAKEN
+    game.is_finished = True
+    assert game.try_play_move(Position.at(2, 2)) is MoveOutcome.GAME_FINISHED
+    assert game.version == 1
+
+def test_win_on_diagonal_through_last_move(game):
+    for x, y in [(1, 3), (1, 1), (2, 2), (2, 1), (3, 1)]:
+        assert game.try_play_move(Position.at(x, y)) is MoveOutcome.OK
+    assert game.winner == Player.X
+
+def test_game_has_no_instance_dict(game):
+    with pytest.raises(AttributeError):
+        game.unknown = 1
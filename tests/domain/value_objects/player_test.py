@@ -17,3 +17,8 @@ def test_from_str_invalid():
 def test_opponent_method():
     assert Player.X.opponent() == Player.O
     assert Player.O.opponent() == Player.X
+
+def test_parse():
+    assert Player.parse("X") is Player.X
+    assert Player.parse("O") is Player.O
+    assert Player.parse("A") is None
@@ -29,3 +29,12 @@ def test_equality():
     pos3 = Position(3, 2)
     assert pos1 == pos2
     assert pos1 != pos3
+
+def test_at_returns_shared_instances():
+    assert Position.at(2, 3) is Position.at(2, 3)
+    assert Position.at(2, 3) == Position(2, 3)
+    assert hash(Position.at(2, 3)) == hash(Position(2, 3))
+
+def test_at_returns_none_out_of_range():
+    assert Position.at(0, 1) is None
+    assert Position.at(1, 4) is None
@@ -0,0 +1,62 @@
+import pytest
+
+from src.application.dtos import GameStatus, MoveResult
+from src.infrastructure.api import binary_codec
+
+GAME_ID = "0b7c5a4e-2f55-4c1e-9d8a-3f1d2a6b9c01"
+
+
+def test_move_request_round_trip():
+    body = binary_codec.encode_move_request(GAME_ID, "X", 1, 3)
+    assert len(body) == 19
+    request = binary_codec.decode_move_request(body)
+    assert (request.gameId, request.playerId, request.square.x, request.square.y) == (GAME_ID, "X", 1, 3)
+
+def test_move_request_with_wrong_size_is_rejected():
+    with pytest.raises(ValueError):
+        binary_codec.decode_move_request(b"\x01" * 18)
+
+@pytest.mark.parametrize("result", [
+    MoveResult(success=True, version=1, next_player="O"),
+    MoveResult(success=True, version=9, is_finished=True),
+    MoveResult(success=True, version=6, winner="O", is_finished=True),
+])
+def test_move_response_round_trip(result):
+    payload = binary_codec.encode_move_response(result)
+    assert len(payload) == 5
+    assert binary_codec.decode_move_response(payload) == result
+
+@pytest.mark.parametrize("game_status", [
+    GameStatus(GAME_ID, [[None] * 3 for _ in range(3)], "X", None, False, 0),
+    GameStatus(GAME_ID, [["X", "O", "X"], ["O", "X", "O"], ["O", "X", "O"]], None, None, True, 9),
+    GameStatus(GAME_ID, [["O", "O", "O"], ["X", "X", None], ["X", None, None]], None, "O", True, 6),
+])
+def test_status_round_trip(game_status):
+    payload = binary_codec.encode_status(game_status)
+    assert len(payload) == 25
+    assert binary_codec.decode_status(payload) == game_status
+
+@pytest.mark.parametrize("content_type, expected", [
+    (None, False),
+    ("application/json", False),
+    ("application/x-tictactoe", True),
+    ("Application/X-TicTacToe; charset=binary", True),
+    ("application/x-tictactoe-v2", False),
+])
+def test_is_binary(content_type, expected):
+    assert binary_codec.is_binary(content_type) is expected
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, False),
+    ("*/*", False),
+    ("application/json", False),
+    ("application/x-tictactoe", True),
+    ("application/x-tictactoe, application/json;q=0.5", True),
+    ("application/json, application/x-tictactoe;q=0.5", False),
+    ("application/x-tictactoe;q=0, */*", False),
+    ("application/x-tictactoe;q=0", False),
+    ("application/x-tictactoe-v2", False),
+    ("text/plain; q=0.1, application/x-tictactoe ; q=0.8", True),
+])
+def test_accepts_binary(accept, expected):
+    assert binary_codec.accepts_binary(accept) is expected
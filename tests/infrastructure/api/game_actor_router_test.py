@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from src.application.game_actors import GameActorSystem
+from src.application.game_service import GameService
+from src.infrastructure.api.routers import game_actor_router
+
+
+@pytest.fixture
+def repo():
+    repo = MagicMock()
+    repo.get.return_value = None
+    return repo
+
+@pytest.fixture
+def client(repo):
+    @contextmanager
+    def open_service():
+        yield GameService(repo, MagicMock())
+
+    actors = GameActorSystem(open_service)
+    app = FastAPI()
+    app.include_router(game_actor_router.router, prefix="/games")
+    app.dependency_overrides[game_actor_router.get_game_actors] = lambda: actors
+    with TestClient(app) as client:
+        yield client
+
+def test_game_is_played_through_its_actor(client, repo):
+    game_id = client.post("/games/create").json()["gameId"]
+
+    response = client.post("/games/move", json={"gameId": game_id, "playerId": "X", "square": {"x": 2, "y": 2}})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"status": "Move registered, next player is O", "version": 1}
+
+    response = client.get("/games/status", params={"game_id": game_id})
+    assert response.json()["board"][1][1] == "X"
+    repo.get.assert_not_called()
+
+def test_move_rejected(client):
+    game_id = client.post("/games/create").json()["gameId"]
+    response = client.post("/games/move", json={"gameId": game_id, "playerId": "O", "square": {"x": 1, "y": 1}})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_unknown_game(client):
+    assert client.get("/games/status", params={"game_id": "missing"}).status_code == status.HTTP_404_NOT_FOUND
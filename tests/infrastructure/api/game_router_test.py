@@ -3,7 +3,10 @@ from fastapi import FastAPI, status
 from unittest.mock import MagicMock
 import pytest
 
+from src.application.dtos import GameStatus, MoveResult
+from src.infrastructure.api import binary_codec
 from src.infrastructure.api.routers import game_router
+from src.infrastructure.api.serialization import dumps
 
 @pytest.fixture
 def mock_service():
@@ -31,13 +34,24 @@ def test_move_success(client, mock_service):
     move_result = MagicMock()
     move_result.success = True
     move_result.message = "Move registered"
+    move_result.version = 1
     mock_service.play_move.return_value = move_result
 
     payload = {"gameId": "game123", "playerId": "X", "square": {"x": 1, "y": 1}}
     response = client.post("/games/move", json=payload)
     assert response.status_code == status.HTTP_200_OK
-    assert response.json() == {"status": "Move registered"}
-    mock_service.play_move.assert_called_once_with("game123", "X", 1, 1)
+    assert response.json() == {"status": "Move registered", "version": 1}
+    mock_service.play_move.assert_called_once_with("game123", "X", 1, 1, None)
+
+def test_move_with_idempotency_key(client, mock_service):
+    mock_service.play_move.return_value = MoveResult(success=True, message="Move registered", version=1, replayed=True)
+
+    payload = {"gameId": "game123", "playerId": "X", "square": {"x": 1, "y": 1}}
+    response = client.post("/games/move", json=payload, headers={"Idempotency-Key": "retry-1"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"status": "Move registered", "version": 1}
+    assert response.headers["idempotent-replayed"] == "true"
+    mock_service.play_move.assert_called_once_with("game123", "X", 1, 1, "retry-1")
 
 def test_move_failure(client, mock_service):
     move_result = MagicMock()
@@ -51,14 +65,92 @@ def test_move_failure(client, mock_service):
     assert response.json()["detail"] == "Invalid move"
 
 def test_status_success(client, mock_service):
-    mock_service.get_status.return_value = {"game_id": "game123", "board": [[None]*3 for _ in range(3)]}
+    mock_service.get_status_payload.side_effect = lambda game_id, render, min_version: render(
+        GameStatus(game_id, [[None] * 3 for _ in range(3)], "X", None, False)
+    )
     response = client.get("/games/status", params={"game_id": "game123"})
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["game_id"] == "game123"
-    mock_service.get_status.assert_called_once_with("game123")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "game_id": "game123", "board": [[None] * 3 for _ in range(3)], "next_player": "X",
+        "winner": None, "is_finished": False, "version": 0
+    }
+    mock_service.get_status_payload.assert_called_once_with("game123", dumps, None)
+
+def test_status_with_min_version(client, mock_service):
+    mock_service.get_status_payload.return_value = b'{"game_id":"game123"}'
+    client.get("/games/status", params={"game_id": "game123", "min_version": 3})
+    mock_service.get_status_payload.assert_called_once_with("game123", dumps, 3)
 
 def test_status_not_found(client, mock_service):
-    mock_service.get_status.return_value = None
+    mock_service.get_status_payload.return_value = None
     response = client.get("/games/status", params={"game_id": "bad_id"})
     assert response.status_code == status.HTTP_404_NOT_FOUND
     assert response.json()["detail"] == "Game not found"
+
+def test_stats_success(client, mock_service):
+    mock_service.get_stats.return_value = {"total_games": 3, "active_games": 1}
+    response = client.get("/games/stats")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total_games"] == 3
+
+def test_stats_unavailable(client, mock_service):
+    mock_service.get_stats.return_value = None
+    response = client.get("/games/stats")
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+def test_status_batch(client, mock_service):
+    mock_service.get_statuses.return_value = [{"game_id": "g1"}]
+    response = client.post("/games/status/batch", json={"gameIds": ["g1", "g2"]})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{"game_id": "g1"}]
+    mock_service.get_statuses.assert_called_once_with(["g1", "g2"])
+
+def test_status_batch_rejects_empty_list(client):
+    response = client.post("/games/status/batch", json={"gameIds": []})
+    assert response.status_code == 422
+
+def test_list_games_pages(client, mock_service):
+    mock_service.list_games.return_value = ["g1", "g2"]
+    response = client.get("/games/list", params={"limit": 2})
+    assert response.json() == {"gameIds": ["g1", "g2"], "next": "g2"}
+    mock_service.list_games.return_value = ["g3"]
+    response = client.get("/games/list", params={"limit": 2, "after": "g2"})
+    assert response.json() == {"gameIds": ["g3"], "next": None}
+    mock_service.list_games.assert_called_with(2, "g2")
+
+GAME_ID = "0b7c5a4e-2f55-4c1e-9d8a-3f1d2a6b9c01"
+
+def test_move_accepts_binary_body_and_returns_binary(client, mock_service):
+    mock_service.play_move.return_value = MoveResult(success=True, message="Player O has won!", version=7,
+                                                     winner="O", is_finished=True)
+    response = client.post(
+        "/games/move",
+        content=binary_codec.encode_move_request(GAME_ID, "O", 2, 3),
+        headers={"Content-Type": binary_codec.BINARY_MEDIA_TYPE, "Accept": binary_codec.BINARY_MEDIA_TYPE},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == binary_codec.BINARY_MEDIA_TYPE
+    assert binary_codec.decode_move_response(response.content) == MoveResult(
+        success=True, version=7, winner="O", is_finished=True)
+    mock_service.play_move.assert_called_once_with(GAME_ID, "O", 2, 3, None)
+
+def test_move_rejects_malformed_binary_body(client, mock_service):
+    response = client.post("/games/move", content=b"\x00" * 5,
+                           headers={"Content-Type": binary_codec.BINARY_MEDIA_TYPE})
+    assert response.status_code == 422
+    mock_service.play_move.assert_not_called()
+
+def test_move_rejects_invalid_json_body(client, mock_service):
+    response = client.post("/games/move", json={"gameId": "game123", "playerId": "X"})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "square"]
+
+def test_status_returns_binary_when_accepted(client, mock_service):
+    game_status = GameStatus(GAME_ID, [["X", None, None], [None, "O", None], [None, None, None]], "X", None, False, 2)
+    mock_service.get_status_payload.side_effect = lambda game_id, render, min_version: render(game_status)
+    response = client.get("/games/status", params={"game_id": GAME_ID},
+                          headers={"Accept": binary_codec.BINARY_MEDIA_TYPE})
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.content) == binary_codec.STATUS.size
+    assert binary_codec.decode_status(response.content) == game_status
@@ -0,0 +1,33 @@
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from src.infrastructure.api.routers import health_router
+from src.infrastructure.startup import StartupReport
+
+
+@pytest.fixture
+def report(monkeypatch):
+    report = StartupReport()
+    monkeypatch.setattr(health_router, "startup_report", report)
+    return report
+
+@pytest.fixture
+def client(report):
+    app = FastAPI()
+    app.include_router(health_router.router, prefix="/health")
+    return TestClient(app)
+
+def test_live_answers_before_ready(client):
+    assert client.get("/health/live").status_code == status.HTTP_200_OK
+    assert client.get("/health/ready").status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+def test_ready_once_bootstrapped(client, report):
+    with report.phase("schema check (primary)"):
+        pass
+    report.mark_ready()
+    assert client.get("/health/ready").json() == {"status": "ready"}
+
+    startup = client.get("/health/startup").json()
+    assert startup["ready"] is True
+    assert startup["phases"][0]["phase"] == "schema check (primary)"
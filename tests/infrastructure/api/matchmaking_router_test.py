@@ -0,0 +1,63 @@
+import asyncio
+from fastapi.testclient import TestClient
+from fastapi import FastAPI, status
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+
+from src.application.matchmaking_service import MatchAssignment, MatchmakingQueueFull
+from src.infrastructure.api.dtos import JoinRequest
+from src.infrastructure.api.routers import matchmaking_router
+
+@pytest.fixture
+def mock_service():
+    service = MagicMock()
+    service.join = AsyncMock()
+    return service
+
+@pytest.fixture
+def client(mock_service):
+    app = FastAPI()
+    app.include_router(matchmaking_router.router, prefix="/matchmaking")
+    app.dependency_overrides[matchmaking_router.get_matchmaking_service] = lambda: mock_service
+    return TestClient(app)
+
+def test_join_paired(client, mock_service):
+    mock_service.join.return_value = MatchAssignment("game123", "O")
+    response = client.post("/matchmaking/join", json={"rating": 1200, "timeout": 5})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"gameId": "game123", "playerId": "O"}
+    mock_service.join.assert_awaited_once_with(1200, 5)
+
+def test_join_without_body_uses_default_timeout(client, mock_service):
+    mock_service.join.return_value = MatchAssignment("game123", "X")
+    response = client.post("/matchmaking/join")
+    assert response.status_code == status.HTTP_200_OK
+    mock_service.join.assert_awaited_once_with(None, matchmaking_router.MAX_WAIT_SECONDS)
+
+def test_join_timeout(client, mock_service):
+    mock_service.join.return_value = None
+    response = client.post("/matchmaking/join", json={})
+    assert response.status_code == status.HTTP_408_REQUEST_TIMEOUT
+
+def test_join_queue_full(client, mock_service):
+    mock_service.join.side_effect = MatchmakingQueueFull("full")
+    response = client.post("/matchmaking/join", json={})
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+
+def test_join_leaves_the_queue_when_the_client_disconnects(mock_service):
+    cancelled = []
+
+    async def wait_forever(rating, timeout):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+    mock_service.join.side_effect = wait_forever
+    http_request = MagicMock()
+    http_request.is_disconnected = AsyncMock(return_value=True)
+
+    response = asyncio.run(matchmaking_router.join(http_request, JoinRequest(), mock_service))
+    assert response.status_code == 499
+    assert cancelled == [True]
@@ -0,0 +1,126 @@
+import os
+import pstats
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.api.profiling import ProfilingMiddleware, profiled, collapsed_stacks
+
+
+def _busy(n):
+    return sum(i * i for i in range(n))
+
+@pytest.fixture
+def engine():
+    return create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+@pytest.fixture
+def make_client(monkeypatch, engine, tmp_path):
+    monkeypatch.setenv("PROFILING_ENABLED", "true")
+
+    def make(**options):
+        app = FastAPI()
+
+        @app.get("/work")
+        @profiled
+        def work(n: int = 1000):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+            return {"total": _busy(n)}
+
+        app.add_middleware(ProfilingMiddleware, output_dir=str(tmp_path), **options)
+        return TestClient(app)
+
+    return make
+
+def test_profiled_is_a_no_op_when_disabled(monkeypatch):
+    monkeypatch.delenv("PROFILING_ENABLED", raising=False)
+    assert profiled(_busy) is _busy
+    assert ProfilingMiddleware.options_from_env() is None
+
+def test_request_with_token_is_profiled(make_client, tmp_path):
+    client = make_client(token="secret")
+    response = client.get("/work", headers={"X-Profile": "secret"})
+
+    assert response.status_code == 200
+    assert response.json() == {"total": _busy(1000)}
+    profile_id = response.headers["X-Profile-Id"]
+    assert response.headers["X-SQL-Queries"] == "2"
+    assert float(response.headers["X-SQL-Time-Ms"]) > 0
+
+    stats = pstats.Stats(str(tmp_path / f"{profile_id}.pstats"))
+    assert any(name == "_busy" for _, _, name in stats.stats)
+    collapsed = (tmp_path / f"{profile_id}.collapsed").read_text()
+    assert ":work:" in collapsed and ":_busy:" in collapsed
+
+def test_requests_without_token_are_not_profiled(make_client, tmp_path):
+    client = make_client(token="secret")
+    for headers in ({}, {"X-Profile": "wrong"}):
+        response = client.get("/work", headers=headers)
+        assert response.status_code == 200
+        assert "X-Profile-Id" not in response.headers
+    assert os.listdir(tmp_path) == []
+
+def test_sampled_requests_are_profiled(make_client):
+    client = make_client(sample_rate=1.0)
+    response = client.get("/work")
+    assert "X-Profile-Id" in response.headers
+
+def test_collapsed_stacks_split_time_by_call_path():
+    # Function keys are (file, line, name); values are (cc, nc, tt, ct, callers)
+    root, a, b, leaf = ("m.py", 1, "root"), ("m.py", 2, "a"), ("m.py", 3, "b"), ("m.py", 4, "leaf")
+    stats = pstats.Stats.__new__(pstats.Stats)
+    stats.stats = {
+        root: (1, 1, 0.0, 0.4, {}),
+        a: (1, 1, 0.0, 0.1, {root: (1, 1, 0.0, 0.1)}),
+        b: (1, 1, 0.0, 0.3, {root: (1, 1, 0.0, 0.3)}),
+        leaf: (2, 2, 0.4, 0.4, {a: (1, 1, 0.1, 0.1), b: (1, 1, 0.3, 0.3)}),
+    }
+    lines = dict(line.rsplit(" ", 1) for line in collapsed_stacks(stats))
+    assert lines == {
+        "m.py:root:1;m.py:a:2;m.py:leaf:4": "100000",
+        "m.py:root:1;m.py:b:3;m.py:leaf:4": "300000",
+    }
+
+def test_request_is_served_unprofiled_while_another_is_profiled(make_client, tmp_path):
+    from src.infrastructure.api import profiling
+
+    client = make_client(token="secret")
+    with profiling._profiler_lock:  # Another request holds the profiler
+        response = client.get("/work", headers={"X-Profile": "secret"})
+
+    assert response.status_code == 200
+    assert response.json() == {"total": _busy(1000)}
+    assert "X-Profile-Id" not in response.headers
+    assert response.headers["X-SQL-Queries"] == "2"
+    assert os.listdir(tmp_path) == []
+
+def test_request_is_served_unprofiled_when_another_profiler_is_active(make_client, tmp_path, monkeypatch):
+    import cProfile
+
+    calls = []
+
+    def refuse(self):
+        calls.append(self)
+        raise ValueError("Another profiling tool is already active")
+
+    monkeypatch.setattr(cProfile.Profile, "enable", refuse)
+    client = make_client(token="secret")
+    response = client.get("/work", headers={"X-Profile": "secret"})
+
+    assert response.status_code == 200
+    assert response.json() == {"total": _busy(1000)}
+    assert len(calls) == 1
+    assert "X-Profile-Id" not in response.headers
+
+def test_only_the_newest_profile_files_are_kept(make_client, tmp_path):
+    client = make_client(token="secret", max_files=4)
+    profile_ids = [client.get("/work", headers={"X-Profile": "secret"}).headers["X-Profile-Id"] for _ in range(3)]
+
+    assert len(os.listdir(tmp_path)) == 4
+    assert (tmp_path / f"{profile_ids[-1]}.pstats").exists()
+    assert not (tmp_path / f"{profile_ids[0]}.pstats").exists()
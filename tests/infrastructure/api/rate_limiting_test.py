@@ -0,0 +1,85 @@
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from src.infrastructure.api.rate_limiting import TokenBucketLimiter, RateLimitMiddleware, api_key_digest, client_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_bucket_allows_burst_then_refills(clock):
+    limiter = TokenBucketLimiter(rate=1, burst=2, clock=clock)
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") == pytest.approx(1.0)
+    clock.now = 1.0
+    assert limiter.acquire("a") == 0
+
+def test_buckets_are_per_key(clock):
+    limiter = TokenBucketLimiter(rate=1, burst=1, clock=clock)
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("b") == 0
+    assert limiter.acquire("a") > 0
+
+def test_least_recently_seen_keys_are_evicted(clock):
+    limiter = TokenBucketLimiter(rate=1, burst=1, max_keys=2, clock=clock)
+    limiter.acquire("a")
+    limiter.acquire("b")
+    limiter.acquire("a")
+    limiter.acquire("c")
+    assert len(limiter) == 2
+    assert limiter.acquire("b") == 0  # Evicted, starts with a full bucket
+
+def test_client_key_only_trusts_known_api_keys():
+    known = frozenset([api_key_digest(b"bot1")])
+    scope = {"headers": [(b"x-api-key", b"bot1")], "client": ("1.2.3.4", 1)}
+    assert client_key(scope, known) == "key:" + api_key_digest(b"bot1")[:16]
+    assert client_key(scope) == "ip:1.2.3.4"
+    assert client_key({"headers": [(b"x-api-key", b"made-up")], "client": ("1.2.3.4", 1)}, known) == "ip:1.2.3.4"
+    assert client_key({"headers": [], "client": ("1.2.3.4", 1)}, known) == "ip:1.2.3.4"
+
+@pytest.fixture
+def client(clock):
+    app = FastAPI()
+
+    @app.get("/read")
+    def read():
+        return {}
+
+    @app.post("/write")
+    def write():
+        return {}
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        read_limiter=TokenBucketLimiter(rate=0.5, burst=2, clock=clock),
+        write_limiter=TokenBucketLimiter(rate=0.5, burst=1, clock=clock),
+    )
+    return TestClient(app)
+
+def test_middleware_separates_read_and_write_budgets(client):
+    assert client.post("/write").status_code == status.HTTP_200_OK
+    response = client.post("/write")
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert response.headers["Retry-After"] == "2"
+    assert client.get("/read").status_code == status.HTTP_200_OK
+    assert client.get("/read").status_code == status.HTTP_200_OK
+    assert client.get("/read").status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+def test_rate_limiting_is_opt_in(monkeypatch):
+    monkeypatch.delenv("RATE_LIMIT_ENABLED", raising=False)
+    assert RateLimitMiddleware.options_from_env() is None
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+    assert set(RateLimitMiddleware.options_from_env()) == {"read_limiter", "write_limiter"}
+    monkeypatch.setenv("RATE_LIMIT_API_KEYS", "bot1, bot2")
+    key_func = RateLimitMiddleware.options_from_env()["key_func"]
+    assert key_func({"headers": [(b"x-api-key", b"bot2")], "client": ("1.2.3.4", 1)}).startswith("key:")
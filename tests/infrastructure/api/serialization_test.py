@@ -0,0 +1,30 @@
+import json
+
+import pytest
+
+from src.application.dtos import GameStatus
+from src.infrastructure.api import serialization
+from src.infrastructure.api.serialization import FastJSONResponse, dumps
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson is not installed")
+
+def test_dumps_serializes_dtos(encoder):
+    status = GameStatus("g1", [["X", None, None], [None] * 3, [None] * 3], "O", None, False, 1)
+    assert json.loads(dumps(status)) == {
+        "game_id": "g1", "board": [["X", None, None], [None] * 3, [None] * 3],
+        "next_player": "O", "winner": None, "is_finished": False, "version": 1
+    }
+
+def test_dumps_rejects_unknown_types(encoder):
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+def test_fast_json_response_renders_lists_of_dtos(encoder):
+    response = FastJSONResponse([GameStatus("g1", [], None, "X", True)])
+    assert json.loads(response.body)[0]["winner"] == "X"
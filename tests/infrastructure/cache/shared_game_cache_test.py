@@ -0,0 +1,124 @@
+import multiprocessing
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.entities.game import Game
+from src.domain.value_objects.player import Player
+from src.domain.value_objects.position import Position
+from src.infrastructure.cache.shared_game_cache import SharedGameCache, HEADER, SLOT, THREAD_LOCK_STRIPES
+from src.infrastructure.repositories.cached_game_repository import CachedGameRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "games.cache")
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def cache(path, clock):
+    cache = SharedGameCache(path, slots=64, ways=4, ttl_seconds=5, clock=clock)
+    yield cache
+    cache.close()
+
+def played(game_id, moves):
+    game = Game(game_id)
+    for x, y in moves:
+        game.play_move(Position(x, y))
+    return game
+
+def test_round_trip(cache):
+    game = played("g1", [(1, 1), (2, 2), (3, 1)])
+    cache.put(game)
+    cached = cache.get("g1")
+    assert cached.board.grid == game.board.grid
+    assert (cached.version, cached.next_player, cached.is_finished) == (3, Player.O, False)
+    assert cache.get("g2") is None
+
+    finished = played("g3", [(1, 1), (1, 2), (2, 1), (2, 2), (3, 1)])
+    cache.put(finished)
+    assert (cache.get("g3").winner, cache.get("g3").is_finished) == (Player.X, True)
+
+def test_entries_expire_and_respect_min_version(cache, clock):
+    cache.put(played("g1", [(1, 1)]))
+    assert cache.get("g1", min_version=2) is None
+    clock.now += 6
+    assert cache.get("g1") is None
+
+def test_older_version_never_replaces_newer(cache):
+    cache.put(played("g1", [(1, 1), (2, 2)]))
+    cache.put(played("g1", [(1, 1)]))
+    assert cache.get("g1").version == 2
+
+def test_full_bucket_evicts_oldest(path, clock):
+    cache = SharedGameCache(path, slots=2, ways=2, clock=clock)  # A single bucket
+    for i in range(3):
+        clock.now += 1
+        cache.put(played(f"g{i}", [(1, 1)]))
+    assert cache.get("g0") is None
+    assert cache.get("g1") is not None and cache.get("g2") is not None
+    cache.close()
+
+def test_slot_being_written_is_a_miss(cache):
+    cache.put(played("g1", [(1, 1)]))
+    offset = next(HEADER.size + i * SLOT.size for i in range(64) if cache._read(HEADER.size + i * SLOT.size)[1] != bytes(16))
+    cache._map[offset] |= 1  # Odd seqlock: write in progress
+    assert cache.get("g1") is None
+
+def test_write_after_a_crash_mid_write_restores_the_slot(cache):
+    cache.put(played("g1", [(1, 1)]))
+    offset = next(HEADER.size + i * SLOT.size for i in range(64) if cache._read(HEADER.size + i * SLOT.size)[1] != bytes(16))
+    cache._map[offset] |= 1  # A writer crashed mid-write, leaving the seqlock odd
+    cache.put(played("g1", [(1, 1), (2, 2)]))
+    assert cache.get("g1").version == 2
+    assert SLOT.unpack_from(cache._map, offset)[0] % 2 == 0
+
+def _put_from_another_process(path):
+    cache = SharedGameCache(path, slots=64, ways=4)
+    cache.put(played("shared", [(2, 2), (1, 1)]))
+    cache.close()
+
+def test_write_locks_spread_over_every_stripe(path, clock):
+    cache = SharedGameCache(path, slots=THREAD_LOCK_STRIPES * 8, ways=4, clock=clock)
+    used = set()
+    for bucket in range(cache.buckets):
+        with cache._write_lock(HEADER.size + bucket * cache.ways * SLOT.size):
+            used.add(next(i for i, lock in enumerate(cache._thread_locks) if lock.locked()))
+    cache.close()
+    assert used == set(range(THREAD_LOCK_STRIPES))
+
+def test_processes_share_one_segment(path):
+    cache = SharedGameCache(path, slots=64, ways=4)
+    process = multiprocessing.get_context("fork").Process(target=_put_from_another_process, args=(path,))
+    process.start()
+    process.join(10)
+
+    assert cache.get("shared").version == 2
+    other = SharedGameCache(path, slots=1024)  # Attaches to the existing layout
+    assert other.size == cache.size == os.path.getsize(path)
+    other.close()
+    cache.close()
+
+def test_cached_repository_serves_reads_from_cache(cache):
+    inner = MagicMock()
+    inner.get_for_read.return_value = played("g1", [(1, 1)])
+    repo = CachedGameRepository(inner, cache)
+
+    assert repo.get_for_read("g1").version == 1
+    assert repo.get_for_read("g1").version == 1
+    inner.get_for_read.assert_called_once()
+
+    repo.add(played("g1", [(1, 1), (3, 3)]))
+    assert repo.get_for_read("g1", min_version=2).version == 2
+    inner.get_for_read.assert_called_once()
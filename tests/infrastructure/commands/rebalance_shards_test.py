@@ -0,0 +1,90 @@
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.commands.rebalance_shards import rebalance
+from src.infrastructure.db.models import Base, GameModel
+from src.infrastructure.db.sharding import ConsistentHashRing, ShardSessions
+from src.infrastructure.repositories.game_repository_impl import GameRepositoryImpl
+from src.infrastructure.repositories.sharded_game_repository import ShardedGameRepository
+from src.infrastructure.repositories.sharded_idempotency_repository import ShardedIdempotencyRepository
+from src.application.game_service import GameService
+from src.domain.entities.game import Game
+from src.domain.value_objects.position import Position
+
+@pytest.fixture
+def factories():
+    result = {}
+    for shard in ["a", "b", "c"]:
+        engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        Base.metadata.create_all(engine)
+        result[shard] = sessionmaker(bind=engine)
+    return result
+
+def test_adding_a_shard_moves_its_games(factories):
+    old_ring = ConsistentHashRing(["a", "b"])
+    game_ids = [f"game-{i}" for i in range(60)]
+    for game_id in game_ids:
+        GameRepositoryImpl(factories[old_ring.shard_for(game_id)]()).add(Game(game_id))
+
+    new_ring = ConsistentHashRing(["a", "b", "c"])
+    moved = rebalance(factories, new_ring, sources=["a", "b"], batch_size=7)
+
+    expected = [game_id for game_id in game_ids if new_ring.shard_for(game_id) == "c"]
+    assert moved == len(expected) > 0
+    for game_id in game_ids:
+        owner = new_ring.shard_for(game_id)
+        for shard, factory in factories.items():
+            assert (factory().get(GameModel, game_id) is not None) == (shard == owner)
+
+    assert rebalance(factories, new_ring) == 0
+
+def test_games_are_read_from_their_previous_shard_until_moved(factories):
+    old_ring, new_ring = ConsistentHashRing(["a", "b"]), ConsistentHashRing(["a", "b", "c"])
+    game_ids = [f"game-{i}" for i in range(60)]
+    for game_id in game_ids:
+        GameRepositoryImpl(factories[old_ring.shard_for(game_id)]()).add(Game(game_id))
+    moving = next(game_id for game_id in game_ids if new_ring.shard_for(game_id) == "c")
+
+    shards = ShardSessions(new_ring, factories, ThreadPoolExecutor(2), previous_ring=old_ring)
+    repo = ShardedGameRepository(shards)
+    assert repo.get(moving) is not None
+    assert set(repo.get_many(game_ids)) == set(game_ids)
+
+    game = repo.get(moving)
+    game.play_move(Position(1, 1))
+    repo.add(game)  # Written on its new shard before being moved
+    shards.close()
+
+    rebalance(factories, new_ring, sources=["a", "b"])
+    assert GameRepositoryImpl(factories["c"]()).get(moving).version == 1
+
+def test_idempotency_keys_move_with_their_game(factories):
+    old_ring, new_ring = ConsistentHashRing(["a", "b"]), ConsistentHashRing(["a", "b", "c"])
+    old_shards = ShardSessions(old_ring, factories, ThreadPoolExecutor(2))
+    service = GameService(ShardedGameRepository(old_shards), idempotency_repo=ShardedIdempotencyRepository(old_shards))
+    game_id = next(game_id for game_id in (service.create_game() for _ in range(60))
+                   if new_ring.shard_for(game_id) == "c")
+    first = service.play_move(game_id, "X", 1, 1, idempotency_key="k1")
+    old_shards.close()
+
+    rebalance(factories, new_ring, sources=["a", "b"])
+
+    new_shards = ShardSessions(new_ring, factories, ThreadPoolExecutor(2))
+    service = GameService(ShardedGameRepository(new_shards), idempotency_repo=ShardedIdempotencyRepository(new_shards))
+    retry = service.play_move(game_id, "X", 1, 1, idempotency_key="k1")
+    new_shards.close()
+    assert retry.replayed and retry.version == first.version == 1
+    assert GameRepositoryImpl(factories["c"]()).get(game_id).version == 1
+
+def test_older_copy_on_the_new_shard_is_replaced(factories):
+    game = Game("game-1")
+    GameRepositoryImpl(factories["c"]()).add(game)  # Left by an earlier, interrupted run
+    game.play_move(Position(1, 1))
+    GameRepositoryImpl(factories["a"]()).add(game, insert_missing=True)
+
+    rebalance(factories, ConsistentHashRing(["c"]), sources=["a"])
+    assert GameRepositoryImpl(factories["c"]()).get("game-1").version == 1
+    assert factories["a"]().get(GameModel, "game-1") is None
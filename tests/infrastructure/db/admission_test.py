@@ -0,0 +1,12 @@
+import pytest
+from src.infrastructure.db.admission import ConcurrencyLimiter, DatabaseOverloaded
+
+def test_rejects_when_all_slots_taken():
+    limiter = ConcurrencyLimiter(max_concurrent=1, max_wait_seconds=0.01)
+    limiter.acquire()
+    with pytest.raises(DatabaseOverloaded) as exc:
+        limiter.acquire()
+    assert exc.value.retry_after == 1
+    limiter.release()
+    limiter.acquire()
+    limiter.release()
@@ -0,0 +1,37 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.db.bootstrap import DatabaseBootstrap
+from src.infrastructure.db.migrations import current_version, LATEST_VERSION
+from src.infrastructure.startup import StartupReport
+
+
+def test_bootstrap_migrates_warms_up_and_reports_ready(tmp_path):
+    factory = sessionmaker(bind=create_engine(f"sqlite:///{tmp_path / 'games.db'}"))
+    report = StartupReport()
+    ready = []
+    DatabaseBootstrap(lambda: {"primary": factory}, report, on_ready=ready.append).run_once()
+
+    assert report.ready and ready == [{"primary": factory}]
+    assert [phase["phase"] for phase in report.to_dict()["phases"]] == [
+        "create engines", "schema check (primary)", "pool warm-up (primary)"
+    ]
+    with factory() as db:
+        assert current_version(db) == LATEST_VERSION
+
+def test_bootstrap_retries_until_the_database_is_up(tmp_path):
+    factory = sessionmaker(bind=create_engine(f"sqlite:///{tmp_path / 'games.db'}"))
+    attempts = []
+
+    def databases():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("database is starting")
+        return {"primary": factory}
+
+    report = StartupReport()
+    bootstrap = DatabaseBootstrap(databases, report, retry_seconds=0.01)
+    bootstrap.start()
+    bootstrap._thread.join(5)
+    assert report.ready and len(attempts) == 3
+    assert report.error is None
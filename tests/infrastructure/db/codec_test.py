@@ -0,0 +1,16 @@
+import pytest
+from src.infrastructure.db.codec import encode_state, decode_state
+
+def test_round_trip():
+    board = [["X", "O", None], ["X", None, None], ["O", None, None]]
+    state = encode_state(board, "O")
+    assert state == "XO-X--O--O"
+    assert decode_state(state) == (board, "O")
+
+def test_no_next_player():
+    board = [[None] * 3 for _ in range(3)]
+    assert decode_state(encode_state(board, None)) == (board, None)
+
+def test_invalid_state_raises():
+    with pytest.raises(ValueError):
+        decode_state("XO")
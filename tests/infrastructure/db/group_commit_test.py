@@ -0,0 +1,127 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.application.game_service import GameService
+from src.domain.entities.game import Game
+from src.infrastructure.db.admission import DatabaseOverloaded
+from src.infrastructure.db.group_commit import GroupCommitWriter
+from src.infrastructure.db.models import Base, GameModel
+from src.infrastructure.repositories.game_repository_impl import GameRepositoryImpl
+from src.infrastructure.repositories.game_stats_repository_impl import GameStatsRepositoryImpl
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'games.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    factory.commits = 0
+
+    @event.listens_for(factory, "after_commit")
+    def count_commit(session):
+        factory.commits += 1
+
+    return factory
+
+@pytest.fixture
+def make_writer(session_factory):
+    writers = []
+
+    def make(**options):
+        writer = GroupCommitWriter(session_factory, **options)
+        writer.start()
+        writers.append(writer)
+        return writer
+
+    yield make
+    for writer in writers:
+        writer.stop()
+
+def insert(game_id):
+    return lambda db: db.add(GameModel(game_id=game_id, board=[[None] * 3] * 3, next_player="X", is_finished=False))
+
+def write_concurrently(writer, ops_per_request):
+    errors = {}
+
+    def run(i, ops):
+        try:
+            writer.write(ops, timeout=5)
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=run, args=(i, ops)) for i, ops in enumerate(ops_per_request)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+def test_concurrent_writes_share_one_commit(make_writer, session_factory):
+    writer = make_writer(max_batch_size=10, max_delay_seconds=2)
+    errors = write_concurrently(writer, [[insert(f"g{i}")] for i in range(10)])
+
+    assert errors == {}
+    assert session_factory.commits == 1
+    with session_factory() as db:
+        assert db.query(GameModel).count() == 10
+
+def test_failing_write_only_fails_its_own_request(make_writer, session_factory):
+    def boom(db):
+        raise ValueError("bad write")
+
+    writer = make_writer(max_batch_size=3, max_delay_seconds=2)
+    errors = write_concurrently(writer, [[insert("g1")], [insert("g2"), boom], [insert("g3")]])
+
+    assert list(errors) == [1]
+    assert isinstance(errors[1], ValueError)
+    with session_factory() as db:
+        assert {row.game_id for row in db.query(GameModel)} == {"g1", "g3"}
+
+def test_full_queue_sheds_writes(session_factory):
+    writer = GroupCommitWriter(session_factory, max_queue_size=1)
+    writer._thread = threading.current_thread()  # Pretend started, nothing consumes the queue
+    writer.submit([insert("g1")])
+    with pytest.raises(DatabaseOverloaded):
+        writer.submit([insert("g2")])
+
+def test_game_and_deferred_stats_commit_together(make_writer, session_factory):
+    with session_factory() as db:
+        GameStatsRepositoryImpl(db).ensure_initialized()
+    writer = make_writer(max_delay_seconds=0.001)
+
+    db = session_factory()
+    service = GameService(GameRepositoryImpl(db, writer=writer), GameStatsRepositoryImpl(db, deferred=True))
+    game_id = service.create_game()
+    for player, x, y in [("X", 1, 1), ("O", 1, 2), ("X", 2, 1), ("O", 2, 2), ("X", 3, 1)]:
+        assert service.play_move(game_id, player, x, y).success
+    db.close()
+
+    with session_factory() as db:
+        stats = GameStatsRepositoryImpl(db).get()
+        assert (stats.total_games, stats.finished_games, stats.x_wins) == (1, 1, 1)
+        game = GameRepositoryImpl(db).get(game_id)
+        assert game.is_finished and game.version == 5
+
+def test_write_not_committed_in_time_is_shed(session_factory):
+    writer = GroupCommitWriter(session_factory, write_timeout_seconds=0.01)
+    writer._thread = threading.current_thread()  # Pretend started, nothing consumes the queue
+    with pytest.raises(DatabaseOverloaded):
+        writer.write([insert("g1")])
+
+def test_stopped_writer_fails_queued_and_new_writes(session_factory):
+    release = threading.Event()
+    writer = GroupCommitWriter(session_factory, max_batch_size=1, max_delay_seconds=0)
+    writer.start()
+    blocked = writer.submit([lambda db: release.wait(5)])  # Keeps the writer busy
+    queued = writer.submit([insert("g1")])
+
+    writer.stop(timeout=0.05)
+    release.set()
+    with pytest.raises(DatabaseOverloaded):
+        queued.result(1)
+    with pytest.raises(RuntimeError):
+        writer.submit([insert("g2")])
+    blocked.result(5)
@@ -0,0 +1,89 @@
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.db.migrations import ensure_schema, current_version, LATEST_VERSION, MIGRATIONS, SCHEMA_VERSION_TABLE
+from src.infrastructure.db.models import Base, GameStatsModel, OpeningStatsModel, utcnow
+from src.infrastructure.repositories.game_repository_impl import GameRepositoryImpl
+from src.infrastructure.repositories.game_stats_repository_impl import STATS_STRIPES
+from src.infrastructure.repositories.idempotency_repository_impl import IdempotencyRepositoryImpl
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'games.db'}")
+
+def test_fresh_database_is_migrated_once(engine):
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as db:
+        assert ensure_schema(db) == LATEST_VERSION
+        assert current_version(db) == LATEST_VERSION
+        assert db.get(GameStatsModel, 1) is not None
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    with session_factory() as db:
+        assert ensure_schema(db) == 0
+    assert len(statements) == 1 and "schema_version" in statements[0]
+
+def test_migrations_seed_the_stats_rows_one_transaction_each(engine):
+    commits = []
+    with sessionmaker(bind=engine)() as db:
+        event.listen(db, "after_commit", lambda session: commits.append(True))
+        ensure_schema(db)
+        assert db.query(GameStatsModel).count() == STATS_STRIPES
+        assert db.query(OpeningStatsModel).count() == 9
+    assert len(commits) == 1 + LATEST_VERSION  # The schema_version table, then each migration
+
+def test_idempotent_moves_stored_before_version_5_get_their_game_state(engine):
+    with sessionmaker(bind=engine)() as db:
+        db.execute(text(SCHEMA_VERSION_TABLE))
+        for _, _, migrate in MIGRATIONS[:4]:
+            migrate(db)
+        db.execute(text("INSERT INTO schema_version VALUES (1, 4, :now)"), {"now": utcnow()})
+        for key, move, message in [("k1", "X1,1", "Move registered, next player is O"),
+                                   ("k2", "O2,2", "Player O has won!"), ("k3", "X3,3", "The game is a draw")]:
+            db.execute(text("INSERT INTO move_idempotency_keys VALUES ('g1', :key, :move, :message, 1, :now)"),
+                       {"key": key, "move": move, "message": message, "now": utcnow()})
+        db.commit()
+
+        assert ensure_schema(db) == 1
+        moves = sorted(IdempotencyRepositoryImpl(db).list_for_game("g1"), key=lambda move: move.key)
+    assert [(move.winner, move.is_finished) for move in moves] == [(None, False), ("O", True), (None, True)]
+
+def test_games_table_from_first_release_is_upgraded(engine):
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE games (game_id VARCHAR PRIMARY KEY, board JSON NOT NULL, "
+            "next_player VARCHAR, winner VARCHAR, is_finished BOOLEAN NOT NULL)"
+        ))
+        connection.execute(text(
+            "INSERT INTO games VALUES ('old', :board, 'O', NULL, 0)"
+        ), {"board": '[["X", null, null], [null, null, null], [null, null, null]]'})
+
+    with sessionmaker(bind=engine)() as db:
+        ensure_schema(db)
+        game = GameRepositoryImpl(db).get("old")
+
+    columns = {column["name"] for column in inspect(engine).get_columns("games")}
+    assert {"first_move", "version", "created_at", "updated_at"} <= columns
+    assert game.version == 0 and game.board.grid[0][0].value == "X"
+
+def test_migrated_schema_matches_the_models(engine, tmp_path):
+    with sessionmaker(bind=engine)() as db:
+        ensure_schema(db)
+    expected_engine = create_engine(f"sqlite:///{tmp_path / 'expected.db'}")
+    Base.metadata.create_all(expected_engine)
+
+    def schema(target):
+        inspector = inspect(target)
+        return {
+            table: (
+                {(column["name"], column["nullable"]) for column in inspector.get_columns(table)},
+                set(inspector.get_pk_constraint(table)["constrained_columns"]),
+                {tuple(index["column_names"]) for index in inspector.get_indexes(table)},
+            )
+            for table in inspector.get_table_names()
+        }
+
+    assert schema(engine) == schema(expected_engine)
@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+import pytest
+from src.infrastructure.db.admission import ConcurrencyLimiter, DatabaseOverloaded
+from src.infrastructure.db.sharding import ConsistentHashRing, ShardSessions
+
+KEYS = [f"game-{i}" for i in range(2000)]
+
+def test_keys_spread_over_all_shards():
+    ring = ConsistentHashRing(["a", "b", "c"])
+    counts = {shard: len(keys) for shard, keys in ring.group(KEYS).items()}
+    assert set(counts) == {"a", "b", "c"}
+    assert min(counts.values()) > len(KEYS) / 6
+
+def test_adding_a_shard_only_moves_keys_to_it():
+    before = ConsistentHashRing(["a", "b", "c"])
+    after = ConsistentHashRing(["a", "b", "c", "d"])
+    moved = [key for key in KEYS if before.shard_for(key) != after.shard_for(key)]
+    assert all(after.shard_for(key) == "d" for key in moved)
+    assert len(moved) < len(KEYS) / 2
+
+def test_placement_does_not_depend_on_shard_order():
+    assert ConsistentHashRing(["a", "b"]).shard_for("g1") == ConsistentHashRing(["b", "a"]).shard_for("g1")
+
+def test_empty_ring_raises():
+    with pytest.raises(ValueError):
+        ConsistentHashRing([])
+
+def test_shard_sessions_open_lazily_and_close():
+    factories = {"a": MagicMock(), "b": MagicMock()}
+    shards = ShardSessions(ConsistentHashRing(["a", "b"]), factories, ThreadPoolExecutor(2))
+    assert shards.scatter(["a", "b"], lambda db, shard: shard) == {"a": "a", "b": "b"}
+    assert shards.session("a") is factories["a"].return_value
+    factories["a"].assert_called_once()
+    shards.close()
+    factories["a"].return_value.close.assert_called_once()
+
+def test_shard_sessions_are_admitted_per_shard():
+    factories = {"a": MagicMock(), "b": MagicMock()}
+    admission = {"a": ConcurrencyLimiter(1, max_wait_seconds=0), "b": ConcurrencyLimiter(1, max_wait_seconds=0)}
+    ring = ConsistentHashRing(["a", "b"])
+    first = ShardSessions(ring, factories, ThreadPoolExecutor(2), admission=admission)
+    second = ShardSessions(ring, factories, ThreadPoolExecutor(2), admission=admission)
+    first.session("a")
+    second.session("b")
+    with pytest.raises(DatabaseOverloaded):
+        second.session("a")
+    first.close()
+    second.session("a")
+    second.close()
+
+def test_previous_shard_is_only_given_for_moved_keys():
+    before = ConsistentHashRing(["a", "b"])
+    after = ConsistentHashRing(["a", "b", "c"])
+    shards = ShardSessions(after, {}, ThreadPoolExecutor(1), previous_ring=before)
+    for key in KEYS[:200]:
+        expected = before.shard_for(key) if after.shard_for(key) == "c" else None
+        assert shards.previous_shard_for(key) == expected
+    assert ShardSessions(after, {}, ThreadPoolExecutor(1)).previous_shard_for(KEYS[0]) is None
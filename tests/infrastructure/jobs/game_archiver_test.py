@@ -0,0 +1,101 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.application.game_service import GameService
+from src.infrastructure.db.models import Base, GameModel, ArchivedGameModel, IdempotencyKeyModel, utcnow
+from src.infrastructure.jobs.game_archiver import GameArchiver
+from src.infrastructure.repositories.game_repository_impl import GameRepositoryImpl
+from src.infrastructure.repositories.game_stats_repository_impl import GameStatsRepositoryImpl
+from src.domain.entities.game import Game
+from src.domain.value_objects.player import Player
+from src.domain.value_objects.position import Position
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+@pytest.fixture
+def archiver(session_factory):
+    return GameArchiver(session_factory, finished_max_age=timedelta(hours=1),
+                        abandoned_ttl=timedelta(days=1), batch_size=2)
+
+def finished_game(game_id):
+    game = Game(game_id)
+    for x, y in [(1, 1), (1, 2), (2, 1), (2, 2), (3, 1)]:
+        game.play_move(Position(x, y))
+    return game
+
+def store(session_factory, game, age):
+    db = session_factory()
+    GameRepositoryImpl(db).add(game, insert_missing=True)
+    db.query(GameModel).filter(GameModel.game_id == game.game_id).update({"updated_at": utcnow() - age})
+    db.commit()
+    db.close()
+
+def test_archives_old_finished_games_in_batches(archiver, session_factory):
+    for i in range(3):
+        store(session_factory, finished_game(f"old{i}"), timedelta(hours=2))
+    store(session_factory, finished_game("recent"), timedelta(minutes=1))
+
+    assert archiver.run_once() == (3, 0)
+
+    db = session_factory()
+    assert db.query(GameModel).count() == 1
+    assert db.query(ArchivedGameModel).count() == 3
+
+    game = GameRepositoryImpl(db).get("old0")
+    assert game.is_finished and game.winner == Player.X
+    assert game.board.grid[0] == [Player.X, Player.X, Player.X]
+    assert game.first_move == Position(1, 1)
+
+def test_purges_abandoned_games(archiver, session_factory):
+    GameStatsRepositoryImpl(session_factory()).ensure_initialized()
+    store(session_factory, Game("abandoned"), timedelta(days=2))
+    store(session_factory, Game("waiting"), timedelta(hours=2))
+
+    assert archiver.run_once() == (0, 1)
+
+    db = session_factory()
+    repo = GameRepositoryImpl(db)
+    assert repo.get("abandoned") is None
+    assert repo.get("waiting") is not None
+    assert GameStatsRepositoryImpl(db).get().abandoned_games == 1
+
+def test_stale_move_does_not_bring_back_a_purged_game(archiver, session_factory):
+    GameStatsRepositoryImpl(session_factory()).ensure_initialized()
+    store(session_factory, Game("abandoned"), timedelta(days=2))
+    db = session_factory()
+    repo = GameRepositoryImpl(db)
+    read_before_purge = [repo.get("abandoned")]
+    db.commit()
+
+    assert archiver.run_once() == (0, 1)
+    get = repo.get
+    repo.get = lambda game_id: read_before_purge.pop() if read_before_purge else get(game_id)
+    result = GameService(repo).play_move("abandoned", "X", 1, 1)
+
+    assert result.error == "Game not found"
+    assert GameRepositoryImpl(session_factory()).get("abandoned") is None
+
+def test_start_and_stop(archiver):
+    archiver.interval_seconds = 0.01
+    archiver.start()
+    archiver.stop()
+    assert archiver._thread is None
+
+def test_purges_expired_idempotency_keys(archiver, session_factory):
+    db = session_factory()
+    for key, age in [("old1", timedelta(days=2)), ("old2", timedelta(days=3)), ("old3", timedelta(days=2)),
+                     ("recent", timedelta(hours=1))]:
+        db.add(IdempotencyKeyModel(game_id="g1", key=key, move="X1,1", message="ok", version=1,
+                                   created_at=utcnow() - age))
+    db.commit()
+
+    archiver.run_once()
+    assert [row.key for row in db.query(IdempotencyKeyModel)] == ["recent"]
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from src.infrastructure.repositories.game_repository_impl import GameRepositoryImpl
+from src.infrastructure.repositories.single_flight import SingleFlight
 from src.domain.entities.game import Game
 from src.domain.value_objects.player import Player
 
@@ -70,3 +71,45 @@ def test_to_db_model_and_from_db_model(repo, game):
     new_game = repo._from_db_model(db_model)
     assert new_game.game_id == game.game_id
     assert new_game.board.grid[0][0] == game.board.grid[0][0]
+
+def test_get_falls_back_to_archive(repo):
+    archived = MagicMock(game_id="old", state="XXXOO-----", winner="X", first_move="1,1")
+    repo.db.query().filter().first.side_effect = [None, archived]
+    result = repo.get("old")
+    assert result.is_finished is True
+    assert result.winner == Player.X
+    assert result.board.grid[0] == [Player.X, Player.X, Player.X]
+    assert result.next_player is None
+
+def test_get_for_read_with_single_flight_returns_independent_games(db_session, game):
+    flight = SingleFlight()
+    repo = GameRepositoryImpl(db_session, single_flight=flight)
+    db_session.query().filter().first.return_value = repo._to_db_model(game)
+    first = repo.get_for_read("game123")
+    second = repo.get_for_read("game123")
+    assert first is not second
+    assert first.board.grid[0][0] == Player.X
+    assert first.next_player == Player.O
+
+def test_get_never_shares_an_in_flight_query(db_session, game):
+    flight = MagicMock()
+    repo = GameRepositoryImpl(db_session, single_flight=flight)
+    db_session.query().filter().first.return_value = repo._to_db_model(game)
+    assert repo.get("game123").version == game.version
+    flight.do.assert_not_called()
+
+def test_shared_read_older_than_min_version_is_queried_again(db_session, game):
+    flight = MagicMock()
+    repo = GameRepositoryImpl(db_session, single_flight=flight)
+    game.version = 3
+    stale = repo._snapshot(repo._to_db_model(Game("game123")))
+    flight.do.return_value = (stale, True)
+    db_session.query().filter().first.return_value = repo._to_db_model(game)
+    assert repo.get_for_read("game123", min_version=3).version == 3
+
+def test_add_many_inserts_new_games_and_merges_existing(repo, db_session):
+    db_session.query().filter().all.return_value = [("existing",)]
+    repo.add_many([Game("existing"), Game("new")])
+    assert db_session.merge.call_args.args[0].game_id == "existing"
+    assert db_session.add.call_args.args[0].game_id == "new"
+    db_session.commit.assert_called_once()
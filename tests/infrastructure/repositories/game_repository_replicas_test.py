@@ -0,0 +1,101 @@
+import time
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.db.models import Base
+from src.infrastructure.db.replicas import ReplicaPool
+from src.infrastructure.repositories.game_repository_impl import GameRepositoryImpl
+from src.infrastructure.repositories.single_flight import SingleFlight
+from src.domain.entities.game import Game
+from src.domain.value_objects.position import Position
+
+
+def sqlite_engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return engine
+
+@pytest.fixture
+def primary():
+    return sessionmaker(bind=sqlite_engine())()
+
+@pytest.fixture
+def replica_engines():
+    return [sqlite_engine(), sqlite_engine()]
+
+@pytest.fixture
+def pool(replica_engines):
+    return ReplicaPool(replica_engines, cooldown_seconds=60)
+
+@pytest.fixture
+def repo(primary, pool):
+    return GameRepositoryImpl(primary, replicas=pool)
+
+def replicate(engine, game):
+    """Simulate replication by writing the game into a replica stand-in."""
+    session = sessionmaker(bind=engine)()
+    GameRepositoryImpl(session).add(game, insert_missing=True)
+    session.close()
+
+def test_reads_round_robin_over_replicas(repo, replica_engines):
+    game = Game("g1")
+    replicate(replica_engines[0], game)
+    game.play_move(Position(1, 1))
+    replicate(replica_engines[1], game)
+
+    versions = {repo.get_for_read("g1").version for _ in range(2)}
+    assert versions == {0, 1}
+
+def test_stale_replica_falls_back_to_primary(repo, replica_engines):
+    game = Game("g1")
+    for engine in replica_engines:
+        replicate(engine, game)
+    game.play_move(Position(1, 1))
+    repo.add(game, insert_missing=True)
+
+    assert repo.get_for_read("g1").version == 0
+    assert repo.get_for_read("g1", min_version=1).version == 1
+
+def test_missing_on_replica_falls_back_to_primary(repo):
+    repo.add(Game("g1"))
+    assert repo.get_for_read("g1") is not None
+
+def test_failing_replica_is_marked_unhealthy(repo, pool, replica_engines):
+    repo.add(Game("g1"))
+    Base.metadata.drop_all(replica_engines[0])
+    Base.metadata.drop_all(replica_engines[1])
+
+    assert repo.get_for_read("g1") is not None
+    assert repo.get_for_read("g1") is not None
+    assert pool.choose() is None
+
+    assert pool.check_health() == 2
+    assert pool.choose() is not None
+
+def test_replica_reads_work_with_single_flight(primary, pool, replica_engines):
+    repo = GameRepositoryImpl(primary, single_flight=SingleFlight(), replicas=pool)
+    for engine in replica_engines:
+        replicate(engine, Game("g1"))
+    assert repo.get_for_read("g1", min_version=0).game_id == "g1"
+
+def test_without_replicas_reads_primary(primary):
+    repo = GameRepositoryImpl(primary)
+    repo.add(Game("g1"))
+    assert repo.get_for_read("g1").game_id == "g1"
+
+def test_background_health_checks_recover_replicas(replica_engines):
+    pool = ReplicaPool(replica_engines, cooldown_seconds=60, health_check_seconds=0.01)
+    for engine in replica_engines:
+        pool.mark_failed(engine)
+    assert pool.choose() is None
+
+    pool.start()
+    try:
+        deadline = time.monotonic() + 2
+        while pool.choose() is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        pool.stop()
+    assert pool.choose() is not None
@@ -0,0 +1,89 @@
+import subprocess
+import sys
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.db.models import Base, GameStatsModel
+from src.infrastructure.repositories.game_repository_impl import GameRepositoryImpl
+from src.infrastructure.repositories.game_stats_repository_impl import GameStatsRepositoryImpl, STATS_STRIPES
+from src.domain.entities.game import Game
+from src.domain.value_objects.position import Position
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+@pytest.fixture
+def stats_repo(db_session):
+    repo = GameStatsRepositoryImpl(db_session)
+    repo.ensure_initialized()
+    return repo
+
+def play(game, moves):
+    for x, y in moves:
+        game.play_move(Position(x, y))
+    return game
+
+def test_counters_start_at_zero(stats_repo):
+    stats = stats_repo.get()
+    assert stats.total_games == 0
+    assert len(stats.openings) == 9
+
+def test_record_and_get(stats_repo, db_session):
+    won = play(Game("won"), [(2, 2), (1, 1), (1, 2), (3, 3), (3, 2)])
+    stats_repo.record_game_created(won)
+    stats_repo.record_game_created(Game("new"))
+    stats_repo.record_game_finished(won)
+    db_session.commit()
+    stats = stats_repo.get()
+    assert stats.total_games == 2
+    assert stats.finished_games == 1
+    assert stats.x_wins == 1
+    assert stats.active_games == 1
+    center = next(o for o in stats.openings if o.square == "2,2")
+    assert center.finished_games == 1 and center.x_wins == 1
+
+def test_record_creates_missing_row(db_session):
+    repo = GameStatsRepositoryImpl(db_session)
+    repo.record_game_finished(play(Game("draw"), [(1, 1), (1, 2), (1, 3), (2, 1), (2, 3), (2, 2), (3, 2), (3, 3), (3, 1)]))
+    db_session.commit()
+    stats = repo.get()
+    assert stats.draws == 1
+    assert stats.openings[0].draws == 1
+
+def test_rebuild_matches_games(stats_repo, db_session):
+    games_repo = GameRepositoryImpl(db_session)
+    games_repo.add(play(Game("win"), [(2, 2), (1, 1), (1, 2), (3, 3), (3, 2)]), insert_missing=True)
+    games_repo.add(play(Game("draw"), [(1, 1), (1, 2), (1, 3), (2, 1), (2, 3), (2, 2), (3, 2), (3, 3), (3, 1)]), insert_missing=True)
+    games_repo.add(play(Game("active"), [(1, 1)]), insert_missing=True)
+
+    stats = stats_repo.rebuild()
+    assert (stats.total_games, stats.finished_games, stats.x_wins, stats.draws) == (3, 2, 1, 1)
+
+    stored = stats_repo.get()
+    assert stored.active_games == 1
+    openings = {o.square: o for o in stored.openings}
+    assert openings["2,2"].x_wins == 1
+    assert openings["1,1"].draws == 1
+
+def test_global_counters_are_striped_and_summed(stats_repo, db_session):
+    for i in range(40):
+        stats_repo.record_game_created(Game(f"game-{i}"))
+    stats_repo.record_games_abandoned(3)
+    db_session.commit()
+
+    rows = db_session.query(GameStatsModel).all()
+    assert len(rows) == STATS_STRIPES
+    assert sum(1 for row in rows if row.total_games) > 1
+    assert (stats_repo.get().total_games, stats_repo.get().abandoned_games) == (40, 3)
+
+def test_import_does_not_load_the_postgresql_dialect():
+    code = ("import sys, src.infrastructure.repositories.game_stats_repository_impl; "
+            "print('sqlalchemy.dialects.postgresql' in sys.modules)")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
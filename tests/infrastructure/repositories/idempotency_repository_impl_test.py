@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.game_service import GameService
+from src.domain.entities.idempotent_move import IdempotentMove
+from src.infrastructure.db.models import Base, IdempotencyKeyModel
+from src.infrastructure.repositories.game_repository_impl import GameRepositoryImpl
+from src.infrastructure.repositories.idempotency_repository_impl import IdempotencyRepositoryImpl
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+def test_round_trip(session_factory):
+    move = IdempotentMove("g1", "k1", "O", 3, 2, "Player O has won!", 6)
+    db = session_factory()
+    IdempotencyRepositoryImpl(db).add(move)
+    db.commit()
+    assert IdempotencyRepositoryImpl(session_factory()).get("g1", "k1") == move
+    assert IdempotencyRepositoryImpl(session_factory()).get("g1", "k2") is None
+
+def test_list_for_game(session_factory):
+    moves = [IdempotentMove("g1", "k1", "X", 1, 1, "ok", 1), IdempotentMove("g1", "k2", "O", 2, 2, "ok", 2),
+             IdempotentMove("g2", "k1", "X", 3, 3, "ok", 1)]
+    db = session_factory()
+    for move in moves:
+        IdempotencyRepositoryImpl(db).add(move)
+    db.commit()
+    assert sorted(IdempotencyRepositoryImpl(session_factory()).list_for_game("g1"), key=lambda m: m.key) == moves[:2]
+
+def test_key_is_committed_with_the_move(session_factory):
+    db = session_factory()
+    service = GameService(GameRepositoryImpl(db), idempotency_repo=IdempotencyRepositoryImpl(db))
+    game_id = service.create_game()
+    first = service.play_move(game_id, "X", 1, 1, idempotency_key="k1")
+
+    retry_db = session_factory()
+    repo = GameRepositoryImpl(retry_db)
+    retry = GameService(repo, idempotency_repo=IdempotencyRepositoryImpl(retry_db))
+    repo.get = None  # A replay must not read the game
+    result = retry.play_move(game_id, "X", 1, 1, idempotency_key="k1")
+
+    assert (result.message, result.version, result.replayed) == (first.message, 1, True)
+    assert retry_db.query(IdempotencyKeyModel).count() == 1
+
+def test_concurrent_retry_losing_the_race_replays_the_winner(session_factory):
+    db = session_factory()
+    service = GameService(GameRepositoryImpl(db), idempotency_repo=IdempotencyRepositoryImpl(db))
+    game_id = service.create_game()
+
+    # The retry looks the key up and reads the game before the first request commits
+    retry_db = session_factory()
+    keys, games = IdempotencyRepositoryImpl(retry_db), GameRepositoryImpl(retry_db)
+    lookups, snapshot = [None], games.get(game_id)
+    real_get = keys.get
+    keys.get = lambda game_id, key: lookups.pop() if lookups else real_get(game_id, key)
+    games.get = lambda game_id: snapshot
+    retry = GameService(games, idempotency_repo=keys)
+
+    first = service.play_move(game_id, "X", 1, 1, idempotency_key="k1")
+    result = retry.play_move(game_id, "X", 1, 1, idempotency_key="k1")
+
+    assert (result.success, result.message, result.version, result.replayed) == (True, first.message, 1, True)
+    assert session_factory().query(IdempotencyKeyModel).count() == 1
@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.db.models import Base, GameModel
+from src.infrastructure.db.sharding import ConsistentHashRing, ShardSessions
+from src.infrastructure.repositories.sharded_game_repository import ShardedGameRepository
+from src.infrastructure.repositories.sharded_game_stats_repository import ShardedGameStatsRepository
+from src.infrastructure.repositories.game_stats_repository_impl import GameStatsRepositoryImpl
+from src.application.game_service import GameService
+
+SHARDS = ["shard-a", "shard-b", "shard-c"]
+
+@pytest.fixture
+def factories():
+    result = {}
+    for shard in SHARDS:
+        engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        Base.metadata.create_all(engine)
+        result[shard] = sessionmaker(bind=engine)
+        GameStatsRepositoryImpl(result[shard]()).ensure_initialized()
+    return result
+
+@pytest.fixture
+def shards(factories):
+    sessions = ShardSessions(ConsistentHashRing(SHARDS), factories, ThreadPoolExecutor(4))
+    yield sessions
+    sessions.close()
+
+@pytest.fixture
+def service(shards):
+    return GameService(ShardedGameRepository(shards), ShardedGameStatsRepository(shards))
+
+def test_games_are_stored_on_their_shard(service, shards, factories):
+    game_ids = [service.create_game() for _ in range(12)]
+    for game_id in game_ids:
+        owner = shards.ring.shard_for(game_id)
+        for shard, factory in factories.items():
+            stored = factory().get(GameModel, game_id) is not None
+            assert stored == (shard == owner)
+
+def test_single_game_flow(service):
+    game_id = service.create_game()
+    assert service.play_move(game_id, "X", 1, 1).success
+    assert service.get_status(game_id).board[0][0] == "X"
+
+def test_batch_status_gathers_across_shards(service):
+    game_ids = [service.create_game() for _ in range(10)]
+    statuses = service.get_statuses(game_ids + ["unknown"])
+    assert [s.game_id for s in statuses] == game_ids
+
+def test_listing_merges_shards_in_order(service):
+    game_ids = sorted(service.create_game() for _ in range(10))
+    assert service.list_games(limit=4) == game_ids[:4]
+    assert service.list_games(limit=4, after=game_ids[3]) == game_ids[4:8]
+
+def test_stats_sum_all_shards(service):
+    for _ in range(6):
+        service.create_game()
+    stats = service.get_stats()
+    assert stats.total_games == 6
+    assert len(stats.first_move_win_rates) == 9
+
+def test_abandoned_games_are_counted_once_across_shards(shards):
+    stats_repo = ShardedGameStatsRepository(shards)
+    stats_repo.record_games_abandoned(4)
+    shards.session(SHARDS[0]).commit()
+    assert stats_repo.get().abandoned_games == 4
+
+def test_move_during_rebalance_writes_the_game_to_its_new_shard(factories):
+    before = ShardSessions(ConsistentHashRing(SHARDS[:2]), factories, ThreadPoolExecutor(2))
+    game_ids = [GameService(ShardedGameRepository(before)).create_game() for _ in range(40)]
+    before.close()
+    after = ShardSessions(ConsistentHashRing(SHARDS), factories, ThreadPoolExecutor(4),
+                          previous_ring=ConsistentHashRing(SHARDS[:2]))
+    moved = next(game_id for game_id in game_ids if after.previous_shard_for(game_id) is not None)
+
+    assert GameService(ShardedGameRepository(after)).play_move(moved, "X", 1, 1).success
+    assert factories["shard-c"]().get(GameModel, moved).version == 1
+    after.close()
@@ -0,0 +1,46 @@
+import threading
+import time
+import pytest
+from src.infrastructure.repositories.single_flight import SingleFlight
+
+@pytest.fixture
+def flight():
+    return SingleFlight()
+
+def test_concurrent_threads_share_one_call(flight):
+    calls = []
+    started, release = threading.Event(), threading.Event()
+    results = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(1)
+        return "game"
+
+    def worker():
+        results.append(flight.do("g1", fetch))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    started.wait(1)
+    time.sleep(0.05)  # Let the other threads join the in-flight call
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+    assert {value for value, _ in results} == {"game"}
+
+def test_sequential_calls_are_not_cached(flight):
+    assert flight.do("g1", lambda: 1) == (1, False)
+    assert flight.do("g1", lambda: 2) == (2, False)
+
+def test_errors_propagate_and_clear(flight):
+    def fail():
+        raise RuntimeError("boom")
+    with pytest.raises(RuntimeError):
+        flight.do("g1", fail)
+    assert flight.do("g1", lambda: "ok") == ("ok", False)
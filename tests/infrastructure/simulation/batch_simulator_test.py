@@ -0,0 +1,77 @@
+import itertools
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.domain.entities.board import Board
+from src.domain.entities.game import Game
+from src.domain.value_objects.player import Player
+from src.domain.value_objects.position import Position
+from src.infrastructure.simulation.batch_simulator import (
+    BatchSimulator, greedy_policy, winners_mask, to_games, write_jsonl, write_to_repository, X, O
+)
+
+PLAYERS = (None, Player.X, Player.O)
+
+
+def test_winner_mask_matches_board_check_winner_on_every_board():
+    boards = np.array(list(itertools.product((0, 1, 2), repeat=9)), dtype=np.int8)
+    for code in (X, O):
+        mask = winners_mask(boards, code)
+        for cells, won in zip(boards.tolist(), mask):
+            board = Board()
+            board.grid = [[PLAYERS[cell] for cell in cells[row:row + 3]] for row in (0, 3, 6)]
+            assert board.check_winner(PLAYERS[code]) == won
+
+@pytest.mark.parametrize("policy", ["random", "greedy"])
+def test_simulated_games_replay_identically_through_game(policy):
+    kwargs = {"policy_x": greedy_policy, "policy_o": greedy_policy} if policy == "greedy" else {}
+    result = BatchSimulator(seed=7, chunk_size=300, **kwargs).simulate(1000)
+    assert len(result) == 1000
+
+    for i, simulated in enumerate(to_games(result)):
+        game = Game("replay")
+        for cell in result.moves[i][:result.move_counts[i]].tolist():
+            game.play_move(Position(cell % 3 + 1, cell // 3 + 1))
+        assert game.is_finished
+        assert game.board.grid == simulated.board.grid
+        assert game.winner == simulated.winner
+        assert game.version == simulated.version
+        assert game.next_player == simulated.next_player
+        assert game.first_move == simulated.first_move
+
+def test_seeded_simulations_are_reproducible():
+    first = BatchSimulator(seed=1).simulate(100)
+    second = BatchSimulator(seed=1).simulate(100)
+    assert (first.moves == second.moves).all()
+
+def test_forced_opening_and_summary():
+    result = BatchSimulator(seed=3).simulate(500, opening=4)
+    summary = result.opening_summary()
+    center = summary["2,2"]
+    assert center["games"] == 500
+    assert center["x_wins"] + center["o_wins"] + center["draws"] == 500
+    assert all(stats["games"] == 0 for square, stats in summary.items() if square != "2,2")
+
+def test_greedy_policy_completes_its_own_line_first():
+    # Both players have two in a row: each completes its own line rather than blocking
+    boards = np.array([[1, 1, 0, 2, 2, 0, 0, 0, 0]], dtype=np.int8)
+    assert greedy_policy(boards, X, np.random.default_rng(0)).tolist() == [2]
+    assert greedy_policy(boards, O, np.random.default_rng(0)).tolist() == [5]
+
+def test_write_jsonl(tmp_path):
+    result = BatchSimulator(seed=5).simulate(10)
+    path = tmp_path / "games.jsonl"
+    write_jsonl(result, str(path))
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(rows) == 10
+    assert all(row["is_finished"] and 5 <= row["version"] <= 9 for row in rows)
+
+def test_write_to_repository_in_batches():
+    repo = MagicMock()
+    result = BatchSimulator(seed=5).simulate(25)
+    assert write_to_repository(result, repo, batch_size=10) == 25
+    assert [len(call.args[0]) for call in repo.add_many.call_args_list] == [10, 10, 5]
@@ -0,0 +1,138 @@
+import json
+import logging
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.logging.logger import RequestIdFilter
+from src.infrastructure.tracing.exporters import RingBufferExporter, FileSpanExporter
+from src.infrastructure.tracing.middleware import TracingMiddleware
+from src.infrastructure.tracing.processor import BatchSpanProcessor
+from src.infrastructure.tracing.spans import span, traced, set_span_processor, request_id_var
+
+
+class CollectingProcessor:
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, span):
+        self.spans.append(span)
+
+@pytest.fixture
+def processor():
+    processor = CollectingProcessor()
+    set_span_processor(processor)
+    yield processor
+    set_span_processor(None)
+
+def by_name(spans):
+    return {s.name: s for s in spans}
+
+def test_spans_are_no_ops_when_tracing_is_disabled():
+    with span("anything") as current:
+        assert current is None
+
+def test_nested_spans_record_parent_and_errors(processor):
+    @traced("inner")
+    def inner():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        with span("outer", game_id="g1"):
+            inner()
+
+    spans = by_name(processor.spans)
+    assert spans["inner"].parent_id == spans["outer"].span_id
+    assert spans["outer"].parent_id is None
+    assert spans["outer"].attributes == {"game_id": "g1"}
+    assert spans["inner"].error == "ValueError: boom"
+    assert spans["outer"].duration_ns >= spans["inner"].duration_ns
+
+def test_middleware_traces_request_through_threadpool(processor):
+    app = FastAPI()
+
+    @traced("service.work")
+    def work():
+        return request_id_var.get()
+
+    @app.get("/work")
+    @traced("router.work", endpoint=True)
+    def endpoint():
+        return {"request_id": work()}
+
+    app.add_middleware(TracingMiddleware)
+    response = TestClient(app).get("/work", headers={"X-Request-ID": "req-1"})
+
+    assert response.headers["X-Request-ID"] == "req-1"
+    assert response.json() == {"request_id": "req-1"}
+    spans = by_name(processor.spans)
+    assert set(spans) == {"http.request", "request.parse", "router.work", "service.work"}
+    assert all(s.request_id == "req-1" for s in processor.spans)
+    root = spans["http.request"]
+    assert root.attributes == {"method": "GET", "path": "/work", "status_code": 200}
+    assert spans["request.parse"].parent_id == root.span_id
+    assert spans["router.work"].parent_id == root.span_id
+    assert spans["service.work"].parent_id == spans["router.work"].span_id
+
+def test_middleware_generates_request_id(processor):
+    app = FastAPI()
+    app.get("/")(lambda: {})
+    app.add_middleware(TracingMiddleware)
+    response = TestClient(app).get("/")
+    assert len(response.headers["X-Request-ID"]) == 32
+
+def test_request_id_is_added_to_log_records():
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "message", None, None)
+    token = request_id_var.set("req-2")
+    try:
+        RequestIdFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+    assert record.request_id == "req-2"
+
+def test_batch_processor_exports_in_background_and_flushes_on_shutdown(processor):
+    exporter = RingBufferExporter(capacity=3)
+    batch_processor = BatchSpanProcessor(exporter, schedule_delay_seconds=0.01)
+    set_span_processor(batch_processor)
+    for i in range(5):
+        with span(f"s{i}"):
+            pass
+    batch_processor.shutdown()
+    assert [s.name for s in exporter.spans()] == ["s2", "s3", "s4"]
+
+def test_batch_processor_drops_spans_when_queue_is_full():
+    release = threading.Event()
+
+    class SlowExporter(RingBufferExporter):
+        def export(self, spans):
+            release.wait()
+            super().export(spans)
+
+    exporter = SlowExporter()
+    batch_processor = BatchSpanProcessor(exporter, max_queue_size=2, max_batch_size=1)
+    set_span_processor(batch_processor)
+    try:
+        for i in range(10):
+            with span(f"s{i}"):
+                pass
+    finally:
+        set_span_processor(None)
+        release.set()
+        batch_processor.shutdown()
+    assert batch_processor.dropped > 0
+    assert len(exporter.spans()) + batch_processor.dropped == 10
+
+def test_file_exporter_writes_json_lines(processor, tmp_path):
+    path = tmp_path / "spans.jsonl"
+    exporter = FileSpanExporter(str(path))
+    with span("saved", game_id="g1"):
+        pass
+    exporter.export(processor.spans)
+    exporter.shutdown()
+    [line] = path.read_text().splitlines()
+    data = json.loads(line)
+    assert data["name"] == "saved"
+    assert data["attributes"] == {"game_id": "g1"}
+    assert data["duration_ms"] >= 0